@@ -161,6 +161,21 @@ class CommentaryEngine:
         EventType.LEG_BYE: ["Leg bye."],
     }
 
+    # Event type -> persona emotion_range key
+    EVENT_EMOTIONS: ClassVar[dict[EventType, str]] = {
+        EventType.WICKET: "wicket",
+        EventType.BOUNDARY_FOUR: "boundary_four",
+        EventType.BOUNDARY_SIX: "boundary_six",
+        EventType.DOT_BALL: "dot_ball",
+        EventType.SINGLE: "single",
+        EventType.DOUBLE: "single",  # Same as single
+        EventType.TRIPLE: "single",
+        EventType.WIDE: "dot_ball",
+        EventType.NO_BALL: "dot_ball",
+        EventType.BYE: "single",
+        EventType.LEG_BYE: "single",
+    }
+
     def __init__(
         self,
         default_language: str = "en",
@@ -353,20 +368,7 @@ class CommentaryEngine:
 
     def _event_to_emotion(self, event: CricketEvent) -> str:
         """Map event type to emotion key for persona lookup."""
-        mapping: dict[EventType, str] = {
-            EventType.WICKET: "wicket",
-            EventType.BOUNDARY_FOUR: "boundary_four",
-            EventType.BOUNDARY_SIX: "boundary_six",
-            EventType.DOT_BALL: "dot_ball",
-            EventType.SINGLE: "single",
-            EventType.DOUBLE: "single",  # Same as single
-            EventType.TRIPLE: "single",
-            EventType.WIDE: "dot_ball",
-            EventType.NO_BALL: "dot_ball",
-            EventType.BYE: "single",
-            EventType.LEG_BYE: "single",
-        }
-        return mapping.get(event.event_type, "neutral")
+        return self.EVENT_EMOTIONS.get(event.event_type, "neutral")
 
     def _get_template_commentary(self, event: CricketEvent, persona: Persona) -> str:
         """Get template-based commentary based on minimalism score."""
@@ -382,6 +384,9 @@ class CommentaryEngine:
         """Format a template with event data."""
         if not template:
             return ""
+        if "{" not in template:
+            # Placeholder-free (e.g. minimal "Gone.") - return the constant as-is
+            return template
 
         wicket_type = event.wicket_type or "dismissed"
 
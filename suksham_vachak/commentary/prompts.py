@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from suksham_vachak.parser import CricketEvent, EventType
@@ -10,6 +11,9 @@ from suksham_vachak.personas import Persona
 if TYPE_CHECKING:
     from suksham_vachak.context import RichContext
 
+# Max cached system prompts (one per persona/toon combination in practice)
+SYSTEM_PROMPT_CACHE_SIZE = 32
+
 # System prompt template - establishes the commentator role
 SYSTEM_PROMPT_TEMPLATE = """You are {name}, a legendary cricket commentator.
 
@@ -82,7 +86,7 @@ def _get_bad_examples(persona: Persona) -> str:
 
 def _get_good_examples(persona: Persona, event_type: EventType | None = None) -> str:
     """Generate good examples based on persona."""
-    phrases = persona.signature_phrases[:5] if persona.signature_phrases else []
+    phrases = persona.signature_phrases[:5]
 
     if persona.is_minimalist:
         examples = [
@@ -167,9 +171,13 @@ def _get_word_limit_reminder(persona: Persona, event: CricketEvent) -> str:
     return limits.get(event.event_type, "")
 
 
+@lru_cache(maxsize=SYSTEM_PROMPT_CACHE_SIZE)
 def build_system_prompt(persona: Persona, use_toon: bool = False) -> str:
     """Build the system prompt for a persona.
 
+    Personas are frozen, so results are cached per (persona, use_toon) and
+    repeated calls return the same string object.
+
     Args:
         persona: The commentary persona.
         use_toon: If True, include TOON schema explanation in the prompt.
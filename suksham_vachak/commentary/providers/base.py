@@ -13,6 +13,8 @@ class LLMResponse:
     input_tokens: int
     output_tokens: int
     provider: str = "unknown"
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
 
     @property
     def total_tokens(self) -> int:
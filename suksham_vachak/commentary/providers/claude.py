@@ -3,7 +3,9 @@
 import os
 from enum import Enum
 
+import httpx
 from anthropic import Anthropic
+from anthropic.types import TextBlockParam
 
 from suksham_vachak.logging import get_logger
 
@@ -25,6 +27,16 @@ class ClaudeModel(Enum):
     OPUS = "claude-opus-4-20250514"
 
 
+def cached_system_prompt(system_prompt: str) -> list[TextBlockParam]:
+    """Wrap a system prompt as a prompt-cacheable content block.
+
+    Persona system prompts are identical across calls, so marking them
+    ephemeral lets the API reuse the prefix and bill only the event prompt.
+    Prompts below the model's minimum cacheable length are sent uncached.
+    """
+    return [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+
+
 class ClaudeProvider(BaseLLMProvider):
     """Claude API provider via Anthropic SDK.
 
@@ -36,12 +48,15 @@ class ClaudeProvider(BaseLLMProvider):
         self,
         api_key: str | None = None,
         model: ClaudeModel = ClaudeModel.HAIKU,
+        http_client: httpx.Client | None = None,
     ) -> None:
         """Initialize the Claude provider.
 
         Args:
             api_key: Anthropic API key. If not provided, reads from ANTHROPIC_API_KEY env var.
             model: Claude model to use. Defaults to Haiku for speed/cost.
+            http_client: Optional shared httpx client, so several providers can reuse
+                one keep-alive connection pool. The caller owns and closes it.
         """
         self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
         if not self.api_key:
@@ -49,7 +64,7 @@ class ClaudeProvider(BaseLLMProvider):
             raise ValueError(msg)
 
         self.model = model
-        self.client = Anthropic(api_key=self.api_key)
+        self.client = Anthropic(api_key=self.api_key, http_client=http_client)
         logger.info("Initialized Claude provider", model=model.value)
 
     @property
@@ -81,7 +96,7 @@ class ClaudeProvider(BaseLLMProvider):
         message = self.client.messages.create(
             model=self.model.value,
             max_tokens=max_tokens,
-            system=system_prompt,
+            system=cached_system_prompt(system_prompt),
             messages=[
                 {"role": "user", "content": user_prompt},
             ],
@@ -100,6 +115,8 @@ class ClaudeProvider(BaseLLMProvider):
             input_tokens=message.usage.input_tokens,
             output_tokens=message.usage.output_tokens,
             provider=self.provider_name,
+            cache_creation_input_tokens=message.usage.cache_creation_input_tokens or 0,
+            cache_read_input_tokens=message.usage.cache_read_input_tokens or 0,
         )
 
     def set_model(self, model: ClaudeModel) -> None:
@@ -297,8 +297,22 @@ class RichContext:
     suggested_length: str = "medium"  # short, medium, long
     avoid_phrases: list[str] = field(default_factory=list)  # Don't repeat these
 
-    def to_prompt_context(self) -> str:  # noqa: C901
-        """Convert full context to text for LLM prompt."""
+    # Renderings, filled on the first to_toon() / to_prompt_context() call
+    _toon: str | None = field(default=None, init=False, repr=False, compare=False)
+    _prompt_context: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    def to_prompt_context(self) -> str:
+        """Convert full context to text for LLM prompt.
+
+        Like to_toon(), the text is built once and reused, so the context
+        must not be modified after the first call.
+        """
+        if self._prompt_context is None:
+            self._prompt_context = self._build_prompt_context()
+        return self._prompt_context
+
+    def _build_prompt_context(self) -> str:  # noqa: C901
+        """Render the full context as sectioned plain text."""
         sections = []
 
         # Match situation
@@ -369,14 +383,18 @@ class RichContext:
     def to_toon(self) -> str:
         """Serialize to TOON format for token-efficient LLM prompts.
 
-        Returns ~50% fewer tokens than to_prompt_context().
+        Returns ~50% fewer tokens than to_prompt_context(). The encoding is
+        computed once and reused, so the context must not be modified after
+        the first call (the builder creates a new one per delivery).
 
         Returns:
             TOON-formatted string optimized for LLM consumption.
         """
-        from suksham_vachak.serialization import encode_rich_context
+        if self._toon is None:
+            from suksham_vachak.serialization import encode_rich_context
 
-        return encode_rich_context(self)
+            self._toon = encode_rich_context(self)
+        return self._toon
 
     def _describe_event(self) -> str:
         """Brief description of the current event."""
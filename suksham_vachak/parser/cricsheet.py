@@ -1,6 +1,5 @@
 """Parser for Cricsheet JSON match data."""
 
-import json
 import uuid
 from collections.abc import Iterator
 from pathlib import Path
@@ -10,6 +9,11 @@ from suksham_vachak.logging import get_logger
 
 from .events import CricketEvent, EventType, MatchContext, MatchFormat, MatchInfo
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    from json import loads as _json_loads
+
 logger = get_logger(__name__)
 
 
@@ -114,8 +118,7 @@ class CricsheetParser:
         """Load and cache the JSON data."""
         data = self._data
         if data is None:
-            with open(self.file_path) as f:
-                data = json.load(f)
+            data = _json_loads(self.file_path.read_bytes())
             self._data = data
         return data
 
@@ -14,22 +14,24 @@ class CommentaryStyle(Enum):
     TECHNICAL = "technical"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Persona:
     """A commentary persona with distinct style and voice.
 
     The minimalism_score is key: 0.0 = verbose paragraphs, 1.0 = "Gone."
     This controls how much the persona says - higher scores mean fewer words.
+
+    Personas are immutable and hashable, so they can key prompt caches directly.
     """
 
     name: str
     style: CommentaryStyle
-    vocabulary: list[str] = field(default_factory=lambda: [])
+    vocabulary: tuple[str, ...] = ()
     cultural_context: str = ""
-    emotion_range: dict[str, str] = field(default_factory=lambda: {})
-    signature_phrases: list[str] = field(default_factory=lambda: [])
+    emotion_range: dict[str, str] = field(default_factory=lambda: {}, hash=False)
+    signature_phrases: tuple[str, ...] = ()
     minimalism_score: float = 0.5  # 0.0 = verbose, 1.0 = "Gone."
-    languages: list[str] = field(default_factory=lambda: ["en"])
+    languages: tuple[str, ...] = ("en",)
 
     # TTS configuration (for future use)
     voice_id: str | None = None
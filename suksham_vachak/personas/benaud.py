@@ -2,13 +2,16 @@
 
 from .base import CommentaryStyle, Persona
 
+# The wicket call itself; template-mode Benaud returns this exact object
+BENAUD_WICKET = "Gone."
+
 # Richie Benaud: The gold standard for cricket commentary
 # Known for: Elegant simplicity, perfect timing, letting the game breathe
 # Famous for: "Gone." (not "The batsman has been dismissed by an excellent delivery")
 BENAUD = Persona(
     name="Richie Benaud",
     style=CommentaryStyle.MINIMALIST,
-    vocabulary=[
+    vocabulary=(
         "marvellous",
         "extraordinary",
         "tremendous",
@@ -16,10 +19,10 @@ BENAUD = Persona(
         "magnificent",
         "classical",
         "elegant",
-    ],
+    ),
     cultural_context="Australian cricket wisdom, decades of experience as player and commentator",
     emotion_range={
-        "wicket": "Gone.",
+        "wicket": BENAUD_WICKET,
         "boundary_four": "Four.",
         "boundary_six": "Magnificent.",
         "dot_ball": "",  # Silence is golden
@@ -30,8 +33,8 @@ BENAUD = Persona(
         "dramatic": "Extraordinary.",
         "excitement": "Marvellous!",
     },
-    signature_phrases=[
-        "Gone.",
+    signature_phrases=(
+        BENAUD_WICKET,
         "Marvellous!",
         "Magnificent.",
         "Two.",
@@ -41,9 +44,9 @@ BENAUD = Persona(
         "Well played.",
         "Just wide.",
         "Extraordinary.",
-    ],
+    ),
     minimalism_score=0.95,
-    languages=["en"],
+    languages=("en",),
     voice_id=None,  # TBD for TTS
     speaking_rate=0.9,  # Slightly slower, more deliberate
     pitch=-2.0,  # Lower pitch, gravitas
@@ -8,14 +8,14 @@ from .base import CommentaryStyle, Persona
 DOSHI = Persona(
     name="Sushil Doshi",
     style=CommentaryStyle.DRAMATIC,
-    vocabulary=[
+    vocabulary=(
         "गजब",  # Amazing
         "शानदार",  # Splendid
         "बेहतरीन",  # Excellent
         "कमाल",  # Wonderful
         "धमाका",  # Blast
         "जबरदस्त",  # Tremendous
-    ],
+    ),
     cultural_context="Hindi heartland cricket passion, emotional storytelling",
     emotion_range={
         "wicket": "आउट! और गया!",  # Out! And he's gone!
@@ -28,16 +28,16 @@ DOSHI = Persona(
         "dramatic": "क्या बात है!",  # What a moment!
         "excitement": "गजब! कमाल!",  # Amazing! Wonderful!
     },
-    signature_phrases=[
+    signature_phrases=(
         "आउट! और गया!",
         "क्या बात है!",
         "गजब!",
         "शानदार!",
         "कमाल का खेल!",
         "बड़ा शॉट!",
-    ],
+    ),
     minimalism_score=0.6,  # Slightly more expressive, but still punchy
-    languages=["hi"],
+    languages=("hi",),
     voice_id="hi-IN-Wavenet-C",  # Male Hindi voice
     speaking_rate=0.9,  # Slightly slower, more deliberate
     pitch=-3.0,  # Deeper voice for gravitas
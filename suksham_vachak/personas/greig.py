@@ -8,7 +8,7 @@ from .base import CommentaryStyle, Persona
 GREIG = Persona(
     name="Tony Greig",
     style=CommentaryStyle.DRAMATIC,
-    vocabulary=[
+    vocabulary=(
         "magnificent",
         "tremendous",
         "absolutely",
@@ -17,7 +17,7 @@ GREIG = Persona(
         "extraordinary",
         "fantastic",
         "sensational",
-    ],
+    ),
     cultural_context="South African-born English cricketer, larger than life personality",
     emotion_range={
         "wicket": "That's OUT! What a moment!",
@@ -28,7 +28,7 @@ GREIG = Persona(
         "excitement": "This is absolutely brilliant!",
         "dramatic": "The crowd is on their feet!",
     },
-    signature_phrases=[
+    signature_phrases=(
         "What a shot!",
         "Into the stands!",
         "Absolutely brilliant!",
@@ -37,9 +37,9 @@ GREIG = Persona(
         "Tremendous!",
         "That's sensational!",
         "Incredible scenes!",
-    ],
+    ),
     minimalism_score=0.2,  # Very verbose
-    languages=["en"],
+    languages=("en",),
     voice_id=None,
     speaking_rate=1.1,  # Slightly faster, excited
     pitch=2.0,  # Higher pitch, energetic
@@ -86,14 +86,20 @@ class CricketMoment:
     # Metadata for filtering
     tags: list[str] = field(default_factory=list)
 
+    # Lazily built composite text (moments are not mutated after creation)
+    _embedding_text_cache: str | None = field(default=None, init=False, repr=False, compare=False)
+
     def to_embedding_text(self) -> str:
         """Generate text for embedding.
 
         Combines key attributes into a composite text that captures
-        the essence of the moment for semantic similarity.
+        the essence of the moment for semantic similarity. The result
+        is built once and reused on later calls.
         """
         if self.embedding_text:
             return self.embedding_text
+        if self._embedding_text_cache is not None:
+            return self._embedding_text_cache
 
         parts = [
             self.primary_player,
@@ -117,7 +123,8 @@ class CricketMoment:
         if self.description:
             parts.append(self.description)
 
-        return " | ".join(parts)
+        self._embedding_text_cache = " | ".join(parts)
+        return self._embedding_text_cache
 
     def to_metadata(self) -> dict[str, Any]:
         """Convert to ChromaDB metadata dict."""
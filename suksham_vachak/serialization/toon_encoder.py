@@ -13,6 +13,7 @@ we provide a custom implementation following TOON principles:
 
 from __future__ import annotations
 
+import sys
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -39,6 +40,10 @@ B
   SR 115.6
 """
 
+# Characters that force a string value to be quoted; isdisjoint scans the
+# value once in C instead of one substring search per character
+_SPECIAL_CHARS = frozenset("\n\t:[]{},\"'")
+
 
 def _format_overs(overs: float) -> str:
     """Format overs as string (e.g., 23.4)."""
@@ -54,51 +59,72 @@ def _needs_quoting(s: str) -> bool:
     if not s:
         return True
     # Quote if contains special characters that could confuse parsing
-    special_chars = {"\n", "\t", ":", "[", "]", "{", "}", ",", '"', "'"}
-    return any(c in s for c in special_chars) or s.startswith(" ") or s.endswith(" ")
+    return not _SPECIAL_CHARS.isdisjoint(s) or s[0] == " " or s[-1] == " "
 
 
 def _format_value(value: Any) -> str:
     """Format a primitive value for TOON output."""
-    if value is None:
-        return "null"
-    if isinstance(value, bool):
-        return "true" if value else "false"
-    if isinstance(value, int | float):
-        return str(value)
-    # String
-    s = str(value)
-    if _needs_quoting(s):
+    # Plain strings are the common case, so they are checked first
+    if type(value) is not str:
+        if value is None:
+            return "null"
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, int | float):
+            return str(value)
+        value = str(value)
+    if _needs_quoting(value):
         # Escape quotes and wrap
-        escaped = s.replace('"', '\\"')
+        escaped = value.replace('"', '\\"')
         return f'"{escaped}"'
-    return s
+    return value
 
 
-def _encode_dict(data: dict[str, Any], indent: int = 0) -> str:
-    """Encode a dictionary to TOON format."""
-    lines: list[str] = []
+def _encode_into(lines: list[str], data: dict[str, Any], indent: int) -> None:
+    """Append the TOON lines for a dictionary to lines.
+
+    Nested objects write into the same list, so the whole document is
+    joined once instead of once per nesting level.
+    """
     prefix = "  " * indent
+    append = lines.append
 
     for key, value in data.items():
-        if isinstance(value, dict):
-            lines.append(f"{prefix}{key}:")
-            lines.append(_encode_dict(value, indent + 1))  # pyright: ignore[reportUnknownArgumentType]
+        value_type = type(value)
+        # Scalars are most entries; int/float/plain str skip the container checks
+        if value_type is int or value_type is float or (value_type is str and not _needs_quoting(value)):
+            append(f"{prefix}{key}: {value}")
+        elif isinstance(value, dict):
+            append(f"{prefix}{key}:")
+            _encode_nested(lines, value, indent + 1)  # pyright: ignore[reportUnknownArgumentType]
         elif isinstance(value, list):
             if not value:
-                lines.append(f"{prefix}{key}[0]:")
+                append(f"{prefix}{key}[0]:")
             elif all(isinstance(item, dict) for item in value):  # pyright: ignore[reportUnknownVariableType]
                 # List of objects
-                lines.append(f"{prefix}{key}[{len(value)}]:")  # pyright: ignore[reportUnknownArgumentType]
+                append(f"{prefix}{key}[{len(value)}]:")  # pyright: ignore[reportUnknownArgumentType]
                 for item in value:  # pyright: ignore[reportUnknownVariableType]
-                    lines.append(_encode_dict(item, indent + 1))  # pyright: ignore[reportUnknownArgumentType]
+                    _encode_nested(lines, item, indent + 1)  # pyright: ignore[reportUnknownArgumentType]
             else:
                 # Simple list of values
                 formatted_items = ", ".join(_format_value(item) for item in value)  # pyright: ignore[reportUnknownVariableType]
-                lines.append(f"{prefix}{key}[{len(value)}]: {formatted_items}")  # pyright: ignore[reportUnknownArgumentType]
+                append(f"{prefix}{key}[{len(value)}]: {formatted_items}")  # pyright: ignore[reportUnknownArgumentType]
         else:
-            lines.append(f"{prefix}{key}: {_format_value(value)}")
+            append(f"{prefix}{key}: {_format_value(value)}")
 
+
+def _encode_nested(lines: list[str], data: dict[str, Any], indent: int) -> None:
+    """Append a nested object; an empty one still takes a (blank) line."""
+    if data:
+        _encode_into(lines, data, indent)
+    else:
+        lines.append("")
+
+
+def _encode_dict(data: dict[str, Any], indent: int = 0) -> str:
+    """Encode a dictionary to TOON format."""
+    lines: list[str] = []
+    _encode_into(lines, data, indent)
     return "\n".join(lines)
 
 
@@ -120,7 +146,8 @@ def encode(data: dict[str, Any]) -> str:
 def decode(toon_str: str) -> dict[str, Any]:
     """Decode a TOON string back to a dictionary.
 
-    Basic implementation for testing purposes.
+    Basic implementation for testing purposes. Keys are interned, so the
+    short field names repeated across decoded contexts share one string.
 
     Args:
         toon_str: TOON-formatted string
@@ -153,7 +180,7 @@ def decode(toon_str: str) -> dict[str, Any]:
                 # Array line: key[N]: values or key[N]:
                 bracket_start = stripped.index("[")
                 bracket_end = stripped.index("]")
-                key = stripped[:bracket_start]
+                key = sys.intern(stripped[:bracket_start])
                 # Note: count is parsed but not used (arrays populate from child lines)
                 _ = int(stripped[bracket_start + 1 : bracket_end])
                 rest = stripped[bracket_end + 2 :].strip()  # After ']:' or ']: '
@@ -167,7 +194,7 @@ def decode(toon_str: str) -> dict[str, Any]:
                     current_dict[key] = []
             elif stripped.endswith(":"):
                 # Nested object
-                key = stripped[:-1].strip()
+                key = sys.intern(stripped[:-1].strip())
                 new_dict: dict[str, Any] = {}
                 current_dict[key] = new_dict
                 stack.append((new_dict, indent))
@@ -175,7 +202,7 @@ def decode(toon_str: str) -> dict[str, Any]:
             else:
                 # Key-value pair
                 colon_pos = stripped.index(":")
-                key = stripped[:colon_pos].strip()
+                key = sys.intern(stripped[:colon_pos].strip())
                 value_str = stripped[colon_pos + 1 :].strip()
                 current_dict[key] = _parse_value(value_str)
 
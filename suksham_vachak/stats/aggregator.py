@@ -15,20 +15,37 @@ from .normalize import normalize_display_name, normalize_player_id
 
 logger = get_logger(__name__)
 
+# Phase of each over (0-indexed), by format
+# T20: powerplay (1-6), middle (7-15), death (16-20)
+# ODI: powerplay (1-10), middle (11-40), death (41-50)
+# Test: session heuristic (overs 1-30, 31-60, 61-90 per day)
+PHASE_TABLES: dict[str, tuple[str, ...]] = {
+    "T20": ("powerplay",) * 6 + ("middle",) * 9 + ("death",) * 5,
+    "ODI": ("powerplay",) * 10 + ("middle",) * 30 + ("death",) * 10,
+    # Assumes ~90 overs per day; approximate since we don't have actual session boundaries
+    "Test": ("session1",) * 30 + ("session2",) * 30 + ("session3",) * 30,
+}
+
+# Formats whose table repeats (one Test day) rather than ending at the last over
+WRAPPING_FORMATS = frozenset({"Test"})
+
+# Dismissal kinds credited to the bowler
+BOWLER_DISMISSALS = frozenset({"bowled", "caught", "lbw", "stumped", "caught and bowled", "hit wicket"})
+
 
 class MatchupAccumulator:
     """Accumulate per-ball stats into matchup records for a single match."""
 
-    # Phase definitions by format
-    # T20: powerplay (1-6), middle (7-15), death (16-20)
-    # ODI: powerplay (1-10), middle (11-40), death (41-50)
-    # Test: session heuristic (overs 1-30, 31-60, 61-90 per day)
+    __slots__ = ("_data", "_phase_table", "_wraps", "match_date", "match_format", "match_id", "venue")
 
     def __init__(self, match_id: str, match_date: str, match_format: str, venue: str) -> None:
         self.match_id = match_id
         self.match_date = match_date
         self.match_format = match_format
         self.venue = venue
+        self._phase_table = PHASE_TABLES.get(match_format)
+        # Resolved once so _determine_phase does no per-ball format lookup
+        self._wraps = match_format in WRAPPING_FORMATS
 
         # Key: (batter_id, bowler_id, phase) -> accumulated stats
         self._data: dict[tuple[str, str, str | None], dict] = defaultdict(
@@ -54,36 +71,14 @@ class MatchupAccumulator:
         Returns:
             Phase string or None if format not recognized.
         """
-        # Convert 0-indexed over to 1-indexed for phase calculation
-        over = over_number + 1
-
-        if self.match_format == "T20":
-            if over <= 6:
-                return "powerplay"
-            elif over <= 15:
-                return "middle"
-            else:
-                return "death"
-        elif self.match_format == "ODI":
-            if over <= 10:
-                return "powerplay"
-            elif over <= 40:
-                return "middle"
-            else:
-                return "death"
-        elif self.match_format == "Test":
-            # Heuristic: assume ~90 overs per day, divided into 3 sessions
-            # This is approximate since we don't have actual session boundaries
-            day_over = ((over - 1) % 90) + 1
-            if day_over <= 30:
-                return "session1"
-            elif day_over <= 60:
-                return "session2"
-            else:
-                return "session3"
-        else:
+        table = self._phase_table
+        if table is None:
             # Unknown format (domestic, other)
             return None
+        if self._wraps:
+            return table[over_number % len(table)]
+        # Overs past the scheduled length (super overs, etc.) stay in the last phase
+        return table[min(over_number, len(table) - 1)]
 
     def add_delivery(self, event: CricketEvent) -> None:
         """Add a delivery to the accumulator."""
@@ -114,12 +109,10 @@ class MatchupAccumulator:
             stats["sixes"] += 1
 
         # Count dismissals by this bowler
-        if event.is_wicket:
-            # Only count if bowler is credited (not run out, obstructing field, etc.)
-            bowler_dismissals = {"bowled", "caught", "lbw", "stumped", "caught and bowled", "hit wicket"}
-            if event.wicket_type and event.wicket_type.lower() in bowler_dismissals:
-                stats["dismissals"] += 1
-                stats["dismissal_type"] = event.wicket_type
+        # Only count if bowler is credited (not run out, obstructing field, etc.)
+        if event.is_wicket and event.wicket_type and event.wicket_type.lower() in BOWLER_DISMISSALS:
+            stats["dismissals"] += 1
+            stats["dismissal_type"] = event.wicket_type
 
     def get_records(self) -> list[MatchupRecord]:
         """Generate matchup records from accumulated data."""
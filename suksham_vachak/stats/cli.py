@@ -44,13 +44,14 @@ def ingest_all(config: StatsConfig) -> None:
     matches_processed = 0
     records_total = 0
 
-    for match_records in aggregator.process_all():
-        db.add_matchup_records_batch(match_records)
-        matches_processed += 1
-        records_total += len(match_records)
-
-        if matches_processed % 10 == 0:
-            print(f"  Processed {matches_processed}/{total_matches} matches...")
+    with db.bulk_load():
+        for match_records in aggregator.process_all():
+            db.add_matchup_records_batch(match_records)
+            matches_processed += 1
+            records_total += len(match_records)
+
+            if matches_processed % 10 == 0:
+                print(f"  Processed {matches_processed}/{total_matches} matches...")
 
     print("\nComplete!")
     print(f"  Matches processed: {matches_processed}")
@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 import sqlite3
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from contextlib import contextmanager
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from .models import MatchupRecord
@@ -41,7 +41,9 @@ CREATE TABLE IF NOT EXISTS matchups (
     FOREIGN KEY (batter_id) REFERENCES players(id),
     FOREIGN KEY (bowler_id) REFERENCES players(id)
 );
+"""
 
+SCHEMA_INDEXES = """
 CREATE INDEX IF NOT EXISTS idx_matchups_batter ON matchups(batter_id);
 CREATE INDEX IF NOT EXISTS idx_matchups_bowler ON matchups(bowler_id);
 CREATE INDEX IF NOT EXISTS idx_matchups_pair ON matchups(batter_id, bowler_id);
@@ -56,6 +58,67 @@ CREATE INDEX IF NOT EXISTS idx_matchups_batter_date ON matchups(batter_id, match
 CREATE INDEX IF NOT EXISTS idx_matchups_bowler_date ON matchups(bowler_id, match_date DESC);
 """
 
+# Every secondary index on matchups, dropped for the duration of bulk_load()
+MATCHUP_INDEXES = (
+    "idx_matchups_batter",
+    "idx_matchups_bowler",
+    "idx_matchups_pair",
+    "idx_matchups_match",
+    "idx_matchups_phase",
+    "idx_matchups_bowler_phase",
+    "idx_matchups_batter_date",
+    "idx_matchups_bowler_date",
+)
+
+# In-memory databases are ephemeral and single-connection, so durability and
+# cross-process locking only add per-statement overhead.
+MEMORY_PRAGMAS = """
+PRAGMA synchronous = OFF;
+PRAGMA journal_mode = MEMORY;
+PRAGMA temp_store = MEMORY;
+PRAGMA locking_mode = EXCLUSIVE;
+"""
+
+# File databases hold derived data that can be rebuilt from Cricsheet, so WAL
+# with synchronous=NORMAL (no fsync per commit, still corruption-safe) is enough.
+# journal_mode=WAL is persistent and set once in initialize(); the rest are
+# per-connection.
+FILE_PRAGMAS = """
+PRAGMA synchronous = NORMAL;
+PRAGMA temp_store = MEMORY;
+"""
+
+INSERT_PLAYER_SQL = "INSERT OR IGNORE INTO players (id, name) VALUES (?, ?)"
+
+# matchups columns in INSERT_MATCHUP_SQL order, as produced by MatchupRecord.as_row()
+MATCHUP_COLUMNS = (
+    "batter_id",
+    "bowler_id",
+    "match_id",
+    "match_date",
+    "match_format",
+    "venue",
+    "balls_faced",
+    "runs_scored",
+    "dots",
+    "fours",
+    "sixes",
+    "dismissals",
+    "dismissal_type",
+    "phase",
+)
+
+INSERT_MATCHUP_SQL = """
+INSERT INTO matchups (
+    batter_id, bowler_id, match_id, match_date, match_format, venue,
+    balls_faced, runs_scored, dots, fours, sixes, dismissals, dismissal_type,
+    phase
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Columns a columnar batch must supply: every matchup column plus player names
+COLUMNAR_FIELDS = (*MATCHUP_COLUMNS, "batter_name", "bowler_name")
+
 
 class StatsDatabase:
     """SQLite database for cricket statistics.
@@ -65,46 +128,121 @@ class StatsDatabase:
     For in-memory databases, reuses a single connection.
     """
 
-    def __init__(self, db_path: str | Path) -> None:
+    def __init__(self, db_path: str | Path, uri: bool = False) -> None:
         """Initialize database connection.
 
         Args:
             db_path: Path to SQLite database file. Use ":memory:" for in-memory DB.
+            uri: Treat db_path as an SQLite URI, e.g.
+                "file:stats?mode=memory&cache=shared" for a named in-memory
+                database that other connections in the process can attach to.
         """
         self.db_path = str(db_path)
+        self.uri = uri
+        self._in_memory = self.db_path == ":memory:" or (uri and "mode=memory" in self.db_path)
         self._initialized = False
+        # Bumped on every write made through this instance; engines compare it
+        # to drop cached query results
+        self.generation = 0
         # For in-memory databases, keep a persistent connection
         self._memory_conn: sqlite3.Connection | None = None
+        # Long-lived connection whose PRAGMA data_version moves when any other
+        # connection (ours or another process's) commits to a file database
+        self._version_conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection in autocommit mode.
+
+        With isolation_level=None the sqlite3 module no longer issues an
+        implicit BEGIN before each write; multi-statement writes open their
+        own transaction through _transaction(). Declared-type detection stays
+        off, so integer columns are returned without converter lookups.
+        """
+        conn = sqlite3.connect(
+            self.db_path, detect_types=0, isolation_level=None, check_same_thread=False, uri=self.uri
+        )
+        conn.row_factory = sqlite3.Row
+        return conn
 
     @contextmanager
     def _connection(self) -> Iterator[sqlite3.Connection]:
         """Create a database connection context."""
-        if self.db_path == ":memory:":
-            # Reuse persistent connection for in-memory DB
+        if self._in_memory:
+            # Reuse persistent connection for in-memory DB (it also keeps a
+            # named shared-cache database alive)
             if self._memory_conn is None:
-                self._memory_conn = sqlite3.connect(":memory:")
-                self._memory_conn.row_factory = sqlite3.Row
+                self._memory_conn = self._connect()
+                self._memory_conn.executescript(MEMORY_PRAGMAS)
             yield self._memory_conn
         else:
             # Create new connection for file-based DB
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
+            conn = self._connect()
+            conn.executescript(FILE_PRAGMAS)
             try:
                 yield conn
             finally:
                 conn.close()
 
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run the enclosed statements in one explicit transaction.
+
+        Commits on success and rolls back if the block raises.
+        """
+        with self._connection() as conn:
+            conn.execute("BEGIN")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def data_version(self) -> tuple[int, int]:
+        """Get a token that changes whenever the stored data may have changed.
+
+        Combines generation (writes through this instance) with SQLite's
+        PRAGMA data_version, which only moves for commits made on other
+        connections, so writes from another process such as a separate
+        `stats.cli ingest` are seen as well.
+        """
+        if self._in_memory:
+            with self._connection() as conn:
+                version = conn.execute("PRAGMA data_version").fetchone()[0]
+        else:
+            if self._version_conn is None:
+                self._version_conn = self._connect()
+            version = self._version_conn.execute("PRAGMA data_version").fetchone()[0]
+        return self.generation, version
+
     def initialize(self) -> None:
-        """Create database schema if not exists."""
-        if self._initialized and self.db_path != ":memory:":
+        """Create database schema and indexes if not exists."""
+        if self._initialized and not self._in_memory:
             return
 
         with self._connection() as conn:
+            if not self._in_memory:
+                conn.execute("PRAGMA journal_mode = WAL")
             conn.executescript(SCHEMA)
-            conn.commit()
+            conn.executescript(SCHEMA_INDEXES)
 
+        # Phase/form queries need the v2 indexes; creating them here means
+        # databases that never run the migration explicitly still get them.
+        self.migrate_to_v2()
         self._initialized = True
 
+    def clone(self) -> StatsDatabase:
+        """Copy this database into a new in-memory database.
+
+        Uses the SQLite backup API, so schema and rows are copied page by
+        page without re-running any DDL.
+        """
+        copy = StatsDatabase(":memory:")
+        with self._connection() as src, copy._connection() as dst:
+            src.backup(dst)
+        copy._initialized = True
+        return copy
+
     def migrate_to_v2(self) -> None:
         """Migrate schema to v2: add phase column and indexes.
 
@@ -120,7 +258,24 @@ class StatsDatabase:
 
             # Create v2 indexes (safe - uses IF NOT EXISTS)
             conn.executescript(SCHEMA_V2_INDEXES)
-            conn.commit()
+
+    @contextmanager
+    def bulk_load(self) -> Iterator[None]:
+        """Defer matchup index maintenance until a bulk load finishes.
+
+        Drops the secondary matchup indexes on entry and rebuilds them on
+        exit, so inserts inside the block append rows without updating eight
+        B-trees per row. Lookups inside the block run without indexes.
+        """
+        with self._connection() as conn:
+            for name in MATCHUP_INDEXES:
+                conn.execute(f"DROP INDEX IF EXISTS {name}")
+        try:
+            yield
+        finally:
+            with self._connection() as conn:
+                conn.executescript(SCHEMA_INDEXES)
+            self.migrate_to_v2()
 
     def upsert_player(
         self,
@@ -142,97 +297,80 @@ class StatsDatabase:
                 """,
                 (player_id, name, full_name, team),
             )
-            conn.commit()
+        self.generation += 1
 
     def add_matchup_record(self, record: MatchupRecord) -> None:
         """Add a single matchup record."""
-        with self._connection() as conn:
-            # Ensure players exist
-            conn.execute(
-                "INSERT OR IGNORE INTO players (id, name) VALUES (?, ?)",
-                (record.batter_id, record.batter_name),
-            )
-            conn.execute(
-                "INSERT OR IGNORE INTO players (id, name) VALUES (?, ?)",
-                (record.bowler_id, record.bowler_name),
-            )
-
-            # Insert matchup record
-            conn.execute(
-                """
-                INSERT INTO matchups (
-                    batter_id, bowler_id, match_id, match_date, match_format, venue,
-                    balls_faced, runs_scored, dots, fours, sixes, dismissals, dismissal_type,
-                    phase
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    record.batter_id,
-                    record.bowler_id,
-                    record.match_id,
-                    record.match_date,
-                    record.match_format,
-                    record.venue,
-                    record.balls_faced,
-                    record.runs_scored,
-                    record.dots,
-                    record.fours,
-                    record.sixes,
-                    record.dismissals,
-                    record.dismissal_type,
-                    record.phase,
-                ),
-            )
-            conn.commit()
+        self.add_matchup_records_batch([record])
 
     def add_matchup_records_batch(self, records: list[MatchupRecord]) -> None:
-        """Add multiple matchup records in a single transaction."""
+        """Add multiple matchup records in a single transaction.
+
+        Players and matchups are each written with one executemany; the
+        transaction rolls back as a whole if any row fails.
+        """
         if not records:
             return
 
-        with self._connection() as conn:
-            # Collect unique players
-            players: dict[str, str] = {}
-            for record in records:
-                players[record.batter_id] = record.batter_name
-                players[record.bowler_id] = record.bowler_name
-
-            # Insert all players
-            conn.executemany(
-                "INSERT OR IGNORE INTO players (id, name) VALUES (?, ?)",
-                list(players.items()),
-            )
+        # Collect unique players; the last name seen in the batch is the one
+        # offered to INSERT OR IGNORE
+        players: dict[str, str] = {}
+        for record in records:
+            players[record.batter_id] = record.batter_name
+            players[record.bowler_id] = record.bowler_name
 
-            # Insert all matchup records
-            conn.executemany(
-                """
-                INSERT INTO matchups (
-                    batter_id, bowler_id, match_id, match_date, match_format, venue,
-                    balls_faced, runs_scored, dots, fours, sixes, dismissals, dismissal_type,
-                    phase
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                [
-                    (
-                        r.batter_id,
-                        r.bowler_id,
-                        r.match_id,
-                        r.match_date,
-                        r.match_format,
-                        r.venue,
-                        r.balls_faced,
-                        r.runs_scored,
-                        r.dots,
-                        r.fours,
-                        r.sixes,
-                        r.dismissals,
-                        r.dismissal_type,
-                        r.phase,
-                    )
-                    for r in records
-                ],
-            )
-            conn.commit()
+        self._insert_matchups(players, [r.as_row() for r in records])
+
+    def add_matchup_records_columnar(self, columns: Mapping[str, Sequence[Any]]) -> None:
+        """Add matchup records given as parallel columns, one sequence per field.
+
+        Lets bulk producers skip building a MatchupRecord per row; rows are
+        bound straight from the columns in the same single transaction as
+        add_matchup_records_batch.
+
+        Args:
+            columns: A sequence for every name in COLUMNAR_FIELDS, all of the
+                same length.
+
+        Raises:
+            ValueError: If a column is missing or the lengths differ.
+        """
+        missing = [name for name in COLUMNAR_FIELDS if name not in columns]
+        if missing:
+            msg = f"Missing matchup columns: {', '.join(missing)}"
+            raise ValueError(msg)
+
+        lengths = {len(columns[name]) for name in COLUMNAR_FIELDS}
+        if len(lengths) > 1:
+            msg = f"Matchup columns have different lengths: {sorted(lengths)}"
+            raise ValueError(msg)
+        if lengths == {0}:
+            return
+
+        players: dict[str, str] = {}
+        for batter_id, batter_name, bowler_id, bowler_name in zip(
+            columns["batter_id"], columns["batter_name"], columns["bowler_id"], columns["bowler_name"], strict=True
+        ):
+            players[batter_id] = batter_name
+            players[bowler_id] = bowler_name
+
+        self._insert_matchups(players, zip(*(columns[name] for name in MATCHUP_COLUMNS), strict=True))
+
+    def _insert_matchups(self, players: dict[str, str], rows: Iterable[Sequence[Any]]) -> None:
+        """Write players and matchup rows in one transaction.
+
+        executemany prepares each statement once and rebinds it per row. A
+        multi-row VALUES insert was measured to be no faster here: with the
+        lookup indexes in place, index maintenance dominates the cost.
+
+        The matchups foreign keys are declarative only: PRAGMA foreign_keys
+        is left off, so there are no per-row constraint checks to defer, and
+        players are written first so the references hold regardless.
+        """
+        with self._transaction() as conn:
+            conn.executemany(INSERT_PLAYER_SQL, players.items())
+            conn.executemany(INSERT_MATCHUP_SQL, rows)
+        self.generation += 1
 
     def get_player_count(self) -> int:
         """Get total number of players in database."""
@@ -254,10 +392,10 @@ class StatsDatabase:
 
     def clear(self) -> None:
         """Clear all data from the database."""
-        with self._connection() as conn:
+        with self._transaction() as conn:
             conn.execute("DELETE FROM matchups")
             conn.execute("DELETE FROM players")
-            conn.commit()
+        self.generation += 1
 
     def get_player_name(self, player_id: str) -> str | None:
         """Get player display name by ID."""
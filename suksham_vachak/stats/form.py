@@ -3,11 +3,46 @@
 from __future__ import annotations
 
 from enum import Enum
+from functools import lru_cache
 
 from .db import StatsDatabase
 from .models import MatchPerformance, RecentForm
 from .normalize import normalize_player_id
 
+# Distinct (player, role, format, window) results kept per engine
+RECENT_FORM_CACHE_SIZE = 4096
+
+# Per-match totals for a player; batters are dismissed, bowlers take wickets,
+# and both sum the same column. Callers append the optional format filter and
+# the GROUP BY/ORDER BY/LIMIT tail.
+RECENT_FORM_SELECT = """
+    SELECT
+        match_id,
+        match_date,
+        match_format,
+        venue,
+        SUM(balls_faced) as balls,
+        SUM(runs_scored) as runs,
+        SUM(dismissals) as dismissals,
+        SUM(fours) as fours,
+        SUM(sixes) as sixes
+    FROM matchups
+"""
+
+RECENT_FORM_BATTER_SQL = (
+    RECENT_FORM_SELECT
+    + """
+    WHERE batter_id = ?
+    """
+)
+
+RECENT_FORM_BOWLER_SQL = (
+    RECENT_FORM_SELECT
+    + """
+    WHERE bowler_id = ?
+    """
+)
+
 
 class FormTrend(Enum):
     """Player form trend."""
@@ -18,7 +53,12 @@ class FormTrend(Enum):
 
 
 class FormEngine:
-    """Query engine for recent form analysis."""
+    """Query engine for recent form analysis.
+
+    Results are cached and invalidated whenever StatsDatabase.data_version()
+    changes, which covers writes through the same instance as well as
+    commits from another process (e.g. a separate `stats.cli ingest`).
+    """
 
     def __init__(self, db: StatsDatabase, window_size: int = 5) -> None:
         """Initialize with database connection.
@@ -29,6 +69,10 @@ class FormEngine:
         """
         self.db = db
         self.window_size = window_size
+        # Results by (player, role, match_format, window_size), valid while
+        # db.data_version() equals _cache_version
+        self._cache = lru_cache(maxsize=RECENT_FORM_CACHE_SIZE)(self._query_recent_form)
+        self._cache_version: tuple[int, int] | None = None
 
     def get_recent_form(
         self,
@@ -38,6 +82,11 @@ class FormEngine:
     ) -> RecentForm | None:
         """Get recent form for a player.
 
+        Results are cached (least recently used entries beyond
+        RECENT_FORM_CACHE_SIZE are dropped) until the database changes, so
+        commentary that asks about the current batter on every ball queries
+        SQLite once per batter.
+
         Args:
             player: Player name or ID.
             role: "batter" or "bowler".
@@ -46,51 +95,34 @@ class FormEngine:
         Returns:
             RecentForm with last N matches and trend analysis.
         """
+        version = self.db.data_version()
+        if self._cache_version != version:
+            self._cache.cache_clear()
+            self._cache_version = version
+
+        return self._cache(player, role, match_format, self.window_size)
+
+    def _query_recent_form(
+        self, player: str, role: str, match_format: str | None, window_size: int
+    ) -> RecentForm | None:
+        """Query and analyze the recent-form window for a player."""
         player_id = normalize_player_id(player)
 
-        if role == "batter":
-            query = """
-                SELECT
-                    match_id,
-                    match_date,
-                    match_format,
-                    venue,
-                    SUM(balls_faced) as balls,
-                    SUM(runs_scored) as runs,
-                    SUM(dismissals) as dismissals,
-                    SUM(fours) as fours,
-                    SUM(sixes) as sixes
-                FROM matchups
-                WHERE batter_id = ?
-            """
-            params: list = [player_id]
-        else:
-            query = """
-                SELECT
-                    match_id,
-                    match_date,
-                    match_format,
-                    venue,
-                    SUM(balls_faced) as balls,
-                    SUM(runs_scored) as runs,
-                    SUM(dismissals) as wickets,
-                    SUM(fours) as fours,
-                    SUM(sixes) as sixes
-                FROM matchups
-                WHERE bowler_id = ?
-            """
-            params = [player_id]
+        query = RECENT_FORM_BATTER_SQL if role == "batter" else RECENT_FORM_BOWLER_SQL
+        params: list = [player_id]
 
         if match_format:
             query += " AND match_format = ?"
             params.append(match_format)
 
+        # The window is bounded in SQL, so only the N most recent matches are
+        # ever materialized regardless of career length
         query += """
             GROUP BY match_id
             ORDER BY match_date DESC
             LIMIT ?
         """
-        params.append(self.window_size)
+        params.append(window_size)
 
         with self.db._connection() as conn:
             results = conn.execute(query, params).fetchall()
@@ -102,7 +134,7 @@ class FormEngine:
             player_name = self.db.get_player_name(player_id) or player
 
             # Build match performances
-            matches = [
+            matches = tuple(
                 MatchPerformance(
                     match_id=row["match_id"],
                     match_date=row["match_date"] or "",
@@ -110,21 +142,20 @@ class FormEngine:
                     venue=row["venue"] or "",
                     runs=row["runs"] or 0,
                     balls=row["balls"] or 0,
-                    dismissals=row["dismissals"] if role == "batter" else row["wickets"],
+                    dismissals=row["dismissals"] or 0,
                     fours=row["fours"] or 0,
                     sixes=row["sixes"] or 0,
                 )
                 for row in results
-            ]
+            )
 
             # Calculate aggregates
-            total_runs = sum(m.runs for m in matches)
-            total_balls = sum(m.balls for m in matches)
-            total_dismissals = sum(m.dismissals for m in matches)
+            totals = self._totals(matches)
+            total_runs, total_balls, total_dismissals = totals
 
             # Calculate trend
-            trend = self._calculate_trend(matches, role)
-            trend_description = self._get_trend_description(matches, trend, role)
+            trend = self._calculate_trend(matches, role, totals)
+            trend_description = self._get_trend_description(matches, trend, role, totals)
 
             return RecentForm(
                 player_id=player_id,
@@ -138,7 +169,12 @@ class FormEngine:
                 trend_description=trend_description,
             )
 
-    def _calculate_trend(self, performances: list[MatchPerformance], role: str) -> FormTrend:
+    def _calculate_trend(
+        self,
+        performances: tuple[MatchPerformance, ...],
+        role: str,
+        totals: tuple[int, int, int] | None = None,
+    ) -> FormTrend:
         """Calculate trend from recent performances.
 
         Uses simple moving average comparison:
@@ -146,68 +182,73 @@ class FormEngine:
         - If recent half > older half by 10%+: improving
         - If recent half < older half by 10%+: declining
         - Otherwise: stable
+
+        Strike rate and economy are both runs per ball times a constant, so
+        the halves are compared on runs per ball directly.
+
+        Args:
+            performances: Recent match performances, newest first.
+            role: "batter" or "bowler".
+            totals: Precomputed (runs, balls, dismissals), if the caller has them.
         """
         if len(performances) < 3:
             return FormTrend.STABLE
 
+        # More recent half first (list is DESC by date); the older half is
+        # whatever the window totals leave over
         mid = len(performances) // 2
-        recent = performances[:mid]  # More recent (list is DESC by date)
-        older = performances[mid:]
-
-        if role == "batter":
-            # Compare strike rates
-            recent_sr = self._avg_strike_rate(recent)
-            older_sr = self._avg_strike_rate(older)
+        recent_runs, recent_balls, _ = self._totals(performances[:mid])
+        total_runs, total_balls, _ = totals or self._totals(performances)
+        older_runs = total_runs - recent_runs
+        older_balls = total_balls - recent_balls
 
-            if older_sr == 0:
-                return FormTrend.STABLE
+        older_rate = older_runs / older_balls if older_balls else 0.0
+        if older_rate == 0:
+            return FormTrend.STABLE
+        recent_rate = recent_runs / recent_balls if recent_balls else 0.0
 
-            if recent_sr > older_sr * 1.1:
+        if role == "batter":
+            # Higher strike rate is better
+            if recent_rate > older_rate * 1.1:
                 return FormTrend.IMPROVING
-            elif recent_sr < older_sr * 0.9:
+            if recent_rate < older_rate * 0.9:
                 return FormTrend.DECLINING
         else:
-            # For bowlers, compare economy (lower is better)
-            recent_econ = self._avg_economy(recent)
-            older_econ = self._avg_economy(older)
-
-            if older_econ == 0:
-                return FormTrend.STABLE
-
-            if recent_econ < older_econ * 0.9:
+            # For bowlers, lower economy is better
+            if recent_rate < older_rate * 0.9:
                 return FormTrend.IMPROVING
-            elif recent_econ > older_econ * 1.1:
+            if recent_rate > older_rate * 1.1:
                 return FormTrend.DECLINING
 
         return FormTrend.STABLE
 
-    def _avg_strike_rate(self, performances: list[MatchPerformance]) -> float:
-        """Calculate average strike rate across performances."""
-        total_runs = sum(p.runs for p in performances)
-        total_balls = sum(p.balls for p in performances)
-        if total_balls == 0:
-            return 0.0
-        return (total_runs / total_balls) * 100
-
-    def _avg_economy(self, performances: list[MatchPerformance]) -> float:
-        """Calculate average economy across performances."""
-        total_runs = sum(p.runs for p in performances)
-        total_balls = sum(p.balls for p in performances)
-        if total_balls == 0:
-            return 0.0
-        overs = total_balls / 6
-        return total_runs / overs
+    @staticmethod
+    def _totals(performances: tuple[MatchPerformance, ...]) -> tuple[int, int, int]:
+        """Sum runs, balls and dismissals in a single pass."""
+        total_runs = total_balls = total_dismissals = 0
+        for p in performances:
+            total_runs += p.runs
+            total_balls += p.balls
+            total_dismissals += p.dismissals
+        return total_runs, total_balls, total_dismissals
 
     def _get_trend_description(
         self,
-        performances: list[MatchPerformance],
+        performances: tuple[MatchPerformance, ...],
         trend: FormTrend,
         role: str,
+        totals: tuple[int, int, int] | None = None,
     ) -> str:
-        """Generate human-readable trend description."""
+        """Generate human-readable trend description.
+
+        Args:
+            performances: Recent match performances.
+            trend: Trend computed for those performances.
+            role: "batter" or "bowler".
+            totals: Precomputed (runs, balls, dismissals), if the caller has them.
+        """
         match_count = len(performances)
-        total_runs = sum(p.runs for p in performances)
-        total_balls = sum(p.balls for p in performances)
+        total_runs, total_balls, total_wickets = totals or self._totals(performances)
 
         if role == "batter":
             avg_sr = (total_runs / total_balls * 100) if total_balls > 0 else 0
@@ -218,7 +259,6 @@ class FormEngine:
             else:
                 return f"Steady: {total_runs} runs in last {match_count}, SR {avg_sr:.0f}"
         else:
-            total_wickets = sum(p.dismissals for p in performances)
             if trend == FormTrend.IMPROVING:
                 return f"In form: {total_wickets} wkts in last {match_count}"
             elif trend == FormTrend.DECLINING:
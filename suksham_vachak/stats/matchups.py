@@ -2,16 +2,118 @@
 
 from __future__ import annotations
 
+import sqlite3
+from functools import lru_cache
+
 from .db import StatsDatabase
 from .models import PlayerMatchupStats
 from .normalize import normalize_player_id
 
+# Shared aggregate over matchups; the query constants below append WHERE/GROUP BY/HAVING/ORDER BY.
+# Columns follow PlayerMatchupStats field order so rows unpack straight into it.
+# The first two parameters are fallback batter/bowler names for players missing
+# from the players table; the player ID is the last resort.
+MATCHUP_AGGREGATE_SELECT = """
+    SELECT
+        m.batter_id,
+        COALESCE(NULLIF((SELECT name FROM players WHERE id = m.batter_id), ''), NULLIF(?, ''), m.batter_id)
+            as batter_name,
+        m.bowler_id,
+        COALESCE(NULLIF((SELECT name FROM players WHERE id = m.bowler_id), ''), NULLIF(?, ''), m.bowler_id)
+            as bowler_name,
+        COUNT(DISTINCT m.match_id) as matches,
+        SUM(m.balls_faced) as balls_faced,
+        SUM(m.runs_scored) as runs_scored,
+        SUM(m.dismissals) as dismissals,
+        SUM(m.dots) as dots,
+        SUM(m.fours) as fours,
+        SUM(m.sixes) as sixes
+    FROM matchups m
+"""
+
+
+# Zero-ball matchups are dropped in SQL, like min_balls in the *_vs_all queries
+HEAD_TO_HEAD_SQL = (
+    MATCHUP_AGGREGATE_SELECT
+    + """
+    WHERE m.batter_id = ? AND m.bowler_id = ?
+    GROUP BY m.batter_id, m.bowler_id
+    HAVING balls_faced > 0
+    """
+)
+
+HEAD_TO_HEAD_FORMAT_SQL = (
+    MATCHUP_AGGREGATE_SELECT
+    + """
+    WHERE m.batter_id = ? AND m.bowler_id = ? AND m.match_format = ?
+    GROUP BY m.batter_id, m.bowler_id
+    HAVING balls_faced > 0
+    """
+)
+
+BATTER_VS_ALL_SQL = (
+    MATCHUP_AGGREGATE_SELECT
+    + """
+    WHERE m.batter_id = ?
+    GROUP BY m.batter_id, m.bowler_id
+    HAVING balls_faced >= ?
+    ORDER BY balls_faced DESC
+    LIMIT ?
+    """
+)
+
+BOWLER_VS_ALL_SQL = (
+    MATCHUP_AGGREGATE_SELECT
+    + """
+    WHERE m.bowler_id = ?
+    GROUP BY m.batter_id, m.bowler_id
+    HAVING balls_faced >= ?
+    ORDER BY balls_faced DESC
+    LIMIT ?
+    """
+)
+
+BATTER_NEMESIS_SQL = (
+    MATCHUP_AGGREGATE_SELECT
+    + """
+    WHERE m.batter_id = ?
+    GROUP BY m.batter_id, m.bowler_id
+    HAVING dismissals >= ?
+    ORDER BY dismissals DESC, balls_faced ASC
+    LIMIT 5
+    """
+)
+
+BOWLER_BUNNIES_SQL = (
+    MATCHUP_AGGREGATE_SELECT
+    + """
+    WHERE m.bowler_id = ?
+    GROUP BY m.batter_id, m.bowler_id
+    HAVING dismissals >= ?
+    ORDER BY dismissals DESC, balls_faced ASC
+    LIMIT 5
+    """
+)
+
+# Distinct (batter, bowler, format) head-to-head results kept per engine
+HEAD_TO_HEAD_CACHE_SIZE = 4096
+
+
+def _stats_row_factory(cursor: sqlite3.Cursor, row: tuple) -> PlayerMatchupStats:
+    """Row factory for MATCHUP_AGGREGATE_SELECT cursors."""
+    return PlayerMatchupStats(*row)
+
 
 class MatchupEngine:
     """Query engine for player matchup statistics.
 
     Provides methods to query head-to-head statistics between batters
     and bowlers from the stats database.
+
+    Head-to-head results are cached and invalidated whenever
+    StatsDatabase.data_version() changes, which covers writes through the
+    same instance as well as commits from another process (e.g. a separate
+    `stats.cli ingest`).
     """
 
     def __init__(self, db: StatsDatabase) -> None:
@@ -21,6 +123,10 @@ class MatchupEngine:
             db: Initialized StatsDatabase instance.
         """
         self.db = db
+        # Head-to-head results by (batter, bowler, match_format), valid while
+        # db.data_version() equals _cache_version
+        self._h2h_cache = lru_cache(maxsize=HEAD_TO_HEAD_CACHE_SIZE)(self._query_head_to_head)
+        self._cache_version: tuple[int, int] | None = None
 
     def get_head_to_head(
         self,
@@ -30,6 +136,11 @@ class MatchupEngine:
     ) -> PlayerMatchupStats | None:
         """Get aggregated stats for a specific batter vs bowler matchup.
 
+        Results are cached (least recently used pairs beyond
+        HEAD_TO_HEAD_CACHE_SIZE are dropped) until the database changes, so
+        commentary that revisits the current pair every ball queries SQLite
+        once per pair.
+
         Args:
             batter: Batter name or normalized ID.
             bowler: Bowler name or normalized ID.
@@ -38,54 +149,35 @@ class MatchupEngine:
         Returns:
             PlayerMatchupStats if matchup exists, None otherwise.
         """
+        version = self.db.data_version()
+        if self._cache_version != version:
+            self._h2h_cache.cache_clear()
+            self._cache_version = version
+
+        # Keyed by the raw names, which are the fallbacks for missing player rows
+        return self._h2h_cache(batter, bowler, match_format)
+
+    def _execute(self, conn: sqlite3.Connection, query: str, params: tuple) -> sqlite3.Cursor:
+        """Run a MATCHUP_AGGREGATE_SELECT query on a cursor that yields PlayerMatchupStats."""
+        cursor = conn.cursor()
+        cursor.row_factory = _stats_row_factory
+        return cursor.execute(query, params)
+
+    def _query_head_to_head(self, batter: str, bowler: str, match_format: str | None) -> PlayerMatchupStats | None:
+        """Query the aggregated head-to-head row for a batter and bowler."""
         batter_id = normalize_player_id(batter)
         bowler_id = normalize_player_id(bowler)
 
-        query = """
-            SELECT
-                m.batter_id,
-                m.bowler_id,
-                COUNT(DISTINCT m.match_id) as matches,
-                SUM(m.balls_faced) as balls_faced,
-                SUM(m.runs_scored) as runs_scored,
-                SUM(m.dismissals) as dismissals,
-                SUM(m.dots) as dots,
-                SUM(m.fours) as fours,
-                SUM(m.sixes) as sixes
-            FROM matchups m
-            WHERE m.batter_id = ? AND m.bowler_id = ?
-        """
-        params: list = [batter_id, bowler_id]
-
         if match_format:
-            query += " AND m.match_format = ?"
-            params.append(match_format)
-
-        query += " GROUP BY m.batter_id, m.bowler_id"
+            query = HEAD_TO_HEAD_FORMAT_SQL
+            params: tuple[str, ...] = (batter, bowler, batter_id, bowler_id, match_format)
+        else:
+            query = HEAD_TO_HEAD_SQL
+            params = (batter, bowler, batter_id, bowler_id)
 
         with self.db._connection() as conn:
-            result = conn.execute(query, params).fetchone()
-
-            if not result or result["balls_faced"] == 0:
-                return None
-
-            # Get display names
-            batter_name = self.db.get_player_name(batter_id) or batter
-            bowler_name = self.db.get_player_name(bowler_id) or bowler
-
-            return PlayerMatchupStats(
-                batter_id=result["batter_id"],
-                batter_name=batter_name,
-                bowler_id=result["bowler_id"],
-                bowler_name=bowler_name,
-                matches=result["matches"],
-                balls_faced=result["balls_faced"],
-                runs_scored=result["runs_scored"],
-                dismissals=result["dismissals"],
-                dots=result["dots"],
-                fours=result["fours"],
-                sixes=result["sixes"],
-            )
+            result: PlayerMatchupStats | None = self._execute(conn, query, params).fetchone()
+            return result
 
     def get_batter_vs_all(
         self,
@@ -105,45 +197,8 @@ class MatchupEngine:
         """
         batter_id = normalize_player_id(batter)
 
-        query = """
-            SELECT
-                m.batter_id,
-                m.bowler_id,
-                COUNT(DISTINCT m.match_id) as matches,
-                SUM(m.balls_faced) as balls_faced,
-                SUM(m.runs_scored) as runs_scored,
-                SUM(m.dismissals) as dismissals,
-                SUM(m.dots) as dots,
-                SUM(m.fours) as fours,
-                SUM(m.sixes) as sixes
-            FROM matchups m
-            WHERE m.batter_id = ?
-            GROUP BY m.batter_id, m.bowler_id
-            HAVING balls_faced >= ?
-            ORDER BY balls_faced DESC
-            LIMIT ?
-        """
-
         with self.db._connection() as conn:
-            results = conn.execute(query, [batter_id, min_balls, limit]).fetchall()
-            batter_name = self.db.get_player_name(batter_id) or batter
-
-            return [
-                PlayerMatchupStats(
-                    batter_id=row["batter_id"],
-                    batter_name=batter_name,
-                    bowler_id=row["bowler_id"],
-                    bowler_name=self.db.get_player_name(row["bowler_id"]) or row["bowler_id"],
-                    matches=row["matches"],
-                    balls_faced=row["balls_faced"],
-                    runs_scored=row["runs_scored"],
-                    dismissals=row["dismissals"],
-                    dots=row["dots"],
-                    fours=row["fours"],
-                    sixes=row["sixes"],
-                )
-                for row in results
-            ]
+            return list(self._execute(conn, BATTER_VS_ALL_SQL, (batter, None, batter_id, min_balls, limit)))
 
     def get_bowler_vs_all(
         self,
@@ -163,45 +218,8 @@ class MatchupEngine:
         """
         bowler_id = normalize_player_id(bowler)
 
-        query = """
-            SELECT
-                m.batter_id,
-                m.bowler_id,
-                COUNT(DISTINCT m.match_id) as matches,
-                SUM(m.balls_faced) as balls_faced,
-                SUM(m.runs_scored) as runs_scored,
-                SUM(m.dismissals) as dismissals,
-                SUM(m.dots) as dots,
-                SUM(m.fours) as fours,
-                SUM(m.sixes) as sixes
-            FROM matchups m
-            WHERE m.bowler_id = ?
-            GROUP BY m.batter_id, m.bowler_id
-            HAVING balls_faced >= ?
-            ORDER BY balls_faced DESC
-            LIMIT ?
-        """
-
         with self.db._connection() as conn:
-            results = conn.execute(query, [bowler_id, min_balls, limit]).fetchall()
-            bowler_name = self.db.get_player_name(bowler_id) or bowler
-
-            return [
-                PlayerMatchupStats(
-                    batter_id=row["batter_id"],
-                    batter_name=self.db.get_player_name(row["batter_id"]) or row["batter_id"],
-                    bowler_id=row["bowler_id"],
-                    bowler_name=bowler_name,
-                    matches=row["matches"],
-                    balls_faced=row["balls_faced"],
-                    runs_scored=row["runs_scored"],
-                    dismissals=row["dismissals"],
-                    dots=row["dots"],
-                    fours=row["fours"],
-                    sixes=row["sixes"],
-                )
-                for row in results
-            ]
+            return list(self._execute(conn, BOWLER_VS_ALL_SQL, (None, bowler, bowler_id, min_balls, limit)))
 
     def get_batter_nemesis(
         self,
@@ -219,45 +237,8 @@ class MatchupEngine:
         """
         batter_id = normalize_player_id(batter)
 
-        query = """
-            SELECT
-                m.batter_id,
-                m.bowler_id,
-                COUNT(DISTINCT m.match_id) as matches,
-                SUM(m.balls_faced) as balls_faced,
-                SUM(m.runs_scored) as runs_scored,
-                SUM(m.dismissals) as dismissals,
-                SUM(m.dots) as dots,
-                SUM(m.fours) as fours,
-                SUM(m.sixes) as sixes
-            FROM matchups m
-            WHERE m.batter_id = ?
-            GROUP BY m.batter_id, m.bowler_id
-            HAVING dismissals >= ?
-            ORDER BY dismissals DESC, balls_faced ASC
-            LIMIT 5
-        """
-
         with self.db._connection() as conn:
-            results = conn.execute(query, [batter_id, min_dismissals]).fetchall()
-            batter_name = self.db.get_player_name(batter_id) or batter
-
-            return [
-                PlayerMatchupStats(
-                    batter_id=row["batter_id"],
-                    batter_name=batter_name,
-                    bowler_id=row["bowler_id"],
-                    bowler_name=self.db.get_player_name(row["bowler_id"]) or row["bowler_id"],
-                    matches=row["matches"],
-                    balls_faced=row["balls_faced"],
-                    runs_scored=row["runs_scored"],
-                    dismissals=row["dismissals"],
-                    dots=row["dots"],
-                    fours=row["fours"],
-                    sixes=row["sixes"],
-                )
-                for row in results
-            ]
+            return list(self._execute(conn, BATTER_NEMESIS_SQL, (batter, None, batter_id, min_dismissals)))
 
     def get_bowler_bunnies(
         self,
@@ -275,42 +256,5 @@ class MatchupEngine:
         """
         bowler_id = normalize_player_id(bowler)
 
-        query = """
-            SELECT
-                m.batter_id,
-                m.bowler_id,
-                COUNT(DISTINCT m.match_id) as matches,
-                SUM(m.balls_faced) as balls_faced,
-                SUM(m.runs_scored) as runs_scored,
-                SUM(m.dismissals) as dismissals,
-                SUM(m.dots) as dots,
-                SUM(m.fours) as fours,
-                SUM(m.sixes) as sixes
-            FROM matchups m
-            WHERE m.bowler_id = ?
-            GROUP BY m.batter_id, m.bowler_id
-            HAVING dismissals >= ?
-            ORDER BY dismissals DESC, balls_faced ASC
-            LIMIT 5
-        """
-
         with self.db._connection() as conn:
-            results = conn.execute(query, [bowler_id, min_dismissals]).fetchall()
-            bowler_name = self.db.get_player_name(bowler_id) or bowler
-
-            return [
-                PlayerMatchupStats(
-                    batter_id=row["batter_id"],
-                    batter_name=self.db.get_player_name(row["batter_id"]) or row["batter_id"],
-                    bowler_id=row["bowler_id"],
-                    bowler_name=bowler_name,
-                    matches=row["matches"],
-                    balls_faced=row["balls_faced"],
-                    runs_scored=row["runs_scored"],
-                    dismissals=row["dismissals"],
-                    dots=row["dots"],
-                    fours=row["fours"],
-                    sixes=row["sixes"],
-                )
-                for row in results
-            ]
+            return list(self._execute(conn, BOWLER_BUNNIES_SQL, (None, bowler, bowler_id, min_dismissals)))
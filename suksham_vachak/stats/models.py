@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+# One matchups row, as bound to the INSERT statement in db.py
+MatchupRow = tuple[str, str, str, str, str, str, int, int, int, int, int, int, str | None, str | None]
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class PlayerMatchupStats:
     """Aggregated head-to-head statistics between a batter and bowler."""
 
@@ -23,64 +26,78 @@ class PlayerMatchupStats:
     fours: int
     sixes: int
 
+    # Derived ratios, computed once in __post_init__ (instances are frozen)
+    _strike_rate: float = field(init=False, repr=False, compare=False)
+    _average: float = field(init=False, repr=False, compare=False)
+    _dot_percentage: float = field(init=False, repr=False, compare=False)
+    _boundary_percentage: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the derived ratios."""
+        balls = self.balls_faced
+        if balls == 0:
+            strike_rate = dot_percentage = boundary_percentage = 0.0
+        else:
+            strike_rate = (self.runs_scored / balls) * 100
+            dot_percentage = (self.dots / balls) * 100
+            boundary_percentage = ((self.fours + self.sixes) / balls) * 100
+
+        if self.dismissals == 0:
+            average = float("inf") if self.runs_scored > 0 else 0.0
+        else:
+            average = self.runs_scored / self.dismissals
+
+        object.__setattr__(self, "_strike_rate", strike_rate)
+        object.__setattr__(self, "_average", average)
+        object.__setattr__(self, "_dot_percentage", dot_percentage)
+        object.__setattr__(self, "_boundary_percentage", boundary_percentage)
+
     @property
     def strike_rate(self) -> float:
-        """Calculate strike rate (runs per 100 balls)."""
-        if self.balls_faced == 0:
-            return 0.0
-        return (self.runs_scored / self.balls_faced) * 100
+        """Strike rate (runs per 100 balls)."""
+        return self._strike_rate
 
     @property
     def average(self) -> float:
-        """Calculate batting average (runs per dismissal)."""
-        if self.dismissals == 0:
-            return float("inf") if self.runs_scored > 0 else 0.0
-        return self.runs_scored / self.dismissals
+        """Batting average (runs per dismissal)."""
+        return self._average
 
     @property
     def dot_percentage(self) -> float:
-        """Calculate percentage of dot balls."""
-        if self.balls_faced == 0:
-            return 0.0
-        return (self.dots / self.balls_faced) * 100
+        """Percentage of dot balls."""
+        return self._dot_percentage
 
     @property
     def boundary_percentage(self) -> float:
-        """Calculate percentage of boundaries (4s + 6s)."""
-        if self.balls_faced == 0:
-            return 0.0
-        return ((self.fours + self.sixes) / self.balls_faced) * 100
+        """Percentage of boundaries (4s + 6s)."""
+        return self._boundary_percentage
 
     def to_commentary_context(self) -> str:
         """Format stats for LLM prompt context."""
-        parts = [
-            f"{self.batter_name} vs {self.bowler_name}:",
-            f"{self.runs_scored} runs",
-            f"{self.balls_faced} balls",
-            f"SR {self.strike_rate:.1f}",
-        ]
-
-        if self.dismissals > 0:
-            parts.append(f"{self.dismissals}x dismissed")
-            parts.append(f"avg {self.average:.1f}")
-
-        if self.fours > 0 or self.sixes > 0:
-            boundary_parts = []
-            if self.fours > 0:
-                boundary_parts.append(f"{self.fours} fours")
-            if self.sixes > 0:
-                boundary_parts.append(f"{self.sixes} sixes")
-            parts.append(f"({', '.join(boundary_parts)})")
-
-        return " | ".join(parts[:4]) + (" | " + " | ".join(parts[4:]) if len(parts) > 4 else "")
+        dismissed = f" | {self.dismissals}x dismissed | avg {self._average:.1f}" if self.dismissals > 0 else ""
+
+        fours, sixes = self.fours, self.sixes
+        if fours > 0 and sixes > 0:
+            boundaries = f" | ({fours} fours, {sixes} sixes)"
+        elif fours > 0:
+            boundaries = f" | ({fours} fours)"
+        elif sixes > 0:
+            boundaries = f" | ({sixes} sixes)"
+        else:
+            boundaries = ""
+
+        return (
+            f"{self.batter_name} vs {self.bowler_name}: | {self.runs_scored} runs | "
+            f"{self.balls_faced} balls | SR {self._strike_rate:.1f}{dismissed}{boundaries}"
+        )
 
     def to_short_context(self) -> str:
         """Brief one-line summary for commentary."""
-        avg_str = f"avg {self.average:.1f}" if self.dismissals > 0 else "not out"
-        return f"{self.batter_name} vs {self.bowler_name}: {self.runs_scored}/{self.balls_faced} SR {self.strike_rate:.0f}, {avg_str}"
+        avg_str = f"avg {self._average:.1f}" if self.dismissals > 0 else "not out"
+        return f"{self.batter_name} vs {self.bowler_name}: {self.runs_scored}/{self.balls_faced} SR {self._strike_rate:.0f}, {avg_str}"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MatchupRecord:
     """Single match record for a batter-bowler matchup.
 
@@ -106,8 +123,27 @@ class MatchupRecord:
     dismissal_type: str | None  # "bowled", "caught", etc.
     phase: str | None = None  # "powerplay", "middle", "death", "session1/2/3"
 
-
-@dataclass
+    def as_row(self) -> MatchupRow:
+        """Field values in matchups INSERT column order (db.MATCHUP_COLUMNS)."""
+        return (
+            self.batter_id,
+            self.bowler_id,
+            self.match_id,
+            self.match_date,
+            self.match_format,
+            self.venue,
+            self.balls_faced,
+            self.runs_scored,
+            self.dots,
+            self.fours,
+            self.sixes,
+            self.dismissals,
+            self.dismissal_type,
+            self.phase,
+        )
+
+
+@dataclass(frozen=True, slots=True)
 class PhaseStats:
     """Performance statistics for a specific match phase."""
 
@@ -126,39 +162,52 @@ class PhaseStats:
     sixes: int
     wickets: int  # dismissals (batter) or taken (bowler)
 
+    # Derived ratios, computed once in __post_init__ (instances are frozen)
+    _strike_rate: float = field(init=False, repr=False, compare=False)
+    _economy: float = field(init=False, repr=False, compare=False)
+    _average: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the derived ratios."""
+        balls = self.balls
+        if balls == 0:
+            strike_rate = economy = 0.0
+        else:
+            strike_rate = (self.runs / balls) * 100
+            economy = self.runs / (balls / 6)
+
+        average = self.runs / self.wickets if self.wickets else (float("inf") if self.runs > 0 else 0.0)
+
+        object.__setattr__(self, "_strike_rate", strike_rate)
+        object.__setattr__(self, "_economy", economy)
+        object.__setattr__(self, "_average", average)
+
     @property
     def strike_rate(self) -> float:
-        """Calculate strike rate (runs per 100 balls). For batters."""
-        if self.balls == 0:
-            return 0.0
-        return (self.runs / self.balls) * 100
+        """Strike rate (runs per 100 balls). For batters."""
+        return self._strike_rate
 
     @property
     def economy(self) -> float:
-        """Calculate economy rate (runs per over). For bowlers."""
-        if self.balls == 0:
-            return 0.0
-        overs = self.balls / 6
-        return self.runs / overs
+        """Economy rate (runs per over). For bowlers."""
+        return self._economy
 
     @property
     def average(self) -> float:
-        """Calculate average (runs per dismissal for batter, runs per wicket for bowler)."""
-        if self.wickets == 0:
-            return float("inf") if self.runs > 0 else 0.0
-        return self.runs / self.wickets
+        """Average (runs per dismissal for batter, runs per wicket for bowler)."""
+        return self._average
 
     def to_context(self, role: str = "batter") -> str:
         """Format stats for LLM prompt context."""
         if role == "batter":
             return (
-                f"{self.player_name} in {self.phase}: SR {self.strike_rate:.0f} ({self.balls} balls, {self.runs} runs)"
+                f"{self.player_name} in {self.phase}: SR {self._strike_rate:.0f} ({self.balls} balls, {self.runs} runs)"
             )
         else:
-            return f"{self.player_name} in {self.phase}: Econ {self.economy:.1f} ({self.wickets} wkts)"
+            return f"{self.player_name} in {self.phase}: Econ {self._economy:.1f} ({self.wickets} wkts)"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MatchPerformance:
     """Single match performance for form tracking."""
 
@@ -174,15 +223,21 @@ class MatchPerformance:
     fours: int
     sixes: int
 
+    # Derived ratio, computed once in __post_init__ (instances are frozen)
+    _strike_rate: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the strike rate."""
+        strike_rate = (self.runs / self.balls) * 100 if self.balls else 0.0
+        object.__setattr__(self, "_strike_rate", strike_rate)
+
     @property
     def strike_rate(self) -> float:
-        """Calculate strike rate for this match."""
-        if self.balls == 0:
-            return 0.0
-        return (self.runs / self.balls) * 100
+        """Strike rate for this match."""
+        return self._strike_rate
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RecentForm:
     """Recent form analysis for a player."""
 
@@ -190,8 +245,8 @@ class RecentForm:
     player_name: str
     role: str  # "batter" or "bowler"
 
-    # Last N matches
-    matches: list[MatchPerformance]
+    # Last N matches (a tuple, so cached instances are fully immutable)
+    matches: tuple[MatchPerformance, ...]
 
     # Aggregated
     total_runs: int
@@ -202,25 +257,35 @@ class RecentForm:
     trend: str  # "improving", "declining", "stable"
     trend_description: str
 
+    # Derived ratios, computed once in __post_init__ (instances are frozen)
+    _average_strike_rate: float = field(init=False, repr=False, compare=False)
+    _average: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the derived ratios from the window totals."""
+        runs = self.total_runs
+        average_strike_rate = (runs / self.total_balls) * 100 if self.total_balls else 0.0
+
+        average = runs / self.total_dismissals if self.total_dismissals else (float("inf") if runs > 0 else 0.0)
+
+        object.__setattr__(self, "_average_strike_rate", average_strike_rate)
+        object.__setattr__(self, "_average", average)
+
     @property
     def average_strike_rate(self) -> float:
-        """Calculate average strike rate across recent matches."""
-        if self.total_balls == 0:
-            return 0.0
-        return (self.total_runs / self.total_balls) * 100
+        """Average strike rate across recent matches."""
+        return self._average_strike_rate
 
     @property
     def average(self) -> float:
-        """Calculate batting average across recent matches."""
-        if self.total_dismissals == 0:
-            return float("inf") if self.total_runs > 0 else 0.0
-        return self.total_runs / self.total_dismissals
+        """Batting average across recent matches."""
+        return self._average
 
     def to_context(self) -> str:
         """Format form for LLM prompt context."""
         match_count = len(self.matches)
         if self.role == "batter":
-            avg_str = f"avg {self.average:.0f}" if self.total_dismissals > 0 else "not out"
-            return f"Last {match_count}: {self.total_runs} runs, SR {self.average_strike_rate:.0f}, {avg_str} ({self.trend})"
+            avg_str = f"avg {self._average:.0f}" if self.total_dismissals > 0 else "not out"
+            return f"Last {match_count}: {self.total_runs} runs, SR {self._average_strike_rate:.0f}, {avg_str} ({self.trend})"
         else:
             return f"Last {match_count}: {self.total_dismissals} wickets, {self.total_runs} runs ({self.trend})"
@@ -3,8 +3,20 @@
 from __future__ import annotations
 
 import re
+import sys
+from functools import lru_cache
 
+# Large enough for every player in a full Cricsheet archive
+NAME_CACHE_SIZE = 8192
 
+# Anything that is neither a word character nor whitespace (periods, apostrophes, ...)
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+
+# The ASCII characters _PUNCTUATION_RE matches, as a str.translate deletion table
+_ASCII_PUNCTUATION_TABLE = str.maketrans("", "", "".join(c for c in map(chr, range(128)) if _PUNCTUATION_RE.match(c)))
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
 def normalize_player_id(name: str) -> str:
     """Convert player name to a normalized ID.
 
@@ -37,30 +49,21 @@ def normalize_player_id(name: str) -> str:
     if not name:
         return ""
 
-    # Convert to lowercase
-    normalized = name.lower()
-
-    # Remove periods (M.S. Dhoni -> MS Dhoni)
-    normalized = normalized.replace(".", "")
-
-    # Remove apostrophes (D'Arcy -> DArcy)
-    normalized = normalized.replace("'", "")
+    # Lowercase and drop punctuation (M.S. Dhoni -> ms dhoni, D'Arcy -> darcy)
+    normalized = name.lower().translate(_ASCII_PUNCTUATION_TABLE)
+    if not normalized.isascii():
+        # Non-ASCII punctuation (curly quotes, dashes) needs the Unicode-aware regex
+        normalized = _PUNCTUATION_RE.sub("", normalized)
 
-    # Remove other common punctuation
-    normalized = re.sub(r"[^\w\s]", "", normalized)
+    # Collapse and strip whitespace, joining words with underscores
+    normalized = "_".join(normalized.split())
 
-    # Replace multiple spaces with single space
-    normalized = re.sub(r"\s+", " ", normalized)
-
-    # Strip leading/trailing whitespace
-    normalized = normalized.strip()
-
-    # Replace spaces with underscores
-    normalized = normalized.replace(" ", "_")
-
-    return normalized
+    # IDs repeat across every matchup key and batch; interning keeps one copy
+    # even after the LRU entry is evicted
+    return sys.intern(normalized)
 
 
+@lru_cache(maxsize=NAME_CACHE_SIZE)
 def normalize_display_name(name: str) -> str:
     """Clean up display name while preserving format.
 
@@ -75,10 +78,7 @@ def normalize_display_name(name: str) -> str:
     if not name:
         return ""
 
-    # Fix multiple spaces
-    cleaned = re.sub(r"\s+", " ", name)
-
-    # Strip whitespace
-    cleaned = cleaned.strip()
+    # Collapse runs of whitespace and strip the ends
+    cleaned = " ".join(name.split())
 
-    return cleaned
+    return sys.intern(cleaned)
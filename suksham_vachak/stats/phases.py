@@ -8,6 +8,72 @@ from .db import StatsDatabase
 from .models import PhaseStats
 from .normalize import normalize_player_id
 
+# Phase aggregates for a player, one per role; the queries below append
+# WHERE/GROUP BY/HAVING
+BATTER_PHASE_SELECT = """
+    SELECT
+        batter_id as player_id,
+        phase,
+        (SELECT name FROM players WHERE id = batter_id) as player_name,
+        COUNT(DISTINCT match_id) as matches,
+        SUM(balls_faced) as balls,
+        SUM(runs_scored) as runs,
+        SUM(dots) as dots,
+        SUM(fours) as fours,
+        SUM(sixes) as sixes,
+        SUM(dismissals) as wickets
+    FROM matchups
+"""
+
+BOWLER_PHASE_SELECT = """
+    SELECT
+        bowler_id as player_id,
+        phase,
+        (SELECT name FROM players WHERE id = bowler_id) as player_name,
+        COUNT(DISTINCT match_id) as matches,
+        SUM(balls_faced) as balls,
+        SUM(runs_scored) as runs,
+        SUM(dots) as dots,
+        SUM(fours) as fours,
+        SUM(sixes) as sixes,
+        SUM(dismissals) as wickets
+    FROM matchups
+"""
+
+# Single phase; callers append the optional format filter and GROUP BY
+BATTER_PHASE_SQL = (
+    BATTER_PHASE_SELECT
+    + """
+    WHERE batter_id = ? AND phase = ?
+    """
+)
+
+BOWLER_PHASE_SQL = (
+    BOWLER_PHASE_SELECT
+    + """
+    WHERE bowler_id = ? AND phase = ?
+    """
+)
+
+# The three phases of a format in one grouped query
+BATTER_ALL_PHASES_SQL = (
+    BATTER_PHASE_SELECT
+    + """
+    WHERE batter_id = ? AND match_format = ? AND phase IN (?, ?, ?)
+    GROUP BY phase
+    HAVING balls > 0
+    """
+)
+
+BOWLER_ALL_PHASES_SQL = (
+    BOWLER_PHASE_SELECT
+    + """
+    WHERE bowler_id = ? AND match_format = ? AND phase IN (?, ?, ?)
+    GROUP BY phase
+    HAVING balls > 0
+    """
+)
+
 
 class Phase(Enum):
     """Match phases for different formats."""
@@ -55,38 +121,8 @@ class PhaseEngine:
         player_id = normalize_player_id(player)
         phase_val = phase.value if isinstance(phase, Phase) else phase
 
-        if role == "batter":
-            query = """
-                SELECT
-                    batter_id as player_id,
-                    (SELECT name FROM players WHERE id = batter_id) as player_name,
-                    COUNT(DISTINCT match_id) as matches,
-                    SUM(balls_faced) as balls,
-                    SUM(runs_scored) as runs,
-                    SUM(dots) as dots,
-                    SUM(fours) as fours,
-                    SUM(sixes) as sixes,
-                    SUM(dismissals) as wickets
-                FROM matchups
-                WHERE batter_id = ? AND phase = ?
-            """
-            params: list = [player_id, phase_val]
-        else:
-            query = """
-                SELECT
-                    bowler_id as player_id,
-                    (SELECT name FROM players WHERE id = bowler_id) as player_name,
-                    COUNT(DISTINCT match_id) as matches,
-                    SUM(balls_faced) as balls,
-                    SUM(runs_scored) as runs,
-                    SUM(dots) as dots,
-                    SUM(fours) as fours,
-                    SUM(sixes) as sixes,
-                    SUM(dismissals) as wickets
-                FROM matchups
-                WHERE bowler_id = ? AND phase = ?
-            """
-            params = [player_id, phase_val]
+        query = BATTER_PHASE_SQL if role == "batter" else BOWLER_PHASE_SQL
+        params: list = [player_id, phase_val]
 
         if match_format:
             query += " AND match_format = ?"
@@ -137,11 +173,35 @@ class PhaseEngine:
         else:
             phases = [Phase.POWERPLAY, Phase.MIDDLE, Phase.DEATH]
 
+        player_id = normalize_player_id(player)
+
+        # One grouped query instead of a get_phase_performance call per phase
+        query = BATTER_ALL_PHASES_SQL if role == "batter" else BOWLER_ALL_PHASES_SQL
+        params = [player_id, match_format, *(phase.value for phase in phases)]
+
+        with self.db._connection() as conn:
+            rows = {row["phase"]: row for row in conn.execute(query, params)}
+
+        # Keep phases in match order regardless of GROUP BY output order
         result = {}
         for phase in phases:
-            stats = self.get_phase_performance(player, phase, match_format, role)
-            if stats:
-                result[phase.value] = stats
+            row = rows.get(phase.value)
+            if row is None:
+                continue
+            result[phase.value] = PhaseStats(
+                player_id=player_id,
+                player_name=row["player_name"] or player,
+                phase=phase.value,
+                match_format=match_format,
+                role=role,
+                matches=row["matches"],
+                balls=row["balls"],
+                runs=row["runs"],
+                dots=row["dots"] or 0,
+                fours=row["fours"] or 0,
+                sixes=row["sixes"] or 0,
+                wickets=row["wickets"] or 0,
+            )
 
         return result
 
@@ -209,7 +269,7 @@ class PhaseEngine:
             """
 
         with self.db._connection() as conn:
-            results = conn.execute(query, [phase_val, match_format, min_balls, limit]).fetchall()
+            results = conn.execute(query, [phase_val, match_format, min_balls, limit])
 
             return [
                 PhaseStats(
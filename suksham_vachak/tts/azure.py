@@ -17,6 +17,7 @@ from .base import (
     TTSVoiceNotFoundError,
     VoiceGender,
     VoiceInfo,
+    persona_voice_key,
 )
 
 
@@ -313,17 +314,9 @@ class AzureTTSProvider(TTSProvider):
         Returns:
             Voice ID string.
         """
-        # Normalize persona name
-        name_lower = persona_name.lower()
-
-        if "benaud" in name_lower:
-            return cls.RECOMMENDED_VOICES["benaud"]
-        elif "greig" in name_lower:
-            return cls.RECOMMENDED_VOICES["greig"]
-        elif "bhogle" in name_lower or "harsha" in name_lower:
-            return cls.RECOMMENDED_VOICES["bhogle"]
-        elif "doshi" in name_lower or "sushil" in name_lower:
-            return cls.RECOMMENDED_VOICES["doshi"]
+        key = persona_voice_key(persona_name)
+        if key is not None:
+            return cls.RECOMMENDED_VOICES[key]
 
         # Default based on language
         if language.startswith("hi"):
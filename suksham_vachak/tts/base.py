@@ -1,8 +1,77 @@
 """Base classes for Text-to-Speech providers."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+
+try:
+    import orjson
+
+    def encode_json(payload: object) -> bytes:
+        """Serialize a request payload to JSON bytes (orjson fast path)."""
+        return orjson.dumps(payload)
+
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    import json
+
+    def encode_json(payload: object) -> bytes:
+        """Serialize a request payload to JSON bytes (stdlib fallback)."""
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+# Headers for request bodies produced by encode_json
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Response header local TTS servers use to report the audio sample rate
+SAMPLE_RATE_HEADER = "x-sample-rate"
+
+
+def sample_rate_from_headers(headers: Mapping[str, str], default: int) -> int:
+    """Read the server-reported sample rate, or `default` without parsing if absent."""
+    value = headers.get(SAMPLE_RATE_HEADER)
+    return int(value) if value else default
+
+
+# How long a local server's /health result is trusted before re-probing
+HEALTH_CACHE_TTL_SECONDS = 5.0
+
+# Connection pooling for local HTTP servers: keep warm keep-alive
+# connections across synth calls, and fail fast when the server is down
+LOCAL_CONNECT_TIMEOUT_SECONDS = 2.0
+LOCAL_MAX_KEEPALIVE_CONNECTIONS = 16
+LOCAL_MAX_CONNECTIONS = 32
+
+# Persona-name keyword -> RECOMMENDED_VOICES key, matched in order
+PERSONA_VOICE_KEYWORDS: tuple[tuple[str, str], ...] = (
+    ("benaud", "benaud"),
+    ("greig", "greig"),
+    ("bhogle", "bhogle"),
+    ("harsha", "bhogle"),
+    ("doshi", "doshi"),
+    ("sushil", "doshi"),
+)
+
+
+@lru_cache(maxsize=64)
+def persona_voice_key(persona_name: str) -> str | None:
+    """Resolve a persona name to its RECOMMENDED_VOICES key.
+
+    Personas are requested by display name on every synthesis call, so the
+    lowercase-and-scan result is memoized per name.
+
+    Args:
+        persona_name: Persona name (e.g., 'Richie Benaud').
+
+    Returns:
+        Voice key such as 'benaud', or None if no keyword matches.
+    """
+    name_lower = persona_name.lower()
+    for keyword, key in PERSONA_VOICE_KEYWORDS:
+        if keyword in name_lower:
+            return key
+    return None
 
 
 class AudioFormat(Enum):
@@ -21,7 +90,7 @@ class VoiceGender(Enum):
     NEUTRAL = "neutral"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VoiceInfo:
     """Information about an available TTS voice."""
 
@@ -99,6 +168,38 @@ class TTSProvider(ABC):
         """
         ...
 
+    @property
+    def supports_batch(self) -> bool:
+        """Whether synthesize_batch sends all items in a single request."""
+        return False
+
+    def synthesize_batch(
+        self,
+        items: list[tuple[str, str, str]],
+        ssml: bool = False,
+        audio_format: AudioFormat = AudioFormat.MP3,
+    ) -> list[TTSResult]:
+        """Synthesize several utterances.
+
+        The default makes one `synthesize` call per item. Providers with a
+        batch endpoint override this and report `supports_batch`.
+
+        Args:
+            items: (text, voice_id, language) tuples to synthesize.
+            ssml: Whether every text is SSML markup.
+            audio_format: Output audio format for every result.
+
+        Returns:
+            TTSResults in the same order as `items`.
+
+        Raises:
+            TTSError: If synthesis fails.
+        """
+        return [
+            self.synthesize(text, voice_id, language=language, ssml=ssml, audio_format=audio_format)
+            for text, voice_id, language in items
+        ]
+
     @abstractmethod
     def get_available_voices(self, language: str | None = None) -> list[VoiceInfo]:
         """Get list of available voices.
@@ -126,6 +227,10 @@ class TTSProvider(ABC):
         """Check if this provider is available (credentials configured, etc.)."""
         return True
 
+    def close(self) -> None:
+        """Release held resources such as pooled HTTP connections."""
+        return None
+
 
 class TTSError(Exception):
     """Base exception for TTS errors."""
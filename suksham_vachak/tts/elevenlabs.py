@@ -21,6 +21,7 @@ from .base import (
     TTSVoiceNotFoundError,
     VoiceGender,
     VoiceInfo,
+    persona_voice_key,
 )
 
 
@@ -179,7 +180,7 @@ class ElevenLabsTTSProvider(TTSProvider):
             model_id = self.MODELS["quality"]
 
         # Get output format
-        output_format = self.FORMAT_MAP.get(audio_format, "mp3_44100_128")
+        output_format = self.FORMAT_MAP[audio_format]
 
         try:
             # Generate audio
@@ -323,19 +324,8 @@ class ElevenLabsTTSProvider(TTSProvider):
         Returns:
             Voice ID string appropriate for the persona.
         """
-        name_lower = persona_name.lower()
-
         # Hindi language uses multilingual model with same voices
         if language.startswith("hi"):
             return cls.RECOMMENDED_VOICES["doshi"]
 
-        if "benaud" in name_lower:
-            return cls.RECOMMENDED_VOICES["benaud"]
-        elif "greig" in name_lower:
-            return cls.RECOMMENDED_VOICES["greig"]
-        elif "bhogle" in name_lower or "harsha" in name_lower:
-            return cls.RECOMMENDED_VOICES["bhogle"]
-        elif "doshi" in name_lower or "sushil" in name_lower:
-            return cls.RECOMMENDED_VOICES["doshi"]
-
-        return cls.RECOMMENDED_VOICES["en_default"]
+        return cls.RECOMMENDED_VOICES[persona_voice_key(persona_name) or "en_default"]
@@ -6,6 +6,8 @@ Supports contextual overrides for high-pressure match situations.
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from suksham_vachak.parser import EventType
 
 # Svara emotion tags
@@ -32,6 +34,14 @@ EVENT_EMOTION_MAP: dict[EventType, str] = {
 
 DEFAULT_EMOTION = EMOTION_CLEAR
 
+# Chase-pressure thresholds (T20 assumed for simplicity)
+CHASE_OVERS = 20.0
+TENSE_WICKETS = 6
+TENSE_REQUIRED_RATE = 8.0
+
+# Distinct (target, score, wickets, over.ball) states memoized per process
+CHASE_STATE_CACHE_SIZE = 2048
+
 
 def is_tense_chase(target: int | None, current_score: int, current_wickets: int, overs_completed: float) -> bool:
     """Determine if the match situation is a tense chase.
@@ -49,6 +59,16 @@ def is_tense_chase(target: int | None, current_score: int, current_wickets: int,
     Returns:
         True if the match is in a tense chase situation.
     """
+    return _is_tense_chase_cached(target, current_score, current_wickets, round(overs_completed * 10))
+
+
+@lru_cache(maxsize=CHASE_STATE_CACHE_SIZE)
+def _is_tense_chase_cached(target: int | None, current_score: int, current_wickets: int, overs_x10: int) -> bool:
+    """Evaluate chase tension for a quantized chase state.
+
+    ``overs_x10`` is the over.ball figure scaled to an int (15.3 -> 153), which
+    is the finest granularity a scoreboard reports.
+    """
     if target is None:
         return False
 
@@ -57,16 +77,16 @@ def is_tense_chase(target: int | None, current_score: int, current_wickets: int,
         return False
 
     # Many wickets down in a chase is always tense
-    if current_wickets >= 6:
+    if current_wickets >= TENSE_WICKETS:
         return True
 
     # High required run rate with wickets in hand
-    overs_remaining = 20.0 - overs_completed  # Assume T20 for simplicity
+    overs_remaining = CHASE_OVERS - overs_x10 / 10
     if overs_remaining <= 0:
         return True
 
     required_rate = runs_needed / overs_remaining
-    return required_rate > 8.0
+    return required_rate > TENSE_REQUIRED_RATE
 
 
 def get_emotion_tag(
@@ -92,9 +112,19 @@ def get_emotion_tag(
     Returns:
         Svara emotion tag string (e.g., '<happy>').
     """
-    tense = is_tense_chase(target, current_score, current_wickets, overs_completed)
+    return _emotion_tag_cached(event_type, target, current_score, current_wickets, round(overs_completed * 10))
+
 
-    if tense:
+@lru_cache(maxsize=CHASE_STATE_CACHE_SIZE)
+def _emotion_tag_cached(
+    event_type: EventType,
+    target: int | None,
+    current_score: int,
+    current_wickets: int,
+    overs_x10: int,
+) -> str:
+    """Resolve the emotion tag for an event in a quantized chase state."""
+    if _is_tense_chase_cached(target, current_score, current_wickets, overs_x10):
         if event_type == EventType.WICKET:
             return EMOTION_FEAR
         if event_type == EventType.BOUNDARY_SIX:
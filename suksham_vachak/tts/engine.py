@@ -2,6 +2,9 @@
 
 import hashlib
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import ClassVar
@@ -16,6 +19,10 @@ from .prosody import ProsodyController
 
 logger = get_logger(__name__)
 
+# A full bounded cache is trimmed to this fraction of cache_max_files, so the
+# directory scan runs once per batch of new files rather than on every write
+CACHE_EVICT_LOW_WATER = 0.9
+
 
 @dataclass
 class AudioSegment:
@@ -31,7 +38,7 @@ class AudioSegment:
     cache_key: str | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TTSConfig:
     """Configuration for TTS Engine."""
 
@@ -55,6 +62,11 @@ class TTSConfig:
     # Cache settings
     enable_cache: bool = True
     cache_dir: str = ".tts_cache"
+    cache_max_files: int | None = None  # Evict least-recently-used audio beyond this
+
+    # Concurrent per-commentary requests in synthesize_batch (1 = sequential).
+    # Safe for the local HTTP providers; raise to e.g. 6 to overlap a whole over.
+    synthesis_workers: int = 1
 
     # Voice mapping (persona name -> voice ID)
     # If not specified, uses provider's default mapping
@@ -111,10 +123,14 @@ class TTSEngine:
         self._prosody_controller = ProsodyController()
         self._providers: dict[str, TTSProvider] = {}
         self._cache_dir: Path | None = None
+        self._cache_file_count = 0
+        self._cache_lock = threading.Lock()
 
         if self.config.enable_cache:
             self._cache_dir = Path(self.config.cache_dir)
             self._cache_dir.mkdir(parents=True, exist_ok=True)
+            if self.config.cache_max_files is not None:
+                self._cache_file_count = sum(1 for _ in self._cache_dir.iterdir())
 
     def __enter__(self) -> "TTSEngine":
         """Enter context manager."""
@@ -122,7 +138,9 @@ class TTSEngine:
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Exit context manager, optionally clearing cache."""
-        # Clear providers (they may hold connections)
+        # Close and clear providers (they may hold connections)
+        for provider in self._providers.values():
+            provider.close()
         self._providers.clear()
 
     def __repr__(self) -> str:
@@ -130,32 +148,36 @@ class TTSEngine:
         cache_status = f"cache={self._cache_dir}" if self._cache_dir else "no-cache"
         return f"TTSEngine(provider={self.config.provider}, {cache_status})"
 
-    def _get_provider(self, provider_name: str) -> TTSProvider:
-        """Get or create a TTS provider instance."""
-        if provider_name not in self._providers:
-            if provider_name == "qwen3":
-                from .qwen3 import Qwen3TTSProvider
+    def _provider_class(self, provider_name: str) -> type[TTSProvider]:
+        """Import the TTS provider class for a provider name."""
+        if provider_name == "qwen3":
+            from .qwen3 import Qwen3TTSProvider
 
-                self._providers[provider_name] = Qwen3TTSProvider()
-            elif provider_name == "svara":
-                from .svara import SvaraTTSProvider
+            return Qwen3TTSProvider
+        elif provider_name == "svara":
+            from .svara import SvaraTTSProvider
 
-                self._providers[provider_name] = SvaraTTSProvider()
-            elif provider_name == "google":
-                from .google import GoogleTTSProvider
+            return SvaraTTSProvider
+        elif provider_name == "google":
+            from .google import GoogleTTSProvider
 
-                self._providers[provider_name] = GoogleTTSProvider()
-            elif provider_name == "azure":
-                from .azure import AzureTTSProvider
+            return GoogleTTSProvider
+        elif provider_name == "azure":
+            from .azure import AzureTTSProvider
 
-                self._providers[provider_name] = AzureTTSProvider()
-            elif provider_name == "elevenlabs":
-                from .elevenlabs import ElevenLabsTTSProvider
+            return AzureTTSProvider
+        elif provider_name == "elevenlabs":
+            from .elevenlabs import ElevenLabsTTSProvider
 
-                self._providers[provider_name] = ElevenLabsTTSProvider()
-            else:
-                msg = f"Unknown TTS provider: {provider_name}"
-                raise TTSError(msg)
+            return ElevenLabsTTSProvider
+        else:
+            msg = f"Unknown TTS provider: {provider_name}"
+            raise TTSError(msg)
+
+    def _get_provider(self, provider_name: str) -> TTSProvider:
+        """Get or create a TTS provider instance."""
+        if provider_name not in self._providers:
+            self._providers[provider_name] = self._provider_class(provider_name)()
 
         return self._providers[provider_name]
 
@@ -194,11 +216,11 @@ class TTSEngine:
         if persona.name in provider_defaults:
             return provider_defaults[persona.name]
 
-        # Use provider's own mapping method
-        provider = self._get_provider(provider_name)
-        if hasattr(provider, "get_voice_for_persona"):
+        # Use provider's own mapping method (a classmethod, so no client is built)
+        provider_class = self._provider_class(provider_name)
+        if hasattr(provider_class, "get_voice_for_persona"):
             language = persona.languages[0] if persona.languages else "en"
-            return provider.get_voice_for_persona(persona.name, language)  # type: ignore[union-attr]
+            return provider_class.get_voice_for_persona(persona.name, language)  # type: ignore[attr-defined]
 
         # Ultimate fallback
         if provider_name == "qwen3":
@@ -220,11 +242,16 @@ class TTSEngine:
         voice_id: str,
         event_type: EventType,
         persona_name: str,
+        provider_name: str,
+        language: str,
     ) -> str:
         """Generate a cache key for audio."""
         # Include all parameters that affect the output
-        key_data = f"{text}|{voice_id}|{event_type.value}|{persona_name}"
-        return hashlib.sha256(key_data.encode()).hexdigest()[:16]
+        key_data = (
+            f"{provider_name}|{voice_id}|{language}|{self.config.audio_format.value}|"
+            f"{event_type.value}|{persona_name}|{text}"
+        )
+        return hashlib.blake2b(key_data.encode(), digest_size=16).hexdigest()
 
     def _get_cached_audio(self, cache_key: str) -> bytes | None:
         """Get cached audio if available."""
@@ -232,17 +259,45 @@ class TTSEngine:
             return None
 
         cache_file = self._cache_dir / f"{cache_key}.{self.config.audio_format.value}"
-        if cache_file.exists():
-            return cache_file.read_bytes()
-        return None
+        try:
+            audio_bytes = cache_file.read_bytes()
+        except FileNotFoundError:
+            return None
+
+        if self.config.cache_max_files is not None:
+            os.utime(cache_file)  # Mark as recently used for eviction
+        return audio_bytes
 
     def _cache_audio(self, cache_key: str, audio_bytes: bytes) -> None:
-        """Cache audio bytes."""
+        """Cache audio bytes, evicting the least recently used files if bounded."""
         if not self._cache_dir:
             return
 
         cache_file = self._cache_dir / f"{cache_key}.{self.config.audio_format.value}"
+        max_files = self.config.cache_max_files
+        if max_files is None:
+            cache_file.write_bytes(audio_bytes)
+            return
+
+        is_new = not cache_file.exists()
         cache_file.write_bytes(audio_bytes)
+        if not is_new:
+            return
+
+        with self._cache_lock:
+            self._cache_file_count += 1
+            if self._cache_file_count > max_files:
+                self._evict_cache(self._cache_dir, int(max_files * CACHE_EVICT_LOW_WATER))
+
+    def _evict_cache(self, cache_dir: Path, keep_files: int) -> None:
+        """Delete the least recently used cache files down to keep_files."""
+        files = sorted(
+            (f for f in cache_dir.iterdir() if f.is_file()),
+            key=lambda f: f.stat().st_mtime_ns,
+        )
+        for stale in files[: max(len(files) - keep_files, 0)]:
+            stale.unlink(missing_ok=True)
+        self._cache_file_count = min(len(files), keep_files)
 
     def synthesize_commentary(
         self,
@@ -272,46 +327,36 @@ class TTSEngine:
         # Build language-aware provider chain
         providers_to_try = self._get_provider_chain(language)
 
-        # Get voice ID for the first provider (may change per provider below)
-        first_provider = providers_to_try[0] if providers_to_try else self.config.provider
-        voice_id = self._get_voice_id(persona, first_provider)
-
-        # Generate cache key
-        cache_key = self._get_cache_key(text, voice_id, event_type, persona.name)
-
-        # Check cache first
-        cached_audio = self._get_cached_audio(cache_key)
-        if cached_audio:
-            word_count = len(text.split())
-            duration = word_count * 0.4
-
-            return AudioSegment(
-                audio_bytes=cached_audio,
-                format=self.config.audio_format,
-                duration_seconds=duration,
-                event_type=event_type,
-                persona_name=persona.name,
-                text=text,
-                voice_id=voice_id,
-                cache_key=cache_key,
-            )
-
-        # Prepare SSML text (for providers that support it)
-        if use_ssml:
-            ssml_text = self._prosody_controller.apply_prosody(text, persona, event_type)
-        else:
-            ssml_text = text
-
-        # Prepare Svara emotion text (for Svara provider)
-        match_ctx = commentary.event.match_context
-        svara_text = self._prepare_svara_text(text, event_type, match_ctx)
-
         # Try providers in chain order
         result: TTSResult | None = None
         last_error: Exception | None = None
+        voice_id = ""
+        cache_key = ""
 
         for provider_name in providers_to_try:
             try:
+                # Voice ID and cache key come from config and the provider name,
+                # so a cache hit never instantiates the provider
+                voice_id = self._get_voice_id(persona, provider_name)
+
+                # Cache entries belong to the provider that rendered them
+                cache_key = self._get_cache_key(text, voice_id, event_type, persona.name, provider_name, language)
+                cached_audio = self._get_cached_audio(cache_key)
+                if cached_audio:
+                    word_count = len(text.split())
+                    duration = word_count * 0.4
+
+                    return AudioSegment(
+                        audio_bytes=cached_audio,
+                        format=self.config.audio_format,
+                        duration_seconds=duration,
+                        event_type=event_type,
+                        persona_name=persona.name,
+                        text=text,
+                        voice_id=voice_id,
+                        cache_key=cache_key,
+                    )
+
                 provider = self._get_provider(provider_name)
 
                 # Skip providers that don't support this language
@@ -319,19 +364,8 @@ class TTSEngine:
                     logger.debug("provider_skip_language", provider=provider_name, language=language)
                     continue
 
-                # Get voice ID for this provider
-                voice_id = self._get_voice_id(persona, provider_name)
-
                 # Choose the right text variant for this provider
-                if provider_name == "svara":
-                    synth_text = svara_text
-                    is_ssml = False
-                elif use_ssml and provider.supports_ssml:
-                    synth_text = ssml_text
-                    is_ssml = True
-                else:
-                    synth_text = text
-                    is_ssml = False
+                synth_text, is_ssml = self._provider_text(provider_name, provider, commentary, persona, use_ssml)
 
                 result = provider.synthesize(
                     text=synth_text,
@@ -366,6 +400,30 @@ class TTSEngine:
             cache_key=cache_key,
         )
 
+    def _provider_text(
+        self,
+        provider_name: str,
+        provider: TTSProvider,
+        commentary: Commentary,
+        persona: Persona,
+        use_ssml: bool,
+    ) -> tuple[str, bool]:
+        """Choose the text variant a provider should synthesize.
+
+        Svara gets emotion tags, SSML-capable providers get prosody markup
+        (if use_ssml), and everything else gets the plain commentary.
+
+        Returns:
+            (text, is_ssml) to pass to the provider.
+        """
+        text = commentary.text
+        event_type = commentary.event.event_type
+        if provider_name == "svara":
+            return self._prepare_svara_text(text, event_type, commentary.event.match_context), False
+        if use_ssml and provider.supports_ssml:
+            return self._prosody_controller.apply_prosody(text, persona, event_type), True
+        return text, False
+
     def _prepare_svara_text(self, text: str, event_type: EventType, match_ctx: object) -> str:
         """Prepare text with Svara emotion tags based on event context.
 
@@ -402,6 +460,12 @@ class TTSEngine:
     ) -> list[AudioSegment]:
         """Synthesize speech for multiple commentaries.
 
+        When the first provider in the language chain reports supports_batch
+        (Svara), the uncached commentaries go out in one request; otherwise,
+        or if that request fails, each commentary is synthesized on its own
+        through the provider chain, with up to `synthesis_workers` requests
+        in flight.
+
         Args:
             commentaries: List of commentaries to synthesize.
             persona: The persona who generated the commentaries.
@@ -410,8 +474,97 @@ class TTSEngine:
         Returns:
             List of AudioSegments in same order as input.
         """
+        language = persona.languages[0] if persona.languages else "en"
+        providers_to_try = self._get_provider_chain(language)
+
+        if len(commentaries) > 1 and providers_to_try:
+            try:
+                segments = self._synthesize_provider_batch(
+                    commentaries, persona, providers_to_try[0], language, use_ssml
+                )
+            except TTSError as e:
+                logger.warning("tts_batch_failed", provider=providers_to_try[0], error=str(e))
+            else:
+                if segments is not None:
+                    return segments
+
+        workers = min(self.config.synthesis_workers, len(commentaries))
+        if workers > 1:
+            # Create providers up front so worker threads only read _providers
+            for provider_name in providers_to_try:
+                with suppress(TTSError):
+                    self._get_provider(provider_name)
+
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(lambda c: self.synthesize_commentary(c, persona, use_ssml), commentaries))
+
         return [self.synthesize_commentary(commentary, persona, use_ssml) for commentary in commentaries]
 
+    def _synthesize_provider_batch(
+        self,
+        commentaries: list[Commentary],
+        persona: Persona,
+        provider_name: str,
+        language: str,
+        use_ssml: bool,
+    ) -> list[AudioSegment] | None:
+        """Synthesize uncached commentaries through a provider's batch endpoint.
+
+        Returns:
+            AudioSegments in input order, or None if the provider cannot batch.
+        """
+        provider = self._get_provider(provider_name)
+        if not provider.supports_batch or not provider.supports_language(language):
+            return None
+
+        voice_id = self._get_voice_id(persona, provider_name)
+        segments: list[AudioSegment | None] = []
+        pending: list[tuple[int, str, Commentary]] = []
+
+        for index, commentary in enumerate(commentaries):
+            text = commentary.text
+            event_type = commentary.event.event_type
+            cache_key = self._get_cache_key(text, voice_id, event_type, persona.name, provider_name, language)
+            cached_audio = self._get_cached_audio(cache_key)
+            if cached_audio:
+                segments.append(
+                    AudioSegment(
+                        audio_bytes=cached_audio,
+                        format=self.config.audio_format,
+                        duration_seconds=len(text.split()) * 0.4,
+                        event_type=event_type,
+                        persona_name=persona.name,
+                        text=text,
+                        voice_id=voice_id,
+                        cache_key=cache_key,
+                    )
+                )
+            else:
+                segments.append(None)
+                pending.append((index, cache_key, commentary))
+
+        if pending:
+            texts = [self._provider_text(provider_name, provider, c, persona, use_ssml) for _, _, c in pending]
+            items = [(synth_text, voice_id, language) for synth_text, _ in texts]
+            # The variant depends only on provider and use_ssml, so is_ssml is shared
+            results = provider.synthesize_batch(items, ssml=texts[0][1], audio_format=self.config.audio_format)
+            logger.info("tts_batch_success", provider=provider_name, language=language, count=len(items))
+
+            for (index, cache_key, commentary), result in zip(pending, results, strict=True):
+                self._cache_audio(cache_key, result.audio_bytes)
+                segments[index] = AudioSegment(
+                    audio_bytes=result.audio_bytes,
+                    format=result.format,
+                    duration_seconds=result.duration_seconds or 0.0,
+                    event_type=commentary.event.event_type,
+                    persona_name=persona.name,
+                    text=commentary.text,
+                    voice_id=voice_id,
+                    cache_key=cache_key,
+                )
+
+        return [segment for segment in segments if segment is not None]
+
     def save_audio(
         self,
         segment: AudioSegment,
@@ -493,16 +646,26 @@ class TTSEngine:
                 cache_file.unlink()
                 count += 1
 
+        self._cache_file_count = 0
         return count
 
     def get_cache_stats(self) -> dict[str, int | float]:
         """Get cache statistics.
 
         Returns:
-            Dictionary with cache stats (files, size_mb).
+            Dictionary with cache stats (files, size_mb, ssml_hits, ssml_misses,
+            ssml_frame_hits, ssml_frame_misses).
         """
+        ssml = self._prosody_controller.cache_info()
+        ssml_stats = {
+            "ssml_hits": ssml["hits"],
+            "ssml_misses": ssml["misses"],
+            "ssml_frame_hits": ssml["frame_hits"],
+            "ssml_frame_misses": ssml["frame_misses"],
+        }
+
         if not self._cache_dir or not self._cache_dir.exists():
-            return {"files": 0, "size_mb": 0.0}
+            return {"files": 0, "size_mb": 0.0, **ssml_stats}
 
         files = list(self._cache_dir.glob("*"))
         total_size = sum(f.stat().st_size for f in files if f.is_file())
@@ -510,6 +673,7 @@ class TTSEngine:
         return {
             "files": len(files),
             "size_mb": round(total_size / (1024 * 1024), 2),
+            **ssml_stats,
         }
 
 
@@ -17,6 +17,7 @@ from .base import (
     TTSVoiceNotFoundError,
     VoiceGender,
     VoiceInfo,
+    persona_voice_key,
 )
 
 
@@ -148,7 +149,7 @@ class GoogleTTSProvider(TTSProvider):
         # Build audio config
         audio_encoding = getattr(
             texttospeech.AudioEncoding,
-            self.FORMAT_MAP.get(audio_format, "MP3"),
+            self.FORMAT_MAP[audio_format],
         )
         audio_config = texttospeech.AudioConfig(
             audio_encoding=audio_encoding,
@@ -256,16 +257,8 @@ class GoogleTTSProvider(TTSProvider):
             return cls.RECOMMENDED_VOICES["doshi"]  # hi-IN-Wavenet-B (male)
 
         # For English, select voice based on persona's accent/style
-        name_lower = persona_name.lower()
-
-        if "benaud" in name_lower:
-            return cls.RECOMMENDED_VOICES["benaud"]  # Australian
-        elif "greig" in name_lower:
-            return cls.RECOMMENDED_VOICES["greig"]  # British
-        elif "bhogle" in name_lower or "harsha" in name_lower:
-            return cls.RECOMMENDED_VOICES["bhogle"]  # Indian English
-        elif "doshi" in name_lower or "sushil" in name_lower:
-            return cls.RECOMMENDED_VOICES["bhogle"]  # Indian English for Doshi in English
-
-        # Default
-        return cls.RECOMMENDED_VOICES["en_default"]
+        key = persona_voice_key(persona_name)
+        if key == "doshi":
+            key = "bhogle"  # Indian English for Doshi in English
+
+        return cls.RECOMMENDED_VOICES[key or "en_default"]
@@ -11,11 +11,30 @@ Environment variables:
 from __future__ import annotations
 
 import os
+import time
+from functools import cached_property
 from typing import ClassVar
 
 import httpx
 
-from .base import AudioFormat, TTSError, TTSProvider, TTSResult, VoiceGender, VoiceInfo
+from .base import (
+    HEALTH_CACHE_TTL_SECONDS,
+    JSON_HEADERS,
+    LOCAL_CONNECT_TIMEOUT_SECONDS,
+    LOCAL_MAX_CONNECTIONS,
+    LOCAL_MAX_KEEPALIVE_CONNECTIONS,
+    AudioFormat,
+    TTSError,
+    TTSProvider,
+    TTSResult,
+    VoiceGender,
+    VoiceInfo,
+    encode_json,
+    sample_rate_from_headers,
+)
+
+# Sample rate assumed when the server does not send x-sample-rate
+QWEN3_SAMPLE_RATE = 24000
 
 
 class Qwen3TTSProvider(TTSProvider):
@@ -43,6 +62,26 @@ class Qwen3TTSProvider(TTSProvider):
 
     DEFAULT_VOICE = "Ryan"
 
+    # Voice presets as listed by get_available_voices (VoiceInfo is frozen, so shared)
+    VOICES: ClassVar[tuple[VoiceInfo, ...]] = (
+        VoiceInfo(
+            voice_id="Ryan",
+            name="Ryan (Deep, Mature)",
+            language="en",
+            gender=VoiceGender.MALE,
+            style="narrative",
+            provider="qwen3",
+        ),
+        VoiceInfo(
+            voice_id="Aiden",
+            name="Aiden (Energetic)",
+            language="en",
+            gender=VoiceGender.MALE,
+            style="dramatic",
+            provider="qwen3",
+        ),
+    )
+
     # Map our AudioFormat to OpenAI API format strings
     FORMAT_MAP: ClassVar[dict[AudioFormat, str]] = {
         AudioFormat.MP3: "mp3",
@@ -50,15 +89,35 @@ class Qwen3TTSProvider(TTSProvider):
         AudioFormat.OGG: "opus",
     }
 
-    def __init__(self, base_url: str | None = None, timeout: float = 30.0) -> None:
+    def __init__(
+        self,
+        base_url: str | None = None,
+        timeout: float = 30.0,
+        transport: httpx.BaseTransport | None = None,
+    ) -> None:
         self._base_url = (base_url or os.environ.get("QWEN3_TTS_BASE_URL", "http://localhost:7860")).rstrip("/")
         self._timeout = timeout
-        self._client: httpx.Client | None = None
+        self._transport = transport  # e.g. httpx.MockTransport in tests
+        self._health_cache: tuple[float, bool] | None = None  # (checked_at, available)
+
+    @cached_property
+    def _client(self) -> httpx.Client:
+        # One pooled keep-alive client per provider; local servers are plain
+        # HTTP/1.1, so the win is skipping the TCP connect on each synth
+        return httpx.Client(
+            base_url=self._base_url,
+            timeout=httpx.Timeout(self._timeout, connect=LOCAL_CONNECT_TIMEOUT_SECONDS),
+            limits=httpx.Limits(
+                max_keepalive_connections=LOCAL_MAX_KEEPALIVE_CONNECTIONS,
+                max_connections=LOCAL_MAX_CONNECTIONS,
+            ),
+            transport=self._transport,
+        )
 
-    def _get_client(self) -> httpx.Client:
-        if self._client is None:
-            self._client = httpx.Client(base_url=self._base_url, timeout=self._timeout)
-        return self._client
+    def close(self) -> None:
+        client = self.__dict__.pop("_client", None)
+        if client is not None:
+            client.close()
 
     @property
     def name(self) -> str:
@@ -73,12 +132,20 @@ class Qwen3TTSProvider(TTSProvider):
         return lang_code in self.SUPPORTED_LANGUAGES
 
     def is_available(self) -> bool:
+        # Routing asks before every synth; reuse a recent /health answer
+        now = time.monotonic()
+        if self._health_cache is not None and now - self._health_cache[0] < HEALTH_CACHE_TTL_SECONDS:
+            return self._health_cache[1]
+
         try:
-            client = self._get_client()
+            client = self._client
             resp = client.get("/health", timeout=5.0)
-            return resp.status_code == 200
+            available = resp.status_code == 200
         except (httpx.HTTPError, Exception):
-            return False
+            available = False
+
+        self._health_cache = (now, available)
+        return available
 
     def synthesize(
         self,
@@ -100,9 +167,9 @@ class Qwen3TTSProvider(TTSProvider):
         Returns:
             TTSResult with audio bytes.
         """
-        client = self._get_client()
+        client = self._client
 
-        response_format = self.FORMAT_MAP.get(audio_format, "mp3")
+        response_format = self.FORMAT_MAP[audio_format]
 
         payload = {
             "model": "qwen3-tts",
@@ -112,7 +179,7 @@ class Qwen3TTSProvider(TTSProvider):
         }
 
         try:
-            resp = client.post("/v1/audio/speech", json=payload)
+            resp = client.post("/v1/audio/speech", content=encode_json(payload), headers=JSON_HEADERS)
             resp.raise_for_status()
         except httpx.HTTPStatusError as e:
             msg = f"Qwen3-TTS synthesis failed (HTTP {e.response.status_code}): {e.response.text}"
@@ -127,7 +194,7 @@ class Qwen3TTSProvider(TTSProvider):
             raise TTSError(msg)
 
         # Sample rate from headers or default (most servers use 24kHz)
-        sample_rate = int(resp.headers.get("x-sample-rate", "24000"))
+        sample_rate = sample_rate_from_headers(resp.headers, QWEN3_SAMPLE_RATE)
 
         # Estimate duration from text
         word_count = len(text.split())
@@ -145,24 +212,7 @@ class Qwen3TTSProvider(TTSProvider):
         if language and not language.split("-")[0].lower().startswith("en"):
             return []
 
-        return [
-            VoiceInfo(
-                voice_id="Ryan",
-                name="Ryan (Deep, Mature)",
-                language="en",
-                gender=VoiceGender.MALE,
-                style="narrative",
-                provider="qwen3",
-            ),
-            VoiceInfo(
-                voice_id="Aiden",
-                name="Aiden (Energetic)",
-                language="en",
-                gender=VoiceGender.MALE,
-                style="dramatic",
-                provider="qwen3",
-            ),
-        ]
+        return list(self.VOICES)
 
     @classmethod
     def get_voice_for_persona(cls, persona_name: str, language: str = "en") -> str:
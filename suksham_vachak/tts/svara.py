@@ -2,7 +2,8 @@
 
 Svara supports 19 Indian languages with emotion tags. Runs as a local server
 on port 8080 and returns raw PCM audio, which we convert to WAV (stdlib) or
-MP3 (ffmpeg subprocess, graceful fallback to WAV).
+MP3 (ffmpeg subprocess, graceful fallback to WAV). Servers that can encode
+MP3 themselves may honour the request's response_format and skip that step.
 
 Environment variables:
     SVARA_TTS_BASE_URL: Base URL of the Svara server (default: http://localhost:8080)
@@ -10,24 +11,69 @@ Environment variables:
 
 from __future__ import annotations
 
+import base64
+import binascii
 import io
 import os
+import struct
 import subprocess
+import time
 import wave
+from functools import cached_property
 from typing import ClassVar
 
 import httpx
 
-from .base import AudioFormat, TTSError, TTSProvider, TTSResult, VoiceGender, VoiceInfo
+from .base import (
+    HEALTH_CACHE_TTL_SECONDS,
+    JSON_HEADERS,
+    LOCAL_CONNECT_TIMEOUT_SECONDS,
+    LOCAL_MAX_CONNECTIONS,
+    LOCAL_MAX_KEEPALIVE_CONNECTIONS,
+    AudioFormat,
+    TTSError,
+    TTSProvider,
+    TTSResult,
+    VoiceGender,
+    VoiceInfo,
+    encode_json,
+    sample_rate_from_headers,
+)
 
 # Svara returns 16-bit mono PCM at 24kHz by default
 SVARA_SAMPLE_RATE = 24000
 SVARA_SAMPLE_WIDTH = 2  # 16-bit = 2 bytes
 SVARA_CHANNELS = 1
 
+# Content type of a natively encoded MP3 response (otherwise the body is PCM)
+MP3_CONTENT_TYPE = "audio/mpeg"
+
+# Canonical 44-byte PCM WAV header for Svara's native format; the RIFF and
+# data chunk sizes at offsets 4 and 40 are patched per call.
+_WAV_HEADER_TEMPLATE = struct.pack(
+    "<4sI4s4sIHHIIHH4sI",
+    b"RIFF",
+    0,
+    b"WAVE",
+    b"fmt ",
+    16,
+    1,  # PCM
+    SVARA_CHANNELS,
+    SVARA_SAMPLE_RATE,
+    SVARA_SAMPLE_RATE * SVARA_CHANNELS * SVARA_SAMPLE_WIDTH,
+    SVARA_CHANNELS * SVARA_SAMPLE_WIDTH,
+    SVARA_SAMPLE_WIDTH * 8,
+    b"data",
+    0,
+)
+
 
 def pcm_to_wav(pcm_data: bytes, sample_rate: int = SVARA_SAMPLE_RATE) -> bytes:
-    """Convert raw PCM bytes to WAV format using stdlib wave module.
+    """Convert raw PCM bytes to WAV format.
+
+    Whole-frame audio at the native Svara rate is prefixed with a patched copy
+    of the precomputed header; anything else goes through the stdlib wave
+    module, which also handles padding of partial frames.
 
     Args:
         pcm_data: Raw 16-bit mono PCM audio bytes.
@@ -36,6 +82,14 @@ def pcm_to_wav(pcm_data: bytes, sample_rate: int = SVARA_SAMPLE_RATE) -> bytes:
     Returns:
         WAV-formatted audio bytes.
     """
+    data_size = len(pcm_data)
+    if sample_rate == SVARA_SAMPLE_RATE and data_size % SVARA_SAMPLE_WIDTH == 0:
+        header = bytearray(_WAV_HEADER_TEMPLATE)
+        struct.pack_into("<I", header, 4, 36 + data_size)
+        struct.pack_into("<I", header, 40, data_size)
+        # join sizes the result once and copies the bytearray header directly
+        return b"".join((header, pcm_data))
+
     buf = io.BytesIO()
     with wave.open(buf, "wb") as wf:
         wf.setnchannels(SVARA_CHANNELS)
@@ -45,10 +99,46 @@ def pcm_to_wav(pcm_data: bytes, sample_rate: int = SVARA_SAMPLE_RATE) -> bytes:
     return buf.getvalue()
 
 
+try:
+    import av
+
+    def _encode_mp3_in_process(pcm_data: bytes, sample_rate: int) -> bytes | None:
+        """Encode PCM to MP3 with PyAV, avoiding an ffmpeg process per clip.
+
+        Returns None (so the caller falls back) for input without a whole
+        sample or if PyAV cannot encode it; a trailing odd byte is dropped.
+        """
+        samples = len(pcm_data) // SVARA_SAMPLE_WIDTH
+        if not samples:
+            return None
+        buf = io.BytesIO()
+        try:
+            frame = av.AudioFrame(format="s16", layout="mono", samples=samples)
+            frame.planes[0].update(pcm_data[: samples * SVARA_SAMPLE_WIDTH])
+            frame.sample_rate = sample_rate
+            with av.open(buf, "w", format="mp3") as container:
+                stream = container.add_stream("libmp3lame", rate=sample_rate)
+                stream.bit_rate = 128_000
+                stream.layout = "mono"
+                container.mux(stream.encode(frame))
+                container.mux(stream.encode(None))
+        except (av.error.FFmpegError, ValueError):
+            return None
+        return buf.getvalue() or None
+
+except ImportError:  # pragma: no cover - PyAV is an optional in-process encoder
+
+    def _encode_mp3_in_process(pcm_data: bytes, sample_rate: int) -> bytes | None:
+        """PyAV is not installed; callers fall back to the ffmpeg CLI."""
+        return None
+
+
 def pcm_to_mp3(pcm_data: bytes, sample_rate: int = SVARA_SAMPLE_RATE) -> bytes | None:
-    """Convert raw PCM bytes to MP3 using ffmpeg subprocess.
+    """Convert raw PCM bytes to MP3.
 
-    Returns None if ffmpeg is not available (caller should fall back to WAV).
+    Encodes in-process with PyAV when it is installed; otherwise (or if that
+    fails) pipes through an ffmpeg subprocess. Returns None if neither is
+    available (caller should fall back to WAV).
 
     Args:
         pcm_data: Raw 16-bit mono PCM audio bytes.
@@ -57,6 +147,10 @@ def pcm_to_mp3(pcm_data: bytes, sample_rate: int = SVARA_SAMPLE_RATE) -> bytes |
     Returns:
         MP3 audio bytes, or None if ffmpeg is unavailable.
     """
+    mp3 = _encode_mp3_in_process(pcm_data, sample_rate)
+    if mp3 is not None:
+        return mp3
+
     try:
         result = subprocess.run(  # noqa: S603
             [  # noqa: S607
@@ -100,6 +194,11 @@ class SvaraTTSProvider(TTSProvider):
 
     Voice IDs follow the pattern: {language_code}_{gender}
     e.g., 'hi_male', 'hi_female', 'en_male', 'ta_female'
+
+    Pipelines that have several utterances ready (e.g., a whole over) can opt
+    in to `synthesize_batch`, which sends them in one POST /synthesize_batch
+    request. Servers without that endpoint (HTTP 404) are remembered, reported
+    through `supports_batch`, and served by sequential `synthesize` calls.
     """
 
     SUPPORTED_LANGUAGES: ClassVar[set[str]] = {
@@ -137,15 +236,36 @@ class SvaraTTSProvider(TTSProvider):
         "hi": "hi_male",
     }
 
-    def __init__(self, base_url: str | None = None, timeout: float = 30.0) -> None:
+    def __init__(
+        self,
+        base_url: str | None = None,
+        timeout: float = 30.0,
+        transport: httpx.BaseTransport | None = None,
+    ) -> None:
         self._base_url = (base_url or os.environ.get("SVARA_TTS_BASE_URL", "http://localhost:8080")).rstrip("/")
         self._timeout = timeout
-        self._client: httpx.Client | None = None
+        self._transport = transport  # e.g. httpx.MockTransport in tests
+        self._health_cache: tuple[float, bool] | None = None  # (checked_at, available)
+        self._batch_supported = True
+
+    @cached_property
+    def _client(self) -> httpx.Client:
+        # One pooled keep-alive client per provider; local servers are plain
+        # HTTP/1.1, so the win is skipping the TCP connect on each synth
+        return httpx.Client(
+            base_url=self._base_url,
+            timeout=httpx.Timeout(self._timeout, connect=LOCAL_CONNECT_TIMEOUT_SECONDS),
+            limits=httpx.Limits(
+                max_keepalive_connections=LOCAL_MAX_KEEPALIVE_CONNECTIONS,
+                max_connections=LOCAL_MAX_CONNECTIONS,
+            ),
+            transport=self._transport,
+        )
 
-    def _get_client(self) -> httpx.Client:
-        if self._client is None:
-            self._client = httpx.Client(base_url=self._base_url, timeout=self._timeout)
-        return self._client
+    def close(self) -> None:
+        client = self.__dict__.pop("_client", None)
+        if client is not None:
+            client.close()
 
     @property
     def name(self) -> str:
@@ -155,17 +275,29 @@ class SvaraTTSProvider(TTSProvider):
     def supports_ssml(self) -> bool:
         return False
 
+    @property
+    def supports_batch(self) -> bool:
+        return self._batch_supported
+
     def supports_language(self, language: str) -> bool:
         lang_code = language.split("-")[0].lower()
         return lang_code in self.SUPPORTED_LANGUAGES
 
     def is_available(self) -> bool:
+        # Routing asks before every synth; reuse a recent /health answer
+        now = time.monotonic()
+        if self._health_cache is not None and now - self._health_cache[0] < HEALTH_CACHE_TTL_SECONDS:
+            return self._health_cache[1]
+
         try:
-            client = self._get_client()
+            client = self._client
             resp = client.get("/health", timeout=5.0)
-            return resp.status_code == 200
+            available = resp.status_code == 200
         except (httpx.HTTPError, Exception):
-            return False
+            available = False
+
+        self._health_cache = (now, available)
+        return available
 
     def synthesize(
         self,
@@ -189,7 +321,7 @@ class SvaraTTSProvider(TTSProvider):
         Returns:
             TTSResult with audio bytes.
         """
-        client = self._get_client()
+        client = self._client
         lang_code = language.split("-")[0].lower()
 
         payload = {
@@ -197,9 +329,12 @@ class SvaraTTSProvider(TTSProvider):
             "voice_id": voice_id,
             "language": lang_code,
         }
+        if audio_format == AudioFormat.MP3:
+            # Servers without native MP3 ignore this and send PCM as usual
+            payload["response_format"] = "mp3"
 
         try:
-            resp = client.post("/synthesize", json=payload)
+            resp = client.post("/synthesize", content=encode_json(payload), headers=JSON_HEADERS)
             resp.raise_for_status()
         except httpx.HTTPStatusError as e:
             msg = f"Svara synthesis failed (HTTP {e.response.status_code}): {e.response.text}"
@@ -214,8 +349,106 @@ class SvaraTTSProvider(TTSProvider):
             raise TTSError(msg)
 
         # Determine sample rate from response headers or use default
-        sample_rate = int(resp.headers.get("x-sample-rate", str(SVARA_SAMPLE_RATE)))
+        sample_rate = sample_rate_from_headers(resp.headers, SVARA_SAMPLE_RATE)
+
+        if resp.headers.get("content-type", "").startswith(MP3_CONTENT_TYPE):
+            # Already encoded by the server: no PCM to transcode or measure
+            return TTSResult(
+                audio_bytes=pcm_data,
+                format=AudioFormat.MP3,
+                sample_rate=sample_rate,
+                duration_seconds=len(text.split()) * 0.4,
+                voice_used=voice_id,
+            )
+
+        return self._pcm_to_result(pcm_data, sample_rate, voice_id, audio_format)
+
+    def synthesize_batch(
+        self,
+        items: list[tuple[str, str, str]],
+        ssml: bool = False,
+        audio_format: AudioFormat = AudioFormat.MP3,
+    ) -> list[TTSResult]:
+        """Synthesize several utterances in a single request.
+
+        The server is expected to answer POST /synthesize_batch with a JSON
+        array of base64-encoded PCM clips, one per item, in request order.
+        If the endpoint is missing (HTTP 404, remembered for later calls),
+        items are synthesized one `synthesize` call at a time.
+
+        Args:
+            items: (text, voice_id, language) tuples to synthesize.
+            ssml: Ignored (Svara doesn't support SSML).
+            audio_format: Output format for every result (MP3 or WAV).
+
+        Returns:
+            TTSResults in the same order as `items`.
+
+        Raises:
+            TTSError: If the request fails.
+        """
+        if not items:
+            return []
+
+        if not self._batch_supported:
+            return super().synthesize_batch(items, ssml=ssml, audio_format=audio_format)
+
+        payload = {
+            "items": [
+                {"text": text, "voice_id": voice_id, "language": language.split("-")[0].lower()}
+                for text, voice_id, language in items
+            ]
+        }
+        try:
+            resp = self._client.post("/synthesize_batch", content=encode_json(payload), headers=JSON_HEADERS)
+            resp.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                self._batch_supported = False
+                return super().synthesize_batch(items, ssml=ssml, audio_format=audio_format)
+            msg = f"Svara batch synthesis failed (HTTP {e.response.status_code}): {e.response.text}"
+            raise TTSError(msg) from e
+        except httpx.HTTPError as e:
+            msg = f"Svara server unreachable: {e}"
+            raise TTSError(msg) from e
+
+        return self._parse_batch_response(resp, items, audio_format)
 
+    def _parse_batch_response(
+        self,
+        resp: httpx.Response,
+        items: list[tuple[str, str, str]],
+        audio_format: AudioFormat,
+    ) -> list[TTSResult]:
+        """Decode a /synthesize_batch JSON response into per-item results."""
+        try:
+            clips = [base64.b64decode(clip) for clip in resp.json()]
+        except (ValueError, TypeError, binascii.Error) as e:
+            msg = f"Svara returned a malformed batch response: {e}"
+            raise TTSError(msg) from e
+
+        if len(clips) != len(items):
+            msg = f"Svara returned {len(clips)} clips for {len(items)} batch items"
+            raise TTSError(msg)
+
+        sample_rate = sample_rate_from_headers(resp.headers, SVARA_SAMPLE_RATE)
+
+        results: list[TTSResult] = []
+        for pcm_data, (_text, voice_id, _language) in zip(clips, items, strict=True):
+            if not pcm_data:
+                msg = "Svara returned empty audio"
+                raise TTSError(msg)
+            results.append(self._pcm_to_result(pcm_data, sample_rate, voice_id, audio_format))
+        return results
+
+    def _pcm_to_result(
+        self,
+        pcm_data: bytes,
+        sample_rate: int,
+        voice_id: str,
+        audio_format: AudioFormat,
+    ) -> TTSResult:
+        """Convert raw Svara PCM into a TTSResult in the requested format."""
         # Convert PCM to requested format
         if audio_format == AudioFormat.MP3:
             mp3_data = pcm_to_mp3(pcm_data, sample_rate)
@@ -243,25 +476,9 @@ class SvaraTTSProvider(TTSProvider):
         )
 
     def get_available_voices(self, language: str | None = None) -> list[VoiceInfo]:
-        voices = []
-        languages = [language.split("-")[0].lower()] if language else list(self.SUPPORTED_LANGUAGES)
-
-        for lang in languages:
-            if lang not in self.SUPPORTED_LANGUAGES:
-                continue
-            for gender in ["male", "female"]:
-                voice_id = f"{lang}_{gender}"
-                voices.append(
-                    VoiceInfo(
-                        voice_id=voice_id,
-                        name=f"Svara {lang.upper()} {gender.title()}",
-                        language=lang,
-                        gender=VoiceGender.MALE if gender == "male" else VoiceGender.FEMALE,
-                        style="expressive",
-                        provider="svara",
-                    )
-                )
-        return voices
+        if language:
+            return list(SVARA_LANGUAGE_VOICES.get(language.split("-")[0].lower(), ()))
+        return [voice for voices in SVARA_LANGUAGE_VOICES.values() for voice in voices]
 
     @classmethod
     def get_voice_for_persona(cls, persona_name: str, language: str = "hi") -> str:
@@ -270,3 +487,20 @@ class SvaraTTSProvider(TTSProvider):
         if lang_code in persona_map:
             return persona_map[lang_code]
         return cls.DEFAULT_VOICES.get(lang_code, "hi_male")
+
+
+# Male and female voices per supported language, built once (VoiceInfo is frozen)
+SVARA_LANGUAGE_VOICES: dict[str, tuple[VoiceInfo, ...]] = {
+    lang: tuple(
+        VoiceInfo(
+            voice_id=f"{lang}_{gender}",
+            name=f"Svara {lang.upper()} {gender.title()}",
+            language=lang,
+            gender=VoiceGender.MALE if gender == "male" else VoiceGender.FEMALE,
+            style="expressive",
+            provider="svara",
+        )
+        for gender in ("male", "female")
+    )
+    for lang in sorted(SvaraTTSProvider.SUPPORTED_LANGUAGES)
+}
@@ -0,0 +1,86 @@
+"""SQLite-backed response cache for LLM integration tests."""
+
+import hashlib
+import json
+import sqlite3
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+from suksham_vachak.commentary.providers import BaseLLMProvider, LLMResponse
+
+
+class LLMResponseCache:
+    """Persist LLM responses keyed by a hash of the full request.
+
+    With replay_only set, the cache acts as a recorded cassette: misses skip
+    the calling test instead of reaching the network.
+    """
+
+    def __init__(self, path: Path, replay_only: bool = False) -> None:
+        self.replay_only = replay_only
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # WAL plus a busy timeout lets pytest-xdist workers share the file without lock errors
+        self._conn = sqlite3.connect(path, timeout=30.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, payload TEXT NOT NULL)")
+
+    @staticmethod
+    def key(model: str, system_prompt: str, user_prompt: str, max_tokens: int) -> str:
+        """Hash everything that determines the response."""
+        request = {"model": model, "system": system_prompt, "user": user_prompt, "max_tokens": max_tokens}
+        return hashlib.sha256(json.dumps(request, sort_keys=True).encode()).hexdigest()
+
+    def get(self, key: str) -> LLMResponse | None:
+        """Return the cached response for a key, if any."""
+        row = self._conn.execute("SELECT payload FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        return LLMResponse(**json.loads(row[0]))
+
+    def set(self, key: str, response: LLMResponse) -> None:
+        """Store a response under a key."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses (key, payload) VALUES (?, ?)",
+            (key, json.dumps(asdict(response))),
+        )
+        self._conn.commit()
+
+    def wrap(self, provider: BaseLLMProvider) -> "CachingLLMClient":
+        """Route a provider's completions through this cache."""
+        return CachingLLMClient(provider, self)
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+
+class CachingLLMClient(BaseLLMProvider):
+    """Provider adapter that answers repeated prompts from an LLMResponseCache."""
+
+    def __init__(self, provider: BaseLLMProvider, cache: LLMResponseCache) -> None:
+        self._provider = provider
+        self._cache = cache
+
+    @property
+    def provider_name(self) -> str:
+        """Provider name."""
+        return self._provider.provider_name
+
+    @property
+    def model_name(self) -> str:
+        """Model name."""
+        return self._provider.model_name
+
+    def complete(self, system_prompt: str, user_prompt: str, max_tokens: int = 50) -> LLMResponse:
+        """Return a cached response, calling the wrapped provider only on a miss."""
+        key = self._cache.key(self.model_name, system_prompt, user_prompt, max_tokens)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        if self._cache.replay_only:
+            pytest.skip("No recorded LLM response for this prompt (replay mode)")
+        response = self._provider.complete(system_prompt, user_prompt, max_tokens)
+        self._cache.set(key, response)
+        return response
@@ -0,0 +1,88 @@
+"""Client-side rate limiting for LLM integration tests."""
+
+import os
+import threading
+import time
+
+from suksham_vachak.commentary.providers import BaseLLMProvider, LLMResponse
+
+# 80% of Anthropic's Tier 1 limits, leaving headroom for other clients on the key
+DEFAULT_RPM = 40
+DEFAULT_TPM = 16000
+
+# Rough characters-per-token ratio for estimating prompt size before sending
+CHARS_PER_TOKEN = 4
+
+
+class TokenBucket:
+    """Leaky bucket that keeps both requests and tokens per minute under a cap.
+
+    Both budgets refill continuously; acquire() sleeps until there is room
+    for one more request of the estimated size.
+    """
+
+    def __init__(self, rpm: int = DEFAULT_RPM, tpm: int = DEFAULT_TPM) -> None:
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+        self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+
+    def acquire(self, estimated_tokens: int) -> None:
+        """Block until one request of estimated_tokens fits in both budgets."""
+        # A single oversized request can never fit; let it through once the bucket is full
+        estimated_tokens = min(estimated_tokens, self.tpm)
+        with self._lock:
+            while True:
+                self._refill()
+                if self._requests >= 1 and self._tokens >= estimated_tokens:
+                    self._requests -= 1
+                    self._tokens -= estimated_tokens
+                    return
+                wait_requests = (1 - self._requests) * 60 / self.rpm
+                wait_tokens = (estimated_tokens - self._tokens) * 60 / self.tpm
+                time.sleep(max(wait_requests, wait_tokens, 0.0))
+
+    @classmethod
+    def from_env(cls) -> "TokenBucket":
+        """Build a bucket from ANTHROPIC_RATE_LIMIT_RPM/TPM.
+
+        Under pytest-xdist the budget is split evenly across workers, so the
+        combined rate stays under the key's limits without a shared lock.
+        """
+        workers = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1"))
+        rpm = int(os.environ.get("ANTHROPIC_RATE_LIMIT_RPM", DEFAULT_RPM))
+        tpm = int(os.environ.get("ANTHROPIC_RATE_LIMIT_TPM", DEFAULT_TPM))
+        return cls(rpm=max(1, rpm // workers), tpm=max(1, tpm // workers))
+
+
+class RateLimitedLLMClient(BaseLLMProvider):
+    """Provider adapter that waits on a TokenBucket before every completion."""
+
+    def __init__(self, provider: BaseLLMProvider, bucket: TokenBucket) -> None:
+        self._provider = provider
+        self._bucket = bucket
+
+    @property
+    def provider_name(self) -> str:
+        """Provider name."""
+        return self._provider.provider_name
+
+    @property
+    def model_name(self) -> str:
+        """Model name."""
+        return self._provider.model_name
+
+    def complete(self, system_prompt: str, user_prompt: str, max_tokens: int = 50) -> LLMResponse:
+        """Wait for rate-limit budget, then call the wrapped provider."""
+        estimated = (len(system_prompt) + len(user_prompt)) // CHARS_PER_TOKEN + max_tokens
+        self._bucket.acquire(estimated)
+        return self._provider.complete(system_prompt, user_prompt, max_tokens)
@@ -0,0 +1,64 @@
+"""Shared pytest fixtures."""
+
+import os
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+
+import pytest
+from _llm_cache import LLMResponseCache
+
+from suksham_vachak.stats.db import StatsDatabase
+from suksham_vachak.stats.models import MatchupRecord
+
+SAMPLE_DATA_DIR = Path(__file__).parent.parent / "data" / "cricsheet_sample"
+
+
+@pytest.fixture(scope="session")
+def sample_files() -> list[Path]:
+    """Sorted Cricsheet sample files, globbed once per session."""
+    files = sorted(SAMPLE_DATA_DIR.glob("*.json"))
+    if not files:
+        pytest.skip("No sample data files found")
+    return files
+
+
+@pytest.fixture(scope="session")
+def db_factory() -> Callable[[Iterable[MatchupRecord]], StatsDatabase]:
+    """Build in-memory stats databases from a schema template.
+
+    The template is initialized once per session; each call clones it with
+    the SQLite backup API and inserts the given records in one batch.
+    """
+    template = StatsDatabase(":memory:")
+    template.initialize()
+
+    def make(records: Iterable[MatchupRecord] = ()) -> StatsDatabase:
+        db = template.clone()
+        db.add_matchup_records_batch(list(records))
+        return db
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def llm_cache(request: pytest.FixtureRequest) -> Iterator[LLMResponseCache | None]:
+    """Opt-in on-disk LLM response cache.
+
+    SUKSHAM_LLM_CACHE=1 records and replays; SUKSHAM_LLM_CACHE=replay only
+    replays, so the generation tests can run offline without an API key.
+    SUKSHAM_LLM_CACHE_PATH points at a checked-in recording instead of the
+    default file under .pytest_cache.
+    """
+    mode = os.environ.get("SUKSHAM_LLM_CACHE")
+    if mode not in ("1", "replay"):
+        yield None
+        return
+
+    default_path = request.config.rootpath / ".pytest_cache" / "llm_cache.sqlite"
+    path = Path(os.environ.get("SUKSHAM_LLM_CACHE_PATH", default_path))
+    if mode == "replay" and not path.exists():
+        pytest.skip(f"No recorded LLM responses at {path}")
+
+    cache = LLMResponseCache(path, replay_only=mode == "replay")
+    yield cache
+    cache.close()
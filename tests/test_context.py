@@ -1,5 +1,6 @@
 """Tests for the context module."""
 
+from itertools import islice
 from pathlib import Path
 
 import pytest
@@ -27,23 +28,48 @@ from suksham_vachak.parser import (
     MatchFormat,
 )
 
-SAMPLE_DATA_DIR = Path(__file__).parent.parent / "data" / "cricsheet_sample"
+
+@pytest.fixture(scope="session")
+def _sample_parser(sample_files: list[Path]) -> CricsheetParser:
+    """Parse the first sample match once for the whole session."""
+    return CricsheetParser(sample_files[0])
+
+
+@pytest.fixture(scope="session")
+def _t20_sample_parser(sample_files: list[Path]) -> CricsheetParser:
+    """Parse the first T20 sample match once for the whole session."""
+    for path in sample_files:
+        parser = CricsheetParser(path)
+        if parser.match_info.format == MatchFormat.T20:
+            return parser
+    pytest.skip("Need T20 match for this test")
+
+
+@pytest.fixture(scope="session")
+def _sample_events_innings1(_sample_parser: CricsheetParser) -> list[CricketEvent]:
+    """First-innings events of the sample match, parsed once."""
+    return list(_sample_parser.parse_innings(1))
 
 
 class TestMatchPhase:
     """Tests for MatchPhase enum."""
 
-    def test_limited_overs_phases(self) -> None:
-        """Test limited overs phases exist."""
-        assert MatchPhase.POWERPLAY.value == "powerplay"
-        assert MatchPhase.MIDDLE_OVERS.value == "middle_overs"
-        assert MatchPhase.DEATH_OVERS.value == "death_overs"
-
-    def test_test_match_phases(self) -> None:
-        """Test test match phases exist."""
-        assert MatchPhase.FIRST_SESSION.value == "first_session"
-        assert MatchPhase.SECOND_SESSION.value == "second_session"
-        assert MatchPhase.THIRD_SESSION.value == "third_session"
+    @pytest.mark.parametrize(
+        ("phase", "value"),
+        [
+            # Limited overs phases
+            (MatchPhase.POWERPLAY, "powerplay"),
+            (MatchPhase.MIDDLE_OVERS, "middle_overs"),
+            (MatchPhase.DEATH_OVERS, "death_overs"),
+            # Test match phases
+            (MatchPhase.FIRST_SESSION, "first_session"),
+            (MatchPhase.SECOND_SESSION, "second_session"),
+            (MatchPhase.THIRD_SESSION, "third_session"),
+        ],
+    )
+    def test_phase_values(self, phase: MatchPhase, value: str) -> None:
+        """Test each match phase exists with its expected value."""
+        assert phase.value == value
 
 
 class TestPressureLevel:
@@ -352,10 +378,10 @@ class TestNarrativeTracker:
 
     @pytest.fixture
     def tracker(self) -> NarrativeTracker:
-        """Create a narrative tracker."""
+        """Create a narrative tracker (function-scoped: update() is stateful)."""
         return NarrativeTracker()
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_event(self) -> CricketEvent:
         """Create a sample event."""
         ctx = MatchContext(
@@ -412,20 +438,13 @@ class TestNarrativeTracker:
 class TestContextBuilder:
     """Tests for ContextBuilder class."""
 
-    @pytest.fixture
-    def sample_match_path(self) -> Path:
-        """Get path to a sample match file."""
-        sample_files = list(SAMPLE_DATA_DIR.glob("*.json"))
-        if not sample_files:
-            pytest.skip("No sample data files found")
-        return sample_files[0]
-
-    def test_build_returns_rich_context(self, sample_match_path: Path) -> None:
+    def test_build_returns_rich_context(
+        self, _sample_parser: CricsheetParser, _sample_events_innings1: list[CricketEvent]
+    ) -> None:
         """Test build returns RichContext."""
-        parser = CricsheetParser(sample_match_path)
-        builder = ContextBuilder(parser.match_info)
+        builder = ContextBuilder(_sample_parser.match_info)
 
-        events = list(parser.parse_innings(1))
+        events = _sample_events_innings1
         if not events:
             pytest.skip("No events in match")
 
@@ -441,12 +460,13 @@ class TestContextBuilder:
         assert isinstance(context.narrative, NarrativeState)
         assert isinstance(context.pressure, PressureLevel)
 
-    def test_context_accumulates_correctly(self, sample_match_path: Path) -> None:
+    def test_context_accumulates_correctly(
+        self, _sample_parser: CricsheetParser, _sample_events_innings1: list[CricketEvent]
+    ) -> None:
         """Test context accumulates over multiple events."""
-        parser = CricsheetParser(sample_match_path)
-        builder = ContextBuilder(parser.match_info)
+        builder = ContextBuilder(_sample_parser.match_info)
 
-        events = list(parser.parse_innings(1))[:20]  # First 20 balls
+        events = _sample_events_innings1[:20]  # First 20 balls
         if not events:
             pytest.skip("No events in match")
 
@@ -457,12 +477,13 @@ class TestContextBuilder:
             assert context.match.total_runs >= prev_runs
             prev_runs = context.match.total_runs
 
-    def test_to_prompt_context(self, sample_match_path: Path) -> None:
+    def test_to_prompt_context(
+        self, _sample_parser: CricsheetParser, _sample_events_innings1: list[CricketEvent]
+    ) -> None:
         """Test to_prompt_context generates readable output."""
-        parser = CricsheetParser(sample_match_path)
-        builder = ContextBuilder(parser.match_info)
+        builder = ContextBuilder(_sample_parser.match_info)
 
-        events = list(parser.parse_innings(1))
+        events = _sample_events_innings1
         if not events:
             pytest.skip("No events in match")
 
@@ -475,16 +496,11 @@ class TestContextBuilder:
         assert "NARRATIVE" in prompt_text
         assert "PRESSURE" in prompt_text
 
-    def test_phase_detection_t20(self, sample_match_path: Path) -> None:
+    def test_phase_detection_t20(self, _t20_sample_parser: CricsheetParser) -> None:
         """Test phase detection for T20."""
-        parser = CricsheetParser(sample_match_path)
-
-        # Skip if not T20
-        if parser.match_info.format != MatchFormat.T20:
-            pytest.skip("Need T20 match for this test")
-
-        builder = ContextBuilder(parser.match_info)
-        events = list(parser.parse_innings(1))
+        builder = ContextBuilder(_t20_sample_parser.match_info)
+        # Only the first 6 overs matter - stop decoding deliveries after that
+        events = list(islice(_t20_sample_parser.parse_innings(1), 36))
 
         if len(events) < 36:  # Need at least 6 overs
             pytest.skip("Not enough events")
@@ -493,13 +509,14 @@ class TestContextBuilder:
         context = builder.build(events[30])
         assert context.match.phase == MatchPhase.POWERPLAY
 
-    def test_new_innings_resets_state(self, sample_match_path: Path) -> None:
+    def test_new_innings_resets_state(
+        self, _sample_parser: CricsheetParser, _sample_events_innings1: list[CricketEvent]
+    ) -> None:
         """Test new innings resets builder state."""
-        parser = CricsheetParser(sample_match_path)
-        builder = ContextBuilder(parser.match_info)
+        builder = ContextBuilder(_sample_parser.match_info)
 
         # Build context for first innings
-        events = list(parser.parse_innings(1))[:10]
+        events = _sample_events_innings1[:10]
         for event in events:
             builder.build(event)
 
@@ -515,16 +532,13 @@ class TestContextBuilder:
 class TestContextIntegration:
     """Integration tests for the context module."""
 
-    def test_full_innings_processing(self) -> None:
+    def test_full_innings_processing(
+        self, _sample_parser: CricsheetParser, _sample_events_innings1: list[CricketEvent]
+    ) -> None:
         """Test processing a full innings."""
-        sample_files = list(SAMPLE_DATA_DIR.glob("*.json"))
-        if not sample_files:
-            pytest.skip("No sample data files found")
+        builder = ContextBuilder(_sample_parser.match_info)
 
-        parser = CricsheetParser(sample_files[0])
-        builder = ContextBuilder(parser.match_info)
-
-        events = list(parser.parse_innings(1))
+        events = _sample_events_innings1
         if not events:
             pytest.skip("No events in match")
 
@@ -538,22 +552,18 @@ class TestContextIntegration:
         assert final_context.match.total_runs > 0
         assert final_context.match.overs_completed > 0
 
-    def test_key_moment_context(self) -> None:
+    def test_key_moment_context(
+        self, _sample_parser: CricsheetParser, _sample_events_innings1: list[CricketEvent]
+    ) -> None:
         """Test context for key moments (wickets, boundaries)."""
-        sample_files = list(SAMPLE_DATA_DIR.glob("*.json"))
-        if not sample_files:
-            pytest.skip("No sample data files found")
-
-        parser = CricsheetParser(sample_files[0])
-        builder = ContextBuilder(parser.match_info)
+        builder = ContextBuilder(_sample_parser.match_info)
 
-        key_moments = parser.get_key_moments(1)
+        key_moments = _sample_parser.get_key_moments(1)
         if not key_moments:
             pytest.skip("No key moments in match")
 
         # Process events up to first key moment
-        events = list(parser.parse_innings(1))
-        for event in events:
+        for event in _sample_events_innings1:
             context = builder.build(event)
             if event.is_wicket:
                 # Wickets should suggest dramatic tone
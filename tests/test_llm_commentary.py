@@ -4,11 +4,36 @@ These tests make real API calls to Claude. They are marked as integration tests
 and will be skipped if ANTHROPIC_API_KEY is not set.
 
 Run with: pytest tests/test_llm_commentary.py -v -m integration
+
+The generation classes share no mutable state, so with pytest-xdist installed
+they can overlap their network round-trips on separate workers:
+
+    pytest tests/test_llm_commentary.py -m integration -n 4 --dist loadscope
+
+Each worker builds its own session fixtures (client, HTTP pool, cache handle).
+Engine calls are throttled client-side to ANTHROPIC_RATE_LIMIT_RPM requests and
+ANTHROPIC_RATE_LIMIT_TPM tokens per minute (default 40 / 16000), split evenly
+across xdist workers.
+
+Set SUKSHAM_PREFETCH_TESTS=1 to send every ``llm_prefetch`` prompt concurrently
+with AsyncAnthropic up front; tests then read the pre-computed responses. Set
+SUKSHAM_LLM_CACHE=1 to replay responses for identical prompts from
+.pytest_cache/llm_cache.sqlite across runs. SUKSHAM_LLM_CACHE=replay runs the
+generation tests offline from a recording (see SUKSHAM_LLM_CACHE_PATH in
+conftest.py), skipping any prompt that was not recorded. Prefetching resolves every
+marked prompt in each process, so use it without -n.
 """
 
+import asyncio
 import os
+from collections.abc import Iterator
+from typing import Any
 
 import pytest
+from _llm_cache import LLMResponseCache
+from _ratelimit import RateLimitedLLMClient, TokenBucket
+from anthropic import AsyncAnthropic, DefaultHttpxClient
+from anthropic.types import Message
 
 from suksham_vachak.commentary import (
     ClaudeModel,
@@ -17,17 +42,25 @@ from suksham_vachak.commentary import (
     build_event_prompt,
     build_system_prompt,
 )
+from suksham_vachak.commentary.providers import BaseLLMProvider, LLMResponse
+from suksham_vachak.commentary.providers.claude import cached_system_prompt
 from suksham_vachak.parser import CricketEvent, EventType, MatchContext, MatchFormat
-from suksham_vachak.personas import BENAUD, GREIG
+from suksham_vachak.personas import BENAUD, GREIG, Persona
+
+API_KEY = os.environ.get("ANTHROPIC_API_KEY")
+REPLAY = os.environ.get("SUKSHAM_LLM_CACHE") == "replay"
 
-# Skip all tests in this module if no API key
+# Skip all tests in this module unless there is an API key or a recording to replay
 pytestmark = pytest.mark.skipif(
-    not os.environ.get("ANTHROPIC_API_KEY"),
+    not API_KEY and not REPLAY,
     reason="ANTHROPIC_API_KEY not set - skipping integration tests",
 )
 
+# Tests that call the client directly and so always need the live API
+live = pytest.mark.skipif(not API_KEY, reason="needs a live ANTHROPIC_API_KEY")
+
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_context() -> MatchContext:
     """Create a sample match context for testing."""
     return MatchContext(
@@ -43,32 +76,42 @@ def sample_context() -> MatchContext:
     )
 
 
-@pytest.fixture
+def make_event(ctx: MatchContext, **overrides: Any) -> CricketEvent:
+    """Build a CricketEvent from a plain delivery plus the fields that differ."""
+    fields: dict[str, Any] = {
+        "runs_batter": 0,
+        "runs_extras": 0,
+        "runs_total": 0,
+        "is_boundary": False,
+        "is_wicket": False,
+        "match_context": ctx,
+    }
+    fields.update(overrides)
+    return CricketEvent(**fields)
+
+
+@pytest.fixture(scope="session")
 def wicket_event(sample_context: MatchContext) -> CricketEvent:
     """Create a wicket event for testing."""
-    return CricketEvent(
+    return make_event(
+        sample_context,
         event_id="test-wicket-1",
         event_type=EventType.WICKET,
         ball_number="67.3",
         batter="Virat Kohli",
         bowler="Mitchell Starc",
         non_striker="Rohit Sharma",
-        runs_batter=0,
-        runs_extras=0,
-        runs_total=0,
-        is_boundary=False,
         is_wicket=True,
-        match_context=sample_context,
         wicket_type="bowled",
         wicket_player="Virat Kohli",
-        fielder=None,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def six_event(sample_context: MatchContext) -> CricketEvent:
     """Create a six event for testing."""
-    return CricketEvent(
+    return make_event(
+        sample_context,
         event_id="test-six-1",
         event_type=EventType.BOUNDARY_SIX,
         ball_number="67.4",
@@ -76,18 +119,167 @@ def six_event(sample_context: MatchContext) -> CricketEvent:
         bowler="Mitchell Starc",
         non_striker="Virat Kohli",
         runs_batter=6,
-        runs_extras=0,
         runs_total=6,
         is_boundary=True,
-        is_wicket=False,
-        match_context=sample_context,
     )
 
 
-@pytest.fixture
-def llm_client() -> LLMClient:
-    """Create an LLM client using Haiku for cost efficiency."""
-    return LLMClient(model=ClaudeModel.HAIKU)
+@pytest.fixture(scope="session")
+def http_client() -> Iterator[DefaultHttpxClient]:
+    """Keep-alive connection pool shared by every LLM client in the session."""
+    client = DefaultHttpxClient(timeout=30.0)
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def llm_client(http_client: DefaultHttpxClient) -> LLMClient:
+    """Create an LLM client using Haiku for cost efficiency, shared by the whole session."""
+    # In replay mode the key is never sent; responses come from the recording
+    return LLMClient(api_key=API_KEY or "replay-only", model=ClaudeModel.HAIKU, http_client=http_client)
+
+
+@pytest.fixture(scope="session")
+def rate_limiter() -> TokenBucket:
+    """Requests/tokens-per-minute budget shared by every engine in the session."""
+    return TokenBucket.from_env()
+
+
+PREFETCH_CONCURRENCY = 10
+
+PromptKey = tuple[str, str, int]
+
+
+def _prompt_key(event: CricketEvent, persona: Persona) -> PromptKey:
+    """Build the (system, user, max_tokens) triple CommentaryEngine sends for an event."""
+    max_tokens = 20 if persona.is_minimalist else 100
+    return build_system_prompt(persona, use_toon=True), build_event_prompt(event, persona), max_tokens
+
+
+class PrefetchedProvider(BaseLLMProvider):
+    """Serve pre-computed responses, falling back to a live provider on a miss."""
+
+    def __init__(self, live: BaseLLMProvider, responses: dict[PromptKey, LLMResponse]) -> None:
+        self._live = live
+        self._responses = responses
+
+    @property
+    def provider_name(self) -> str:
+        """Provider name."""
+        return self._live.provider_name
+
+    @property
+    def model_name(self) -> str:
+        """Model name."""
+        return self._live.model_name
+
+    def complete(self, system_prompt: str, user_prompt: str, max_tokens: int = 50) -> LLMResponse:
+        """Return the prefetched response for this prompt, or call the live provider."""
+        cached = self._responses.get((system_prompt, user_prompt, max_tokens))
+        if cached is not None:
+            return cached
+        return self._live.complete(system_prompt, user_prompt, max_tokens)
+
+
+def _collect_prefetch_prompts(request: pytest.FixtureRequest) -> list[PromptKey]:
+    """Gather prompts declared by ``llm_prefetch`` markers on the collected tests."""
+    keys: list[PromptKey] = []
+    for item in request.session.items:
+        for marker in item.iter_markers("llm_prefetch"):
+            for event_fixture, persona in marker.args:
+                key = _prompt_key(request.getfixturevalue(event_fixture), persona)
+                if key not in keys:
+                    keys.append(key)
+    return keys
+
+
+def _to_llm_response(message: Message, llm_client: LLMClient) -> LLMResponse:
+    """Convert a raw Anthropic message into the provider-neutral LLMResponse."""
+    text = next((block.text for block in message.content if block.type == "text"), "")
+    return LLMResponse(
+        text=text.strip(),
+        model=message.model,
+        input_tokens=message.usage.input_tokens,
+        output_tokens=message.usage.output_tokens,
+        provider=llm_client.provider_name,
+        cache_creation_input_tokens=message.usage.cache_creation_input_tokens or 0,
+        cache_read_input_tokens=message.usage.cache_read_input_tokens or 0,
+    )
+
+
+async def _complete_concurrently(llm_client: LLMClient, keys: list[PromptKey]) -> dict[PromptKey, LLMResponse]:
+    """Fire all prompts at once through AsyncAnthropic, bounded by a semaphore."""
+    client = AsyncAnthropic(api_key=llm_client.api_key)
+    semaphore = asyncio.Semaphore(PREFETCH_CONCURRENCY)
+
+    async def complete(key: PromptKey) -> LLMResponse:
+        system_prompt, user_prompt, max_tokens = key
+        async with semaphore:
+            message = await client.messages.create(
+                model=llm_client.model_name,
+                max_tokens=max_tokens,
+                system=cached_system_prompt(system_prompt),
+                messages=[{"role": "user", "content": user_prompt}],
+            )
+        return _to_llm_response(message, llm_client)
+
+    try:
+        results = await asyncio.gather(*(complete(key) for key in keys))
+    finally:
+        await client.close()
+    return dict(zip(keys, results, strict=True))
+
+
+@pytest.fixture(scope="session")
+def prefetched_responses(request: pytest.FixtureRequest, llm_client: LLMClient) -> dict[PromptKey, LLMResponse]:
+    """Resolve all ``llm_prefetch`` prompts up front (opt-in via SUKSHAM_PREFETCH_TESTS)."""
+    if os.environ.get("SUKSHAM_PREFETCH_TESTS") != "1":
+        return {}
+
+    keys = _collect_prefetch_prompts(request)
+    if not keys:
+        return {}
+    return asyncio.run(_complete_concurrently(llm_client, keys))
+
+
+@pytest.fixture(scope="class")
+def engine(
+    llm_client: LLMClient,
+    rate_limiter: TokenBucket,
+    llm_cache: LLMResponseCache | None,
+    prefetched_responses: dict[PromptKey, LLMResponse],
+) -> CommentaryEngine:
+    """Create an LLM-backed commentary engine, shared within each test class.
+
+    Calls go prefetched responses -> response cache -> rate limiter -> API,
+    so only real network calls spend rate-limit budget.
+    """
+    provider: BaseLLMProvider = RateLimitedLLMClient(llm_client, rate_limiter)
+    if llm_cache is not None:
+        provider = llm_cache.wrap(provider)
+    if prefetched_responses:
+        provider = PrefetchedProvider(provider, prefetched_responses)
+    return CommentaryEngine(use_llm=True, llm_client=provider)
+
+
+@pytest.fixture(scope="class")
+def benaud_prompt() -> tuple[str, str]:
+    """Benaud's system prompt and its lowercase form, built once per class."""
+    prompt = build_system_prompt(BENAUD)
+    return prompt, prompt.lower()
+
+
+@pytest.fixture(scope="class")
+def greig_prompt() -> tuple[str, str]:
+    """Greig's system prompt and its lowercase form, built once per class."""
+    prompt = build_system_prompt(GREIG)
+    return prompt, prompt.lower()
+
+
+@pytest.fixture(scope="class")
+def template_engine() -> CommentaryEngine:
+    """Create a template-only commentary engine."""
+    return CommentaryEngine(use_llm=False)
 
 
 @pytest.mark.integration
@@ -98,6 +290,7 @@ class TestLLMClient:
         """Test LLM client can be initialized."""
         assert llm_client.model == ClaudeModel.HAIKU
 
+    @live
     def test_simple_completion(self, llm_client: LLMClient) -> None:
         """Test basic LLM completion works."""
         response = llm_client.complete(
@@ -110,25 +303,36 @@ class TestLLMClient:
         assert response.input_tokens > 0
         assert response.output_tokens > 0
 
+    @live
+    def test_system_prompt_is_cached(self, llm_client: LLMClient) -> None:
+        """A repeated system prompt should be read from the prompt cache."""
+        # Haiku only caches prefixes of 2048+ tokens, so pad the persona prompt past that
+        system_prompt = "\n\n".join([build_system_prompt(BENAUD)] * 8)
+
+        llm_client.complete(system_prompt=system_prompt, user_prompt="Say hello.", max_tokens=10)
+        second = llm_client.complete(system_prompt=system_prompt, user_prompt="Say goodbye.", max_tokens=10)
+
+        assert second.cache_read_input_tokens > 0
+
 
 @pytest.mark.integration
 class TestPromptBuilding:
     """Tests for prompt building functions."""
 
-    def test_system_prompt_for_benaud(self) -> None:
+    def test_system_prompt_for_benaud(self, benaud_prompt: tuple[str, str]) -> None:
         """Test system prompt is built correctly for Benaud."""
-        prompt = build_system_prompt(BENAUD)
+        prompt, lower = benaud_prompt
 
         assert "Richie Benaud" in prompt
-        assert "minimalist" in prompt.lower() or "Minimalist" in prompt
+        assert "minimalist" in lower
         assert "Gone." in prompt  # Should include signature phrase
 
-    def test_system_prompt_for_greig(self) -> None:
+    def test_system_prompt_for_greig(self, greig_prompt: tuple[str, str]) -> None:
         """Test system prompt is built correctly for Greig."""
-        prompt = build_system_prompt(GREIG)
+        prompt, lower = greig_prompt
 
         assert "Tony Greig" in prompt
-        assert "dramatic" in prompt.lower() or "Dramatic" in prompt
+        assert "dramatic" in lower
 
     def test_event_prompt_for_wicket(self, wicket_event: CricketEvent) -> None:
         """Test event prompt includes match context."""
@@ -148,18 +352,18 @@ class TestBenaudLLMGeneration:
     THE BENAUD TEST: Commentary should be minimal.
     """
 
-    def test_wicket_is_brief(self, wicket_event: CricketEvent, llm_client: LLMClient) -> None:
+    @pytest.mark.llm_prefetch(("wicket_event", BENAUD))
+    def test_wicket_is_brief(self, wicket_event: CricketEvent, engine: CommentaryEngine) -> None:
         """Benaud + WICKET should produce <= 5 words."""
-        engine = CommentaryEngine(use_llm=True, llm_client=llm_client)
         result = engine.generate(wicket_event, BENAUD)
 
         word_count = len(result.text.split()) if result.text else 0
         assert word_count <= 5, f"Too verbose ({word_count} words): '{result.text}'"
         assert result.used_llm is True
 
-    def test_six_is_brief(self, six_event: CricketEvent, llm_client: LLMClient) -> None:
+    @pytest.mark.llm_prefetch(("six_event", BENAUD))
+    def test_six_is_brief(self, six_event: CricketEvent, engine: CommentaryEngine) -> None:
         """Benaud + SIX should produce <= 5 words."""
-        engine = CommentaryEngine(use_llm=True, llm_client=llm_client)
         result = engine.generate(six_event, BENAUD)
 
         word_count = len(result.text.split()) if result.text else 0
@@ -173,9 +377,9 @@ class TestGreigLLMGeneration:
     Greig should be more expressive and dramatic.
     """
 
-    def test_six_is_enthusiastic(self, six_event: CricketEvent, llm_client: LLMClient) -> None:
+    @pytest.mark.llm_prefetch(("six_event", GREIG))
+    def test_six_is_enthusiastic(self, six_event: CricketEvent, engine: CommentaryEngine) -> None:
         """Greig + SIX should be more verbose than Benaud."""
-        engine = CommentaryEngine(use_llm=True, llm_client=llm_client)
         result = engine.generate(six_event, GREIG)
 
         word_count = len(result.text.split()) if result.text else 0
@@ -188,10 +392,9 @@ class TestGreigLLMGeneration:
 class TestDifferentPersonasSameEvent:
     """Test that different personas produce different styles for the same event."""
 
-    def test_wicket_different_styles(self, wicket_event: CricketEvent, llm_client: LLMClient) -> None:
+    @pytest.mark.llm_prefetch(("wicket_event", BENAUD), ("wicket_event", GREIG))
+    def test_wicket_different_styles(self, wicket_event: CricketEvent, engine: CommentaryEngine) -> None:
         """Same wicket event should produce different commentary for different personas."""
-        engine = CommentaryEngine(use_llm=True, llm_client=llm_client)
-
         benaud_result = engine.generate(wicket_event, BENAUD)
         greig_result = engine.generate(wicket_event, GREIG)
 
@@ -209,9 +412,9 @@ class TestDifferentPersonasSameEvent:
 class TestTokenUsage:
     """Test token usage tracking."""
 
-    def test_tracks_token_usage(self, wicket_event: CricketEvent, llm_client: LLMClient) -> None:
+    @pytest.mark.llm_prefetch(("wicket_event", BENAUD))
+    def test_tracks_token_usage(self, wicket_event: CricketEvent, engine: CommentaryEngine) -> None:
         """Commentary should track token usage."""
-        engine = CommentaryEngine(use_llm=True, llm_client=llm_client)
         result = engine.generate(wicket_event, BENAUD)
 
         assert result.llm_response is not None
@@ -224,12 +427,11 @@ class TestTokenUsage:
 class TestFallbackBehavior:
     """Test fallback to templates when LLM is disabled."""
 
-    def test_template_fallback(self, wicket_event: CricketEvent) -> None:
+    def test_template_fallback(self, wicket_event: CricketEvent, template_engine: CommentaryEngine) -> None:
         """When use_llm=False, should use templates."""
-        engine = CommentaryEngine(use_llm=False)
-        result = engine.generate(wicket_event, BENAUD)
+        result = template_engine.generate(wicket_event, BENAUD)
 
         assert result.used_llm is False
         assert result.llm_response is None
-        # Benaud's template response for wicket is "Gone."
+        # Benaud's template response for wicket is the persona's own "Gone."
         assert result.text == "Gone."
@@ -1,6 +1,8 @@
 """Tests for the Cricket parser module."""
 
+from itertools import pairwise
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
@@ -13,7 +15,21 @@ from suksham_vachak.parser import (
     MatchInfo,
 )
 
-SAMPLE_DATA_DIR = Path(__file__).parent.parent / "data" / "cricsheet_sample"
+
+@pytest.fixture(scope="session")
+def parsed_sample(sample_files: list[Path]) -> SimpleNamespace:
+    """Parse the first sample match once per session, with precomputed first-innings views."""
+    parser = CricsheetParser(sample_files[0])
+    events = tuple(parser.parse_innings(1))
+    return SimpleNamespace(
+        parser=parser,
+        events=events,
+        event_types=frozenset(e.event_type for e in events),
+        wicket_events=tuple(e for e in events if e.is_wicket),
+        final_event=events[-1] if events else None,
+        scores=tuple(e.match_context.current_score for e in events),
+        key_moments=tuple(parser.get_key_moments(1)),
+    )
 
 
 class TestEventType:
@@ -172,11 +188,8 @@ class TestCricsheetParser:
     """Tests for CricsheetParser class."""
 
     @pytest.fixture
-    def sample_match_path(self) -> Path:
+    def sample_match_path(self, sample_files: list[Path]) -> Path:
         """Get path to a sample match file."""
-        sample_files = list(SAMPLE_DATA_DIR.glob("*.json"))
-        if not sample_files:
-            pytest.skip("No sample data files found")
         return sample_files[0]
 
     def test_parser_initialization(self, sample_match_path: Path) -> None:
@@ -194,54 +207,39 @@ class TestCricsheetParser:
         assert info.venue is not None
         assert info.format in list(MatchFormat)
 
-    def test_parse_innings_yields_events(self, sample_match_path: Path) -> None:
+    def test_parse_innings_yields_events(self, parsed_sample: SimpleNamespace) -> None:
         """Test that parsing innings yields CricketEvent objects."""
-        parser = CricsheetParser(sample_match_path)
-        events = list(parser.parse_innings(1))
+        events = parsed_sample.events
 
         assert len(events) > 0
         assert all(isinstance(e, CricketEvent) for e in events)
 
-    def test_event_types_are_correct(self, sample_match_path: Path) -> None:
+    def test_event_types_are_correct(self, parsed_sample: SimpleNamespace) -> None:
         """Test that event types are correctly determined."""
-        parser = CricsheetParser(sample_match_path)
-        events = list(parser.parse_innings(1))
-
         # Should have a mix of event types
-        event_types = {e.event_type for e in events}
-        assert EventType.DOT_BALL in event_types or len(events) > 0
+        assert EventType.DOT_BALL in parsed_sample.event_types or len(parsed_sample.events) > 0
 
-    def test_running_score_increases(self, sample_match_path: Path) -> None:
+    def test_running_score_increases(self, parsed_sample: SimpleNamespace) -> None:
         """Test that running score correctly increases."""
-        parser = CricsheetParser(sample_match_path)
-        events = list(parser.parse_innings(1))
-
         # Score should never decrease
-        prev_score = 0
-        for event in events:
-            assert event.match_context.current_score >= prev_score
-            prev_score = event.match_context.current_score
+        assert all(prev <= curr for prev, curr in pairwise((0, *parsed_sample.scores)))
 
-    def test_get_key_moments(self, sample_match_path: Path) -> None:
+    def test_get_key_moments(self, parsed_sample: SimpleNamespace) -> None:
         """Test key moments extraction."""
-        parser = CricsheetParser(sample_match_path)
-        key_moments = parser.get_key_moments(1)
-
         # All key moments should be wickets or boundaries
-        for event in key_moments:
-            is_key = event.is_wicket or event.is_boundary or event.match_context.current_score % 50 == 0
-            assert is_key, f"Non-key event found: {event.description}"
+        non_key = [
+            event.description
+            for event in parsed_sample.key_moments
+            if not (event.is_wicket or event.is_boundary or event.match_context.current_score % 50 == 0)
+        ]
+        assert not non_key, f"Non-key events found: {non_key}"
 
 
 class TestParserWithRealData:
     """Integration tests with real Cricsheet data."""
 
-    def test_parse_all_sample_files(self) -> None:
+    def test_parse_all_sample_files(self, sample_files: list[Path]) -> None:
         """Test that all sample files can be parsed without errors."""
-        sample_files = list(SAMPLE_DATA_DIR.glob("*.json"))
-        if not sample_files:
-            pytest.skip("No sample data files found")
-
         for file_path in sample_files[:5]:  # Test first 5 files
             parser = CricsheetParser(file_path)
             info = parser.match_info
@@ -250,16 +248,8 @@ class TestParserWithRealData:
             assert info.match_id == file_path.stem
             assert len(events) > 0, f"No events parsed from {file_path.name}"
 
-    def test_wicket_count_matches_events(self) -> None:
+    def test_wicket_count_matches_events(self, parsed_sample: SimpleNamespace) -> None:
         """Test that wicket count matches wicket events."""
-        sample_files = list(SAMPLE_DATA_DIR.glob("*.json"))
-        if not sample_files:
-            pytest.skip("No sample data files found")
-
-        parser = CricsheetParser(sample_files[0])
-        events = list(parser.parse_innings(1))
-
-        if events:
-            final_event = events[-1]
-            wicket_events = [e for e in events if e.is_wicket]
-            assert final_event.match_context.current_wickets == len(wicket_events)
+        final_event = parsed_sample.final_event
+        if final_event is not None:
+            assert final_event.match_context.current_wickets == len(parsed_sample.wicket_events)
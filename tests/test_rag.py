@@ -81,6 +81,17 @@ class TestCricketMoment:
 
         assert text == "Custom embedding text for Sachin"
 
+    def test_to_embedding_text_is_cached(self):
+        """Test that the composite text is built once and reused."""
+        moment = CricketMoment(
+            moment_id="test_4",
+            source=MomentSource.CRICSHEET,
+            primary_player="Virat Kohli",
+            description="Kohli reaches his century",
+        )
+
+        assert moment.to_embedding_text() is moment.to_embedding_text()
+
     def test_to_metadata(self):
         """Test metadata conversion for ChromaDB."""
         moment = CricketMoment(
@@ -1,9 +1,13 @@
 """Tests for the stats engine module."""
 
+import sqlite3
+from dataclasses import FrozenInstanceError, replace
+from unittest.mock import patch
+
 import pytest
 
 from suksham_vachak.stats.aggregator import MatchupAccumulator
-from suksham_vachak.stats.db import StatsDatabase
+from suksham_vachak.stats.db import COLUMNAR_FIELDS, MATCHUP_COLUMNS, MATCHUP_INDEXES, StatsDatabase
 from suksham_vachak.stats.form import FormEngine
 from suksham_vachak.stats.matchups import MatchupEngine
 from suksham_vachak.stats.models import MatchPerformance, MatchupRecord, PhaseStats, PlayerMatchupStats, RecentForm
@@ -14,27 +18,29 @@ from suksham_vachak.stats.phases import Phase, PhaseEngine
 class TestNormalization:
     """Test player name normalization functions."""
 
-    def test_normalize_basic(self):
-        """Test basic name normalization."""
-        assert normalize_player_id("V Kohli") == "v_kohli"
-        assert normalize_player_id("Virat Kohli") == "virat_kohli"
-
-    def test_normalize_with_periods(self):
-        """Test normalization removes periods."""
-        assert normalize_player_id("M.S. Dhoni") == "ms_dhoni"
-        assert normalize_player_id("J.M. Anderson") == "jm_anderson"
-
-    def test_normalize_with_apostrophe(self):
-        """Test normalization removes apostrophes."""
-        assert normalize_player_id("D'Arcy Short") == "darcy_short"
-
-    def test_normalize_multiple_spaces(self):
-        """Test normalization handles multiple spaces."""
-        assert normalize_player_id("Shaheen  Shah   Afridi") == "shaheen_shah_afridi"
-
-    def test_normalize_empty(self):
-        """Test normalization of empty string."""
-        assert normalize_player_id("") == ""
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("V Kohli", "v_kohli"),
+            ("Virat Kohli", "virat_kohli"),
+            # Periods and apostrophes are removed
+            ("M.S. Dhoni", "ms_dhoni"),
+            ("J.M. Anderson", "jm_anderson"),
+            ("D'Arcy Short", "darcy_short"),
+            # Unicode punctuation is removed, letters are kept
+            ("D\u2019Arcy Short", "darcy_short"),
+            ("Smíth-Jones", "smíthjones"),
+            ("Shaheen  Shah   Afridi", "shaheen_shah_afridi"),
+            ("", ""),
+        ],
+    )
+    def test_normalize(self, raw, expected):
+        """Test player ID normalization."""
+        assert normalize_player_id(raw) == expected
+
+    def test_normalize_interns_ids(self):
+        """Test equal IDs from different spellings are the same object."""
+        assert normalize_player_id("V. Kohli") is normalize_player_id("V  Kohli")
 
     def test_display_name_cleanup(self):
         """Test display name cleanup."""
@@ -42,25 +48,43 @@ class TestNormalization:
         assert normalize_display_name("Multiple   Spaces") == "Multiple Spaces"
 
 
+_STATS_STANDARD = PlayerMatchupStats(
+    batter_id="v_kohli",
+    batter_name="V Kohli",
+    bowler_id="jm_anderson",
+    bowler_name="JM Anderson",
+    matches=5,
+    balls_faced=100,
+    runs_scored=150,
+    dismissals=3,
+    dots=40,
+    fours=10,
+    sixes=5,
+)
+
+
 class TestPlayerMatchupStats:
     """Test PlayerMatchupStats calculations."""
 
-    def test_strike_rate(self):
-        """Test strike rate calculation."""
-        stats = PlayerMatchupStats(
-            batter_id="v_kohli",
-            batter_name="V Kohli",
-            bowler_id="jm_anderson",
-            bowler_name="JM Anderson",
-            matches=5,
-            balls_faced=100,
-            runs_scored=150,
-            dismissals=2,
-            dots=30,
-            fours=10,
-            sixes=5,
-        )
-        assert stats.strike_rate == 150.0
+    @pytest.mark.parametrize(
+        "attr,expected",
+        [
+            ("strike_rate", 150.0),
+            ("average", 50.0),
+            ("dot_percentage", 40.0),
+            ("boundary_percentage", 15.0),
+        ],
+    )
+    def test_derived_stats(self, attr, expected):
+        """Test strike rate, average, dot and boundary percentages."""
+        assert getattr(_STATS_STANDARD, attr) == expected
+
+    def test_frozen_and_hashable(self):
+        """Test stats are immutable and deduplicate in sets."""
+        stats = _STATS_STANDARD
+        assert len({stats, replace(stats)}) == 1
+        with pytest.raises(FrozenInstanceError):
+            stats.runs_scored = 0
 
     def test_strike_rate_zero_balls(self):
         """Test strike rate with zero balls faced."""
@@ -79,90 +103,14 @@ class TestPlayerMatchupStats:
         )
         assert stats.strike_rate == 0.0
 
-    def test_average(self):
-        """Test batting average calculation."""
-        stats = PlayerMatchupStats(
-            batter_id="v_kohli",
-            batter_name="V Kohli",
-            bowler_id="jm_anderson",
-            bowler_name="JM Anderson",
-            matches=5,
-            balls_faced=100,
-            runs_scored=150,
-            dismissals=3,
-            dots=30,
-            fours=10,
-            sixes=5,
-        )
-        assert stats.average == 50.0
-
     def test_average_not_out(self):
         """Test average when never dismissed."""
-        stats = PlayerMatchupStats(
-            batter_id="v_kohli",
-            batter_name="V Kohli",
-            bowler_id="jm_anderson",
-            bowler_name="JM Anderson",
-            matches=3,
-            balls_faced=50,
-            runs_scored=75,
-            dismissals=0,
-            dots=10,
-            fours=5,
-            sixes=2,
-        )
+        stats = replace(_STATS_STANDARD, dismissals=0)
         assert stats.average == float("inf")
 
-    def test_dot_percentage(self):
-        """Test dot ball percentage calculation."""
-        stats = PlayerMatchupStats(
-            batter_id="v_kohli",
-            batter_name="V Kohli",
-            bowler_id="jm_anderson",
-            bowler_name="JM Anderson",
-            matches=5,
-            balls_faced=100,
-            runs_scored=150,
-            dismissals=2,
-            dots=40,
-            fours=10,
-            sixes=5,
-        )
-        assert stats.dot_percentage == 40.0
-
-    def test_boundary_percentage(self):
-        """Test boundary percentage calculation."""
-        stats = PlayerMatchupStats(
-            batter_id="v_kohli",
-            batter_name="V Kohli",
-            bowler_id="jm_anderson",
-            bowler_name="JM Anderson",
-            matches=5,
-            balls_faced=100,
-            runs_scored=150,
-            dismissals=2,
-            dots=30,
-            fours=10,
-            sixes=5,
-        )
-        assert stats.boundary_percentage == 15.0
-
     def test_to_commentary_context(self):
         """Test commentary context generation."""
-        stats = PlayerMatchupStats(
-            batter_id="v_kohli",
-            batter_name="V Kohli",
-            bowler_id="jm_anderson",
-            bowler_name="JM Anderson",
-            matches=5,
-            balls_faced=100,
-            runs_scored=150,
-            dismissals=3,
-            dots=30,
-            fours=10,
-            sixes=5,
-        )
-        context = stats.to_commentary_context()
+        context = _STATS_STANDARD.to_commentary_context()
         assert "V Kohli vs JM Anderson" in context
         assert "150 runs" in context
         assert "100 balls" in context
@@ -170,24 +118,78 @@ class TestPlayerMatchupStats:
 
     def test_to_short_context(self):
         """Test short context generation."""
-        stats = PlayerMatchupStats(
-            batter_id="v_kohli",
-            batter_name="V Kohli",
-            bowler_id="jm_anderson",
-            bowler_name="JM Anderson",
-            matches=5,
-            balls_faced=100,
-            runs_scored=150,
-            dismissals=3,
-            dots=30,
-            fours=10,
-            sixes=5,
-        )
-        context = stats.to_short_context()
+        context = _STATS_STANDARD.to_short_context()
         assert "V Kohli vs JM Anderson" in context
         assert "150/100" in context
 
 
+_MATCHUP_RECORDS = (
+    MatchupRecord(
+        batter_id="v_kohli",
+        batter_name="V Kohli",
+        bowler_id="jm_anderson",
+        bowler_name="JM Anderson",
+        match_id="m1",
+        match_date="2024-01-01",
+        match_format="Test",
+        venue="Lord's",
+        balls_faced=30,
+        runs_scored=45,
+        dots=12,
+        fours=4,
+        sixes=1,
+        dismissals=1,
+        dismissal_type="caught",
+    ),
+    MatchupRecord(
+        batter_id="v_kohli",
+        batter_name="V Kohli",
+        bowler_id="jm_anderson",
+        bowler_name="JM Anderson",
+        match_id="m2",
+        match_date="2024-02-01",
+        match_format="Test",
+        venue="Oval",
+        balls_faced=25,
+        runs_scored=40,
+        dots=8,
+        fours=5,
+        sixes=0,
+        dismissals=0,
+        dismissal_type=None,
+    ),
+    MatchupRecord(
+        batter_id="v_kohli",
+        batter_name="V Kohli",
+        bowler_id="s_broad",
+        bowler_name="S Broad",
+        match_id="m1",
+        match_date="2024-01-01",
+        match_format="Test",
+        venue="Lord's",
+        balls_faced=20,
+        runs_scored=30,
+        dots=6,
+        fours=3,
+        sixes=1,
+        dismissals=0,
+        dismissal_type=None,
+    ),
+)
+
+
+@pytest.fixture
+def empty_db(db_factory):
+    """Fresh empty database for tests that write."""
+    return db_factory()
+
+
+@pytest.fixture(scope="session")
+def schema_db(db_factory):
+    """Shared empty database for read-only schema checks."""
+    return db_factory()
+
+
 class TestStatsDatabase:
     """Test SQLite database operations."""
 
@@ -198,167 +200,141 @@ class TestStatsDatabase:
         assert db.get_player_count() == 0
         assert db.get_matchup_count() == 0
 
-    def test_upsert_player(self):
+    def test_initialize_creates_lookup_indexes(self, schema_db):
+        """Test phase and form lookups are served by indexes."""
+        with schema_db._connection() as conn:
+            indexes = {row["name"] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT SUM(balls_faced) FROM matchups WHERE batter_id = ? AND phase = ?",
+                ("v_kohli", "powerplay"),
+            ).fetchall()
+        assert {"idx_matchups_pair", "idx_matchups_phase", "idx_matchups_batter_date"} <= indexes
+        assert "idx_matchups_phase" in plan[0]["detail"]
+
+    def test_memory_pragmas(self, schema_db):
+        """Test in-memory databases skip durability work."""
+        with schema_db._connection() as conn:
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 0
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+
+    def test_upsert_player(self, empty_db):
         """Test player upsert."""
-        db = StatsDatabase(":memory:")
-        db.initialize()
+        empty_db.upsert_player("v_kohli", "V Kohli", "Virat Kohli", "India")
+        assert empty_db.get_player_count() == 1
+        assert empty_db.get_player_name("v_kohli") == "V Kohli"
 
-        db.upsert_player("v_kohli", "V Kohli", "Virat Kohli", "India")
-        assert db.get_player_count() == 1
-        assert db.get_player_name("v_kohli") == "V Kohli"
-
-    def test_add_matchup_record(self):
+    def test_add_matchup_record(self, empty_db):
         """Test adding a matchup record."""
-        db = StatsDatabase(":memory:")
-        db.initialize()
+        empty_db.add_matchup_record(_MATCHUP_RECORDS[0])
 
-        record = MatchupRecord(
-            batter_id="v_kohli",
-            batter_name="V Kohli",
-            bowler_id="jm_anderson",
-            bowler_name="JM Anderson",
-            match_id="m123",
-            match_date="2024-01-01",
-            match_format="Test",
-            venue="Lord's",
-            balls_faced=20,
-            runs_scored=35,
-            dots=8,
-            fours=3,
-            sixes=1,
-            dismissals=1,
-            dismissal_type="caught",
-        )
+        assert empty_db.get_player_count() == 2
+        assert empty_db.get_matchup_count() == 1
 
-        db.add_matchup_record(record)
+    def test_add_matchup_records_batch(self, empty_db):
+        """Test batch adding matchup records."""
+        empty_db.add_matchup_records_batch(list(_MATCHUP_RECORDS))
 
-        assert db.get_player_count() == 2
-        assert db.get_matchup_count() == 1
+        assert empty_db.get_player_count() == 3
+        assert empty_db.get_matchup_count() == len(_MATCHUP_RECORDS)
 
-    def test_add_matchup_records_batch(self):
-        """Test batch adding matchup records."""
-        db = StatsDatabase(":memory:")
-        db.initialize()
+    def test_add_matchup_records_batch_last_name_wins(self, empty_db):
+        """Test a player repeated in a batch is stored once, under the last name seen."""
+        renamed = replace(_MATCHUP_RECORDS[1], batter_name="Virat Kohli")
+        empty_db.add_matchup_records_batch([_MATCHUP_RECORDS[0], renamed])
 
-        records = [
-            MatchupRecord(
-                batter_id="v_kohli",
-                batter_name="V Kohli",
-                bowler_id="jm_anderson",
-                bowler_name="JM Anderson",
-                match_id="m1",
-                match_date="2024-01-01",
-                match_format="Test",
-                venue="Lord's",
-                balls_faced=20,
-                runs_scored=35,
-                dots=8,
-                fours=3,
-                sixes=1,
-                dismissals=0,
-                dismissal_type=None,
-            ),
-            MatchupRecord(
-                batter_id="v_kohli",
-                batter_name="V Kohli",
-                bowler_id="s_broad",
-                bowler_name="S Broad",
-                match_id="m1",
-                match_date="2024-01-01",
-                match_format="Test",
-                venue="Lord's",
-                balls_faced=15,
-                runs_scored=22,
-                dots=5,
-                fours=2,
-                sixes=0,
-                dismissals=1,
-                dismissal_type="bowled",
-            ),
-        ]
+        assert empty_db.get_player_count() == 2
+        assert empty_db.get_player_name("v_kohli") == "Virat Kohli"
+
+    def test_as_row_matches_insert_columns(self):
+        """Test as_row() yields values in INSERT column order."""
+        record = _MATCHUP_RECORDS[0]
+        assert record.as_row() == tuple(getattr(record, name) for name in MATCHUP_COLUMNS)
+
+    def test_add_matchup_records_batch_rolls_back(self, empty_db):
+        """Test a failing row leaves no players or matchups behind."""
+        bad = replace(_MATCHUP_RECORDS[0], match_id=None)
+        with pytest.raises(sqlite3.IntegrityError):
+            empty_db.add_matchup_records_batch([_MATCHUP_RECORDS[1], bad])
+
+        assert empty_db.get_player_count() == 0
+        assert empty_db.get_matchup_count() == 0
+
+    def test_add_matchup_records_columnar(self, empty_db):
+        """Test columnar insert stores the same rows as the record batch."""
+        columns = {name: [getattr(r, name) for r in _MATCHUP_RECORDS] for name in COLUMNAR_FIELDS}
+        empty_db.add_matchup_records_columnar(columns)
 
-        db.add_matchup_records_batch(records)
+        assert empty_db.get_player_count() == 3
+        assert empty_db.get_matchup_count() == len(_MATCHUP_RECORDS)
+        stats = MatchupEngine(empty_db).get_head_to_head("V Kohli", "JM Anderson")
+        assert stats is not None
+        assert stats.runs_scored == 85
 
-        assert db.get_player_count() == 3
-        assert db.get_matchup_count() == 2
+    def test_add_matchup_records_columnar_missing_column(self, empty_db):
+        """Test columnar insert rejects incomplete columns."""
+        with pytest.raises(ValueError, match="phase"):
+            empty_db.add_matchup_records_columnar({"batter_id": ["v_kohli"]})
+        assert empty_db.get_matchup_count() == 0
 
-    def test_clear(self):
+    def test_clear(self, empty_db):
         """Test clearing the database."""
-        db = StatsDatabase(":memory:")
-        db.initialize()
+        empty_db.upsert_player("v_kohli", "V Kohli")
+        assert empty_db.get_player_count() == 1
 
-        db.upsert_player("v_kohli", "V Kohli")
-        assert db.get_player_count() == 1
+        empty_db.clear()
+        assert empty_db.get_player_count() == 0
 
-        db.clear()
-        assert db.get_player_count() == 0
+    def test_bulk_load_rebuilds_indexes(self, empty_db):
+        """Test indexes are dropped during a bulk load and rebuilt after."""
 
+        def index_names():
+            with empty_db._connection() as conn:
+                return {row["name"] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
 
-class TestMatchupEngine:
-    """Test MatchupEngine queries."""
+        before = index_names()
+        with empty_db.bulk_load():
+            assert not index_names() & set(MATCHUP_INDEXES)
+            empty_db.add_matchup_records_batch(list(_MATCHUP_RECORDS))
 
-    @pytest.fixture
-    def db_with_data(self):
-        """Create a database with test data."""
-        db = StatsDatabase(":memory:")
+        assert index_names() == before
+        assert empty_db.get_matchup_count() == len(_MATCHUP_RECORDS)
+
+    def test_file_pragmas(self, tmp_path):
+        """Test file databases use WAL without a sync per commit."""
+        db = StatsDatabase(tmp_path / "stats.db")
         db.initialize()
+        with db._connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+
+    def test_shared_memory_uri(self):
+        """Test two databases on one shared-cache URI see each other's rows."""
+        uri = "file:test_shared_memory_uri?mode=memory&cache=shared"
+        writer = StatsDatabase(uri, uri=True)
+        writer.initialize()
+        writer.upsert_player("v_kohli", "V Kohli")
+
+        reader = StatsDatabase(uri, uri=True)
+        assert reader.get_player_name("v_kohli") == "V Kohli"
+
+    def test_clone_is_independent(self, empty_db):
+        """Test writes to a clone do not reach the source database."""
+        empty_db.upsert_player("v_kohli", "V Kohli")
+        copy = empty_db.clone()
+        copy.upsert_player("s_broad", "S Broad")
+
+        assert copy.get_player_count() == 2
+        assert empty_db.get_player_count() == 1
+
+
+@pytest.fixture(scope="session")
+def db_with_data(db_factory):
+    """Shared read-only database with test data."""
+    return db_factory(_MATCHUP_RECORDS)
 
-        records = [
-            MatchupRecord(
-                batter_id="v_kohli",
-                batter_name="V Kohli",
-                bowler_id="jm_anderson",
-                bowler_name="JM Anderson",
-                match_id="m1",
-                match_date="2024-01-01",
-                match_format="Test",
-                venue="Lord's",
-                balls_faced=30,
-                runs_scored=45,
-                dots=12,
-                fours=4,
-                sixes=1,
-                dismissals=1,
-                dismissal_type="caught",
-            ),
-            MatchupRecord(
-                batter_id="v_kohli",
-                batter_name="V Kohli",
-                bowler_id="jm_anderson",
-                bowler_name="JM Anderson",
-                match_id="m2",
-                match_date="2024-02-01",
-                match_format="Test",
-                venue="Oval",
-                balls_faced=25,
-                runs_scored=40,
-                dots=8,
-                fours=5,
-                sixes=0,
-                dismissals=0,
-                dismissal_type=None,
-            ),
-            MatchupRecord(
-                batter_id="v_kohli",
-                batter_name="V Kohli",
-                bowler_id="s_broad",
-                bowler_name="S Broad",
-                match_id="m1",
-                match_date="2024-01-01",
-                match_format="Test",
-                venue="Lord's",
-                balls_faced=20,
-                runs_scored=30,
-                dots=6,
-                fours=3,
-                sixes=1,
-                dismissals=0,
-                dismissal_type=None,
-            ),
-        ]
 
-        db.add_matchup_records_batch(records)
-        return db
+class TestMatchupEngine:
+    """Test MatchupEngine queries."""
 
     def test_get_head_to_head(self, db_with_data):
         """Test head-to-head query."""
@@ -380,6 +356,68 @@ class TestMatchupEngine:
         stats = engine.get_head_to_head("Unknown Player", "JM Anderson")
         assert stats is None
 
+    def test_get_head_to_head_zero_balls(self, db_factory):
+        """Test matchups with no legal deliveries are treated as missing."""
+        db = db_factory([replace(_MATCHUP_RECORDS[0], balls_faced=0, runs_scored=0)])
+
+        assert MatchupEngine(db).get_head_to_head("V Kohli", "JM Anderson") is None
+
+    def test_results_are_stats_with_name_fallbacks(self, db_factory):
+        """Test rows arrive as PlayerMatchupStats, naming unknown players from the query."""
+        db = db_factory(_MATCHUP_RECORDS)
+        with db._connection() as conn:
+            conn.execute("DELETE FROM players WHERE id = 'jm_anderson'")
+        engine = MatchupEngine(db)
+
+        stats = engine.get_head_to_head("v_kohli", "JM Anderson")
+        assert type(stats) is PlayerMatchupStats
+        assert (stats.batter_name, stats.bowler_name) == ("V Kohli", "JM Anderson")
+
+        matchups = engine.get_batter_vs_all("V Kohli", min_balls=10)
+        assert all(type(m) is PlayerMatchupStats for m in matchups)
+        assert [m.bowler_name for m in matchups] == ["jm_anderson", "S Broad"]
+
+    def test_head_to_head_cached_until_write(self, db_factory):
+        """Test repeat lookups reuse the result until the database changes."""
+        db = db_factory(_MATCHUP_RECORDS[:1])
+        engine = MatchupEngine(db)
+
+        stats = engine.get_head_to_head("V Kohli", "JM Anderson")
+        assert engine.get_head_to_head("V Kohli", "JM Anderson") is stats
+
+        db.add_matchup_record(_MATCHUP_RECORDS[1])
+        refreshed = engine.get_head_to_head("V Kohli", "JM Anderson")
+        assert refreshed is not None
+        assert refreshed.matches == 2
+
+    def test_head_to_head_cache_sees_other_process_writes(self, tmp_path):
+        """Test a commit from another connection to a file database drops cached matchups."""
+        db = StatsDatabase(tmp_path / "stats.db")
+        db.initialize()
+        db.add_matchup_record(_MATCHUP_RECORDS[0])
+        engine = MatchupEngine(db)
+        stats = engine.get_head_to_head("V Kohli", "JM Anderson")
+
+        # A second instance stands in for a separate ingest process
+        StatsDatabase(tmp_path / "stats.db").add_matchup_record(_MATCHUP_RECORDS[1])
+
+        refreshed = engine.get_head_to_head("V Kohli", "JM Anderson")
+        assert stats is not None
+        assert refreshed is not None
+        assert refreshed.matches == 2
+
+    def test_head_to_head_cache_is_bounded(self, db_factory):
+        """Test the head-to-head cache drops least recently used pairs."""
+        db = db_factory(_MATCHUP_RECORDS[:1])
+        with patch("suksham_vachak.stats.matchups.HEAD_TO_HEAD_CACHE_SIZE", 2):
+            engine = MatchupEngine(db)
+        stats = engine.get_head_to_head("V Kohli", "JM Anderson")
+        engine.get_head_to_head("V Kohli", "S Broad")
+        engine.get_head_to_head("V Kohli", "MA Wood")
+
+        assert engine._h2h_cache.cache_info().currsize == 2
+        assert engine.get_head_to_head("V Kohli", "JM Anderson") is not stats
+
     def test_get_batter_vs_all(self, db_with_data):
         """Test getting batter's stats against all bowlers."""
         engine = MatchupEngine(db_with_data)
@@ -467,11 +505,21 @@ class TestPhaseDetection:
         # Over 121 should be session2
         assert acc._determine_phase(120) == "session2"
 
+    def test_t20_beyond_scheduled_overs(self):
+        """Test overs past 20 stay in the death phase rather than wrapping."""
+        acc = MatchupAccumulator("m1", "2024-01-01", "T20", "Stadium")
+        assert acc._determine_phase(20) == "death"  # Over 21 (super over)
+
     def test_unknown_format(self):
         """Test unknown format returns None."""
         acc = MatchupAccumulator("m1", "2024-01-01", "Unknown", "Stadium")
         assert acc._determine_phase(5) is None
 
+    def test_accumulator_is_slotted(self):
+        """Test accumulators carry no per-instance __dict__."""
+        acc = MatchupAccumulator("m1", "2024-01-01", "T20", "Stadium")
+        assert not hasattr(acc, "__dict__")
+
 
 class TestPhaseStatsModel:
     """Test PhaseStats dataclass properties."""
@@ -609,77 +657,75 @@ class TestPhaseStatsModel:
         assert "Econ" in context
 
 
-class TestPhaseEngine:
-    """Test PhaseEngine queries."""
+_PHASE_RECORDS = (
+    # Kohli in powerplay - T20
+    MatchupRecord(
+        batter_id="v_kohli",
+        batter_name="V Kohli",
+        bowler_id="jm_anderson",
+        bowler_name="JM Anderson",
+        match_id="m1",
+        match_date="2024-01-01",
+        match_format="T20",
+        venue="Stadium",
+        balls_faced=20,
+        runs_scored=35,
+        dots=5,
+        fours=4,
+        sixes=2,
+        dismissals=0,
+        dismissal_type=None,
+        phase="powerplay",
+    ),
+    # Kohli in death - T20
+    MatchupRecord(
+        batter_id="v_kohli",
+        batter_name="V Kohli",
+        bowler_id="jm_anderson",
+        bowler_name="JM Anderson",
+        match_id="m1",
+        match_date="2024-01-01",
+        match_format="T20",
+        venue="Stadium",
+        balls_faced=10,
+        runs_scored=25,
+        dots=2,
+        fours=2,
+        sixes=2,
+        dismissals=1,
+        dismissal_type="caught",
+        phase="death",
+    ),
+    # Kohli in powerplay - match 2
+    MatchupRecord(
+        batter_id="v_kohli",
+        batter_name="V Kohli",
+        bowler_id="s_broad",
+        bowler_name="S Broad",
+        match_id="m2",
+        match_date="2024-01-15",
+        match_format="T20",
+        venue="Stadium",
+        balls_faced=15,
+        runs_scored=28,
+        dots=3,
+        fours=3,
+        sixes=1,
+        dismissals=0,
+        dismissal_type=None,
+        phase="powerplay",
+    ),
+)
+
+
+@pytest.fixture(scope="session")
+def db_with_phase_data(db_factory):
+    """Shared read-only database with phase-annotated test data."""
+    return db_factory(_PHASE_RECORDS)
 
-    @pytest.fixture
-    def db_with_phase_data(self):
-        """Create a database with phase-annotated test data."""
-        db = StatsDatabase(":memory:")
-        db.initialize()
-
-        records = [
-            # Kohli in powerplay - T20
-            MatchupRecord(
-                batter_id="v_kohli",
-                batter_name="V Kohli",
-                bowler_id="jm_anderson",
-                bowler_name="JM Anderson",
-                match_id="m1",
-                match_date="2024-01-01",
-                match_format="T20",
-                venue="Stadium",
-                balls_faced=20,
-                runs_scored=35,
-                dots=5,
-                fours=4,
-                sixes=2,
-                dismissals=0,
-                dismissal_type=None,
-                phase="powerplay",
-            ),
-            # Kohli in death - T20
-            MatchupRecord(
-                batter_id="v_kohli",
-                batter_name="V Kohli",
-                bowler_id="jm_anderson",
-                bowler_name="JM Anderson",
-                match_id="m1",
-                match_date="2024-01-01",
-                match_format="T20",
-                venue="Stadium",
-                balls_faced=10,
-                runs_scored=25,
-                dots=2,
-                fours=2,
-                sixes=2,
-                dismissals=1,
-                dismissal_type="caught",
-                phase="death",
-            ),
-            # Kohli in powerplay - match 2
-            MatchupRecord(
-                batter_id="v_kohli",
-                batter_name="V Kohli",
-                bowler_id="s_broad",
-                bowler_name="S Broad",
-                match_id="m2",
-                match_date="2024-01-15",
-                match_format="T20",
-                venue="Stadium",
-                balls_faced=15,
-                runs_scored=28,
-                dots=3,
-                fours=3,
-                sixes=1,
-                dismissals=0,
-                dismissal_type=None,
-                phase="powerplay",
-            ),
-        ]
 
-        db.add_matchup_records_batch(records)
-        return db
+class TestPhaseEngine:
+    """Test PhaseEngine queries."""
 
     def test_get_phase_performance(self, db_with_phase_data):
         """Test getting phase performance."""
@@ -717,6 +763,16 @@ class TestPhaseEngine:
         # middle phase not in test data
         assert "middle" not in phases
 
+    def test_get_all_phases_matches_single_phase(self, db_with_phase_data):
+        """Test the grouped query agrees with per-phase lookups."""
+        engine = PhaseEngine(db_with_phase_data)
+
+        for role, player in (("batter", "V Kohli"), ("bowler", "JM Anderson")):
+            phases = engine.get_all_phases(player, "T20", role=role)
+            assert list(phases) == [p for p in ("powerplay", "middle", "death") if p in phases]
+            for phase, stats in phases.items():
+                assert stats == engine.get_phase_performance(player, phase, "T20", role=role)
+
 
 class TestRecentFormModel:
     """Test RecentForm dataclass."""
@@ -727,7 +783,7 @@ class TestRecentFormModel:
             player_id="v_kohli",
             player_name="V Kohli",
             role="batter",
-            matches=[],
+            matches=(),
             total_runs=150,
             total_balls=100,
             total_dismissals=3,
@@ -742,7 +798,7 @@ class TestRecentFormModel:
             player_id="v_kohli",
             player_name="V Kohli",
             role="batter",
-            matches=[],
+            matches=(),
             total_runs=0,
             total_balls=0,
             total_dismissals=0,
@@ -757,7 +813,7 @@ class TestRecentFormModel:
             player_id="v_kohli",
             player_name="V Kohli",
             role="batter",
-            matches=[],
+            matches=(),
             total_runs=150,
             total_balls=100,
             total_dismissals=3,
@@ -798,135 +854,163 @@ class TestRecentFormModel:
         assert "improving" in context
 
 
-class TestFormEngine:
-    """Test FormEngine queries and trend detection."""
-
-    @pytest.fixture
-    def db_with_form_data(self):
-        """Create database with data for form analysis."""
-        db = StatsDatabase(":memory:")
-        db.initialize()
+# 6 matches with varying performance (newest first by date)
+_FORM_RECORDS = (
+    # Match 6 - Most recent, high score
+    MatchupRecord(
+        batter_id="v_kohli",
+        batter_name="V Kohli",
+        bowler_id="b1",
+        bowler_name="Bowler 1",
+        match_id="m6",
+        match_date="2024-06-01",
+        match_format="T20",
+        venue="Stadium",
+        balls_faced=30,
+        runs_scored=55,
+        dots=5,
+        fours=6,
+        sixes=2,
+        dismissals=0,
+        dismissal_type=None,
+        phase="powerplay",
+    ),
+    # Match 5
+    MatchupRecord(
+        batter_id="v_kohli",
+        batter_name="V Kohli",
+        bowler_id="b2",
+        bowler_name="Bowler 2",
+        match_id="m5",
+        match_date="2024-05-01",
+        match_format="T20",
+        venue="Stadium",
+        balls_faced=28,
+        runs_scored=50,
+        dots=6,
+        fours=5,
+        sixes=2,
+        dismissals=1,
+        dismissal_type="caught",
+        phase="middle",
+    ),
+    # Match 4
+    MatchupRecord(
+        batter_id="v_kohli",
+        batter_name="V Kohli",
+        bowler_id="b1",
+        bowler_name="Bowler 1",
+        match_id="m4",
+        match_date="2024-04-01",
+        match_format="T20",
+        venue="Stadium",
+        balls_faced=25,
+        runs_scored=42,
+        dots=7,
+        fours=4,
+        sixes=1,
+        dismissals=0,
+        dismissal_type=None,
+        phase="death",
+    ),
+    # Match 3 - Older, lower score
+    MatchupRecord(
+        batter_id="v_kohli",
+        batter_name="V Kohli",
+        bowler_id="b3",
+        bowler_name="Bowler 3",
+        match_id="m3",
+        match_date="2024-03-01",
+        match_format="T20",
+        venue="Stadium",
+        balls_faced=30,
+        runs_scored=25,
+        dots=12,
+        fours=2,
+        sixes=0,
+        dismissals=1,
+        dismissal_type="bowled",
+        phase="powerplay",
+    ),
+    # Match 2
+    MatchupRecord(
+        batter_id="v_kohli",
+        batter_name="V Kohli",
+        bowler_id="b2",
+        bowler_name="Bowler 2",
+        match_id="m2",
+        match_date="2024-02-01",
+        match_format="T20",
+        venue="Stadium",
+        balls_faced=28,
+        runs_scored=20,
+        dots=14,
+        fours=1,
+        sixes=0,
+        dismissals=1,
+        dismissal_type="lbw",
+        phase="middle",
+    ),
+    # Match 1 - Oldest
+    MatchupRecord(
+        batter_id="v_kohli",
+        batter_name="V Kohli",
+        bowler_id="b1",
+        bowler_name="Bowler 1",
+        match_id="m1",
+        match_date="2024-01-01",
+        match_format="T20",
+        venue="Stadium",
+        balls_faced=22,
+        runs_scored=18,
+        dots=10,
+        fours=1,
+        sixes=0,
+        dismissals=1,
+        dismissal_type="caught",
+        phase="death",
+    ),
+)
+
+# Six matches with consistent performance (SR ~133)
+_STABLE_FORM_RECORDS = tuple(
+    MatchupRecord(
+        batter_id="player",
+        batter_name="Player",
+        bowler_id="b1",
+        bowler_name="Bowler",
+        match_id=match_id,
+        match_date=match_date,
+        match_format="T20",
+        venue="Stadium",
+        balls_faced=30,
+        runs_scored=40,
+        dots=10,
+        fours=4,
+        sixes=1,
+        dismissals=1,
+        dismissal_type="caught",
+        phase="powerplay",
+    )
+    for match_id, match_date in (
+        ("m1", "2024-01-01"),
+        ("m2", "2024-02-01"),
+        ("m3", "2024-03-01"),
+        ("m4", "2024-04-01"),
+        ("m5", "2024-05-01"),
+        ("m6", "2024-06-01"),
+    )
+)
+
+
+@pytest.fixture(scope="session")
+def db_with_form_data(db_factory):
+    """Shared read-only database with data for form analysis."""
+    return db_factory(_FORM_RECORDS)
 
-        # Create 6 matches with varying performance (newest first by date)
-        records = [
-            # Match 6 - Most recent, high score
-            MatchupRecord(
-                batter_id="v_kohli",
-                batter_name="V Kohli",
-                bowler_id="b1",
-                bowler_name="Bowler 1",
-                match_id="m6",
-                match_date="2024-06-01",
-                match_format="T20",
-                venue="Stadium",
-                balls_faced=30,
-                runs_scored=55,
-                dots=5,
-                fours=6,
-                sixes=2,
-                dismissals=0,
-                dismissal_type=None,
-                phase="powerplay",
-            ),
-            # Match 5
-            MatchupRecord(
-                batter_id="v_kohli",
-                batter_name="V Kohli",
-                bowler_id="b2",
-                bowler_name="Bowler 2",
-                match_id="m5",
-                match_date="2024-05-01",
-                match_format="T20",
-                venue="Stadium",
-                balls_faced=28,
-                runs_scored=50,
-                dots=6,
-                fours=5,
-                sixes=2,
-                dismissals=1,
-                dismissal_type="caught",
-                phase="middle",
-            ),
-            # Match 4
-            MatchupRecord(
-                batter_id="v_kohli",
-                batter_name="V Kohli",
-                bowler_id="b1",
-                bowler_name="Bowler 1",
-                match_id="m4",
-                match_date="2024-04-01",
-                match_format="T20",
-                venue="Stadium",
-                balls_faced=25,
-                runs_scored=42,
-                dots=7,
-                fours=4,
-                sixes=1,
-                dismissals=0,
-                dismissal_type=None,
-                phase="death",
-            ),
-            # Match 3 - Older, lower score
-            MatchupRecord(
-                batter_id="v_kohli",
-                batter_name="V Kohli",
-                bowler_id="b3",
-                bowler_name="Bowler 3",
-                match_id="m3",
-                match_date="2024-03-01",
-                match_format="T20",
-                venue="Stadium",
-                balls_faced=30,
-                runs_scored=25,
-                dots=12,
-                fours=2,
-                sixes=0,
-                dismissals=1,
-                dismissal_type="bowled",
-                phase="powerplay",
-            ),
-            # Match 2
-            MatchupRecord(
-                batter_id="v_kohli",
-                batter_name="V Kohli",
-                bowler_id="b2",
-                bowler_name="Bowler 2",
-                match_id="m2",
-                match_date="2024-02-01",
-                match_format="T20",
-                venue="Stadium",
-                balls_faced=28,
-                runs_scored=20,
-                dots=14,
-                fours=1,
-                sixes=0,
-                dismissals=1,
-                dismissal_type="lbw",
-                phase="middle",
-            ),
-            # Match 1 - Oldest
-            MatchupRecord(
-                batter_id="v_kohli",
-                batter_name="V Kohli",
-                bowler_id="b1",
-                bowler_name="Bowler 1",
-                match_id="m1",
-                match_date="2024-01-01",
-                match_format="T20",
-                venue="Stadium",
-                balls_faced=22,
-                runs_scored=18,
-                dots=10,
-                fours=1,
-                sixes=0,
-                dismissals=1,
-                dismissal_type="caught",
-                phase="death",
-            ),
-        ]
 
-        db.add_matchup_records_batch(records)
-        return db
+class TestFormEngine:
+    """Test FormEngine queries and trend detection."""
 
     def test_get_recent_form(self, db_with_form_data):
         """Test getting recent form."""
@@ -944,6 +1028,65 @@ class TestFormEngine:
         form = engine.get_recent_form("Unknown Player")
         assert form is None
 
+    def test_get_recent_form_bowler(self, db_with_form_data):
+        """Test bowler form counts wickets across the window."""
+        engine = FormEngine(db_with_form_data, window_size=5)
+
+        form = engine.get_recent_form("b1", role="bowler")
+        assert form is not None
+        assert [m.match_id for m in form.matches] == ["m6", "m4", "m1"]
+        assert form.total_dismissals == 1
+        # Conceding more per ball in the latest match is declining for a bowler
+        assert form.trend == "declining"
+
+    def test_recent_form_cached_until_write(self, db_factory):
+        """Test repeat lookups reuse the result until the database changes."""
+        db = db_factory(_FORM_RECORDS[1:])
+        engine = FormEngine(db, window_size=5)
+
+        form = engine.get_recent_form("V Kohli")
+        assert engine.get_recent_form("V Kohli") is form
+
+        db.add_matchup_records_batch([_FORM_RECORDS[0]])
+        refreshed = engine.get_recent_form("V Kohli")
+        assert refreshed is not form
+        assert refreshed is not None
+        assert refreshed.matches[0].match_id == "m6"
+
+    def test_recent_form_cache_sees_other_process_writes(self, tmp_path):
+        """Test a commit from another connection to a file database drops cached form."""
+        db = StatsDatabase(tmp_path / "stats.db")
+        db.initialize()
+        db.add_matchup_records_batch(list(_FORM_RECORDS[1:]))
+        engine = FormEngine(db, window_size=5)
+        form = engine.get_recent_form("V Kohli")
+
+        # A second instance stands in for a separate ingest process
+        writer = StatsDatabase(tmp_path / "stats.db")
+        writer.add_matchup_records_batch([_FORM_RECORDS[0]])
+
+        refreshed = engine.get_recent_form("V Kohli")
+        assert refreshed is not form
+        assert refreshed is not None
+        assert refreshed.matches[0].match_id == "m6"
+
+    def test_recent_form_cache_is_bounded(self, db_with_form_data):
+        """Test the form cache drops least recently used entries."""
+        with patch("suksham_vachak.stats.form.RECENT_FORM_CACHE_SIZE", 1):
+            engine = FormEngine(db_with_form_data)
+
+        form = engine.get_recent_form("V Kohli")
+        engine.get_recent_form("b1", role="bowler")
+
+        assert engine._cache.cache_info().currsize == 1
+        assert engine.get_recent_form("V Kohli") is not form
+
+    def test_cached_form_matches_are_immutable(self, db_with_form_data):
+        """Test callers cannot mutate a cached result's match window."""
+        form = FormEngine(db_with_form_data).get_recent_form("V Kohli")
+        assert form is not None
+        assert isinstance(form.matches, tuple)
+
     def test_trend_improving(self, db_with_form_data):
         """Test improving trend detection."""
         engine = FormEngine(db_with_form_data, window_size=6)
@@ -953,34 +1096,9 @@ class TestFormEngine:
         assert form is not None
         assert form.trend == "improving"
 
-    def test_trend_stable(self):
+    def test_trend_stable(self, db_factory):
         """Test stable trend detection."""
-        db = StatsDatabase(":memory:")
-        db.initialize()
-
-        # Create matches with consistent performance
-        records = [
-            MatchupRecord(
-                batter_id="player",
-                batter_name="Player",
-                bowler_id="b1",
-                bowler_name="Bowler",
-                match_id=f"m{i}",
-                match_date=f"2024-0{i}-01",
-                match_format="T20",
-                venue="Stadium",
-                balls_faced=30,
-                runs_scored=40,  # Consistent SR ~133
-                dots=10,
-                fours=4,
-                sixes=1,
-                dismissals=1,
-                dismissal_type="caught",
-                phase="powerplay",
-            )
-            for i in range(1, 7)
-        ]
-        db.add_matchup_records_batch(records)
+        db = db_factory(_STABLE_FORM_RECORDS)
 
         engine = FormEngine(db, window_size=6)
         form = engine.get_recent_form("Player")
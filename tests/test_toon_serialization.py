@@ -1,5 +1,7 @@
 """Tests for TOON serialization module."""
 
+from dataclasses import replace
+from itertools import islice
 from pathlib import Path
 
 import pytest
@@ -23,13 +25,12 @@ from suksham_vachak.parser import (
     EventType,
     MatchContext,
     MatchFormat,
+    MatchInfo,
 )
 from suksham_vachak.serialization import CRICKET_TOON_SCHEMA, decode, encode_rich_context
 
-SAMPLE_DATA_DIR = Path(__file__).parent.parent / "data" / "cricsheet_sample"
 
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_match_context() -> MatchContext:
     """Create a sample match context."""
     return MatchContext(
@@ -48,7 +49,7 @@ def sample_match_context() -> MatchContext:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_event(sample_match_context: MatchContext) -> CricketEvent:
     """Create a sample cricket event."""
     return CricketEvent(
@@ -67,9 +68,13 @@ def sample_event(sample_match_context: MatchContext) -> CricketEvent:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_rich_context(sample_event: CricketEvent) -> RichContext:
-    """Create a sample RichContext for testing."""
+    """Create a sample RichContext for testing.
+
+    Module-scoped and shared, so tests must not modify it; variants are
+    built with dataclasses.replace.
+    """
     return RichContext(
         event=sample_event,
         match=MatchSituation(
@@ -145,16 +150,13 @@ class TestCricketToonSchema:
 
     def test_schema_includes_key_fields(self) -> None:
         """Test schema documentation includes key field abbreviations."""
-        assert "M=match" in CRICKET_TOON_SCHEMA
-        assert "B=batter" in CRICKET_TOON_SCHEMA
-        assert "W=bowler" in CRICKET_TOON_SCHEMA
-        assert "P=partnership" in CRICKET_TOON_SCHEMA
+        required = ("M=match", "B=batter", "W=bowler", "P=partnership")
+        assert [key for key in required if key not in CRICKET_TOON_SCHEMA] == []
 
     def test_schema_includes_example(self) -> None:
         """Test schema includes a readable example."""
-        assert "Example:" in CRICKET_TOON_SCHEMA
-        assert "teams" in CRICKET_TOON_SCHEMA
-        assert "score" in CRICKET_TOON_SCHEMA
+        required = ("Example:", "teams", "score")
+        assert [key for key in required if key not in CRICKET_TOON_SCHEMA] == []
 
 
 class TestEncodeRichContext:
@@ -254,6 +256,11 @@ class TestRichContextToToon:
         function_result = encode_rich_context(sample_rich_context)
         assert method_result == function_result
 
+    def test_renderings_are_cached(self, sample_rich_context: RichContext) -> None:
+        """Test repeat to_toon()/to_prompt_context() calls return the first rendering."""
+        assert sample_rich_context.to_toon() is sample_rich_context.to_toon()
+        assert sample_rich_context.to_prompt_context() is sample_rich_context.to_prompt_context()
+
 
 class TestTokenSavings:
     """Tests to verify TOON provides token savings.
@@ -262,19 +269,22 @@ class TestTokenSavings:
     because tokenizers break up verbose natural language more than compact formats.
     """
 
-    def test_toon_shorter_than_text(self, sample_rich_context: RichContext) -> None:
+    @pytest.fixture(scope="class")
+    def encoded_pair(self, sample_rich_context: RichContext) -> tuple[str, str]:
+        """TOON and plain-text renderings of the shared sample context."""
+        return sample_rich_context.to_toon(), sample_rich_context.to_prompt_context()
+
+    def test_toon_shorter_than_text(self, encoded_pair: tuple[str, str]) -> None:
         """Test TOON output is shorter than plain text output."""
-        toon_output = sample_rich_context.to_toon()
-        text_output = sample_rich_context.to_prompt_context()
+        toon_output, text_output = encoded_pair
 
         # TOON should be shorter (character savings will be less than token savings)
         # Actual token savings are typically 40-50% due to tokenizer behavior
         assert len(toon_output) < len(text_output)
 
-    def test_toon_fewer_words(self, sample_rich_context: RichContext) -> None:
+    def test_toon_fewer_words(self, encoded_pair: tuple[str, str]) -> None:
         """Test TOON has fewer words than plain text."""
-        toon_output = sample_rich_context.to_toon()
-        text_output = sample_rich_context.to_prompt_context()
+        toon_output, text_output = encoded_pair
 
         toon_words = len(toon_output.split())
         text_words = len(text_output.split())
@@ -286,20 +296,17 @@ class TestTokenSavings:
 class TestIntegrationWithRealData:
     """Integration tests using real Cricsheet data."""
 
-    @pytest.fixture
-    def sample_match_path(self) -> Path:
-        """Get path to a sample match file."""
-        sample_files = list(SAMPLE_DATA_DIR.glob("*.json"))
-        if not sample_files:
-            pytest.skip("No sample data files found")
-        return sample_files[0]
+    @pytest.fixture(scope="module")
+    def parsed_events(self, sample_files: list[Path]) -> tuple[MatchInfo, list[CricketEvent]]:
+        """Parse the first 20 deliveries once; tests build their own ContextBuilder."""
+        parser = CricsheetParser(sample_files[0])
+        return parser.match_info, list(islice(parser.parse_innings(1), 20))
 
-    def test_encode_real_match_context(self, sample_match_path: Path) -> None:
+    def test_encode_real_match_context(self, parsed_events: tuple[MatchInfo, list[CricketEvent]]) -> None:
         """Test encoding context from real match data."""
-        parser = CricsheetParser(sample_match_path)
-        builder = ContextBuilder(parser.match_info)
+        match_info, events = parsed_events
+        builder = ContextBuilder(match_info)
 
-        events = list(parser.parse_innings(1))
         if not events:
             pytest.skip("No events in match")
 
@@ -317,26 +324,18 @@ class TestIntegrationWithRealData:
         assert "B" in decoded
         assert "W" in decoded
 
-    def test_toon_savings_on_real_data(self, sample_match_path: Path) -> None:
+    def test_toon_savings_on_real_data(self, parsed_events: tuple[MatchInfo, list[CricketEvent]]) -> None:
         """Test TOON provides savings on real match data."""
-        parser = CricsheetParser(sample_match_path)
-        builder = ContextBuilder(parser.match_info)
+        match_info, events = parsed_events
+        builder = ContextBuilder(match_info)
 
-        events = list(parser.parse_innings(1))
         if len(events) < 20:
             pytest.skip("Not enough events in match")
 
         # Build context for multiple events and check savings
-        total_toon_len = 0
-        total_text_len = 0
-
-        for event in events[:20]:
-            context = builder.build(event)
-            toon_output = context.to_toon()
-            text_output = context.to_prompt_context()
-
-            total_toon_len += len(toon_output)
-            total_text_len += len(text_output)
+        contexts = [builder.build(event) for event in events[:20]]
+        total_toon_len = sum(len(context.to_toon()) for context in contexts)
+        total_text_len = sum(len(context.to_prompt_context()) for context in contexts)
 
         # TOON should be shorter than plain text (token savings are typically
         # higher than character savings due to tokenizer behavior)
@@ -346,34 +345,18 @@ class TestIntegrationWithRealData:
 class TestEdgeCases:
     """Tests for edge cases in TOON encoding."""
 
-    def test_encode_without_chase_context(self, sample_event: CricketEvent) -> None:
+    def test_encode_without_chase_context(self, sample_rich_context: RichContext) -> None:
         """Test encoding when not chasing (no target)."""
-        context = RichContext(
-            event=sample_event,
-            match=MatchSituation(
-                batting_team="India",
-                bowling_team="Australia",
+        context = replace(
+            sample_rich_context,
+            match=replace(
+                sample_rich_context.match,
                 innings_number=1,
-                total_runs=100,
-                total_wickets=2,
-                overs_completed=12.0,
-                phase=MatchPhase.MIDDLE_OVERS,
-                match_format="T20",
-                # No target, runs_required, required_rate, balls_remaining
-            ),
-            batter=BatterContext(name="V Kohli", runs_scored=45, balls_faced=30, strike_rate=150.0),
-            bowler=BowlerContext(name="P Cummins", overs_bowled=3.0, wickets=0, economy=8.0),
-            partnership=PartnershipContext(runs=50, balls=40),
-            recent=RecentEvents(),
-            narrative=NarrativeState(
-                current_storyline="India building",
-                tension_level=0.4,
-                momentum=MomentumState.BALANCED,
+                target=None,
+                runs_required=None,
+                required_rate=None,
+                balls_remaining=None,
             ),
-            pressure=PressureLevel.CALM,
-            pressure_score=0.3,
-            suggested_tone="neutral",
-            suggested_length="medium",
         )
 
         encoded = encode_rich_context(context)
@@ -384,51 +367,19 @@ class TestEdgeCases:
         assert "RRR" not in decoded["M"]
         assert "need" not in decoded["M"]
 
-    def test_encode_wicket_event(self, sample_match_context: MatchContext) -> None:
+    def test_encode_wicket_event(self, sample_rich_context: RichContext) -> None:
         """Test encoding a wicket event."""
-        wicket_event = CricketEvent(
-            event_id="test-wicket",
+        wicket_event = replace(
+            sample_rich_context.event,
             event_type=EventType.WICKET,
-            ball_number="10.3",
-            batter="S Smith",
-            bowler="J Bumrah",
-            non_striker="M Labuschagne",
             runs_batter=0,
-            runs_extras=0,
             runs_total=0,
             is_boundary=False,
             is_wicket=True,
             wicket_type="bowled",
-            wicket_player="S Smith",
-            match_context=sample_match_context,
-        )
-
-        context = RichContext(
-            event=wicket_event,
-            match=MatchSituation(
-                batting_team="Australia",
-                bowling_team="India",
-                innings_number=1,
-                total_runs=78,
-                total_wickets=3,
-                overs_completed=10.3,
-                phase=MatchPhase.MIDDLE_OVERS,
-                match_format="T20",
-            ),
-            batter=BatterContext(name="S Smith", runs_scored=23, balls_faced=18, strike_rate=127.78),
-            bowler=BowlerContext(name="J Bumrah", overs_bowled=2.3, wickets=2, economy=6.0),
-            partnership=PartnershipContext(runs=0, balls=0),
-            recent=RecentEvents(),
-            narrative=NarrativeState(
-                current_storyline="Bumrah strikes again!",
-                tension_level=0.8,
-                momentum=MomentumState.BOWLING_DOMINANT,
-            ),
-            pressure=PressureLevel.TENSE,
-            pressure_score=0.65,
-            suggested_tone="dramatic",
-            suggested_length="short",
+            wicket_player="V Kohli",
         )
+        context = replace(sample_rich_context, event=wicket_event)
 
         encoded = encode_rich_context(context)
         decoded = decode(encoded)
@@ -437,54 +388,11 @@ class TestEdgeCases:
         assert decoded["E"]["type"] == "wicket"
         assert decoded["E"]["wicket"] == "bowled"
 
-    def test_encode_hat_trick_ball(self, sample_match_context: MatchContext) -> None:
+    def test_encode_hat_trick_ball(self, sample_rich_context: RichContext) -> None:
         """Test encoding when bowler is on a hat-trick."""
-        event = CricketEvent(
-            event_id="test-hat-trick",
-            event_type=EventType.DOT_BALL,
-            ball_number="12.1",
-            batter="M Wade",
-            bowler="J Bumrah",
-            non_striker="A Zampa",
-            runs_batter=0,
-            runs_extras=0,
-            runs_total=0,
-            is_boundary=False,
-            is_wicket=False,
-            match_context=sample_match_context,
-        )
-
-        context = RichContext(
-            event=event,
-            match=MatchSituation(
-                batting_team="Australia",
-                bowling_team="India",
-                innings_number=1,
-                total_runs=98,
-                total_wickets=7,
-                overs_completed=12.1,
-                phase=MatchPhase.DEATH_OVERS,
-                match_format="T20",
-            ),
-            batter=BatterContext(name="M Wade", runs_scored=0, balls_faced=1, strike_rate=0.0),
-            bowler=BowlerContext(
-                name="J Bumrah",
-                overs_bowled=3.1,
-                wickets=4,
-                economy=5.5,
-                is_on_hat_trick=True,
-            ),
-            partnership=PartnershipContext(runs=0, balls=1),
-            recent=RecentEvents(),
-            narrative=NarrativeState(
-                current_storyline="Bumrah on a HAT-TRICK!",
-                tension_level=0.95,
-                momentum=MomentumState.BOWLING_DOMINANT,
-            ),
-            pressure=PressureLevel.CRITICAL,
-            pressure_score=0.92,
-            suggested_tone="tense",
-            suggested_length="short",
+        context = replace(
+            sample_rich_context,
+            bowler=replace(sample_rich_context.bowler, is_on_hat_trick=True),
         )
 
         encoded = encode_rich_context(context)
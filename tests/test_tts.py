@@ -4,9 +4,17 @@ These tests do NOT require API credentials and test the local logic
 for prosody control, SSML generation, and voice selection.
 """
 
+import os
+import threading
+import time
+from dataclasses import FrozenInstanceError
+from pathlib import Path
+from unittest.mock import patch
+
 import pytest
 
-from suksham_vachak.parser import CricketEvent, EventType, MatchContext
+from suksham_vachak.commentary import Commentary
+from suksham_vachak.parser import CricketEvent, EventType, MatchContext, MatchFormat
 from suksham_vachak.personas import BENAUD
 from suksham_vachak.personas.base import CommentaryStyle, Persona
 from suksham_vachak.tts import (
@@ -16,12 +24,19 @@ from suksham_vachak.tts import (
     ProsodyController,
     ProsodySettings,
     TTSConfig,
+    TTSEngine,
+    TTSError,
+    TTSResult,
     VoiceGender,
     VoiceInfo,
     generate_ssml,
 )
 from suksham_vachak.tts.azure import AzureTTSProvider
+from suksham_vachak.tts.base import persona_voice_key
+from suksham_vachak.tts.elevenlabs import ElevenLabsTTSProvider
 from suksham_vachak.tts.google import GoogleTTSProvider
+from suksham_vachak.tts.qwen3 import Qwen3TTSProvider
+from suksham_vachak.tts.svara import SvaraTTSProvider
 
 # ============================================================================
 # Test Fixtures
@@ -98,7 +113,7 @@ def verbose_persona() -> Persona:
         name="Tony Greig",
         style=CommentaryStyle.DRAMATIC,
         minimalism_score=0.2,
-        languages=["en"],
+        languages=("en",),
         speaking_rate=1.1,
         pitch=2.0,
     )
@@ -139,6 +154,11 @@ class TestProsodySettings:
         assert settings.pause_after_ms == 800
         assert settings.emphasis == "strong"
 
+    def test_shared_rules_are_frozen(self) -> None:
+        """Shared rule entries should not be modifiable in place."""
+        with pytest.raises(FrozenInstanceError):
+            EVENT_PROSODY_RULES[EventType.WICKET].pause_before_ms = 0
+
 
 # ============================================================================
 # Event Prosody Rules Tests
@@ -237,6 +257,46 @@ class TestProsodyController:
         assert "<speak>" in ssml_benaud
         assert "</speak>" in ssml_benaud
 
+    def test_repeated_text_hits_cache(self) -> None:
+        """Repeated text for the same persona and event should reuse cached SSML."""
+        controller = ProsodyController()
+        first = controller.apply_prosody("Four.", BENAUD, EventType.BOUNDARY_FOUR)
+        second = controller.apply_prosody("Four.", BENAUD, EventType.BOUNDARY_FOUR)
+
+        assert first == second == generate_ssml("Four.", BENAUD, EventType.BOUNDARY_FOUR)
+        assert controller.cache_info()["hits"] == 1
+        assert controller.cache_info()["misses"] == 1
+
+    def test_subclass_hooks_bypass_other_controllers_cache(self) -> None:
+        """A subclass overriding a render hook should not be served base-class SSML."""
+
+        class ShoutingController(ProsodyController):
+            def _escape_ssml(self, text: str) -> str:
+                return super()._escape_ssml(text).upper()
+
+        generate_ssml("Four.", BENAUD, EventType.BOUNDARY_FOUR)
+        assert "FOUR." in ShoutingController().apply_prosody("Four.", BENAUD, EventType.BOUNDARY_FOUR)
+
+    def test_new_text_reuses_markup_frame(self) -> None:
+        """New text for a known persona and event should only fill in the text."""
+        controller = ProsodyController()
+        ssml = controller.apply_prosody("Bowled him.", BENAUD, EventType.WICKET)
+
+        assert ssml == generate_ssml("Bowled him.", BENAUD, EventType.WICKET)
+        assert controller.apply_prosody("Timber!", BENAUD, EventType.WICKET) == ssml.replace("Bowled him.", "Timber!")
+        assert controller.cache_info()["misses"] == 2
+        assert controller.cache_info()["frame_hits"] == 1
+
+    def test_subclass_frame_hooks_are_used(self) -> None:
+        """Overriding the frame builder should change the markup around new text."""
+
+        class QuietController(ProsodyController):
+            def _ssml_frame(self, settings: ProsodySettings) -> tuple[str, str]:
+                return "<speak>", "</speak>"
+
+        generate_ssml("Bowled him.", BENAUD, EventType.WICKET)
+        assert QuietController().apply_prosody("Bowled him.", BENAUD, EventType.WICKET) == "<speak>Bowled him.</speak>"
+
 
 # ============================================================================
 # generate_ssml Convenience Function Tests
@@ -300,6 +360,15 @@ class TestVoiceInfo:
         assert "en-AU" in display
         assert "male" in display
 
+    def test_voice_info_frozen_and_hashable(self) -> None:
+        """Equal voices should deduplicate and reject modification."""
+        voice = VoiceInfo(voice_id="Ryan", name="Ryan", language="en", gender=VoiceGender.MALE)
+        same = VoiceInfo(voice_id="Ryan", name="Ryan", language="en", gender=VoiceGender.MALE)
+
+        assert len({voice, same}) == 1
+        with pytest.raises(FrozenInstanceError):
+            voice.name = "Aiden"
+
 
 # ============================================================================
 # AudioFormat Tests
@@ -351,6 +420,197 @@ class TestTTSConfig:
         assert config.audio_format == AudioFormat.WAV
         assert config.enable_cache is False
 
+    def test_cache_key_includes_provider_and_language(self, tmp_path: Path) -> None:
+        """Audio from different providers or languages should not share a cache entry."""
+        engine = TTSEngine(TTSConfig(cache_dir=str(tmp_path)))
+        args = ("Four!", "voice", EventType.BOUNDARY_FOUR, "Richie Benaud")
+
+        keys = {
+            engine._get_cache_key(*args, "qwen3", "en"),
+            engine._get_cache_key(*args, "svara", "en"),
+            engine._get_cache_key(*args, "qwen3", "hi"),
+        }
+        assert len(keys) == 3
+
+    def test_cache_stats_report_ssml_frame_reuse(self, tmp_path: Path) -> None:
+        """Cache stats should show new lines reusing the SSML frame for a persona and event."""
+        engine = TTSEngine(TTSConfig(cache_dir=str(tmp_path)))
+        for text in ("Bowled him.", "Timber!"):
+            engine._prosody_controller.apply_prosody(text, BENAUD, EventType.WICKET)
+
+        stats = engine.get_cache_stats()
+        assert stats["ssml_misses"] == 2
+        assert stats["ssml_frame_misses"] == 1
+        assert stats["ssml_frame_hits"] == 1
+
+    def test_bounded_cache_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        """A full bounded cache should drop the entries that were read least recently."""
+        engine = TTSEngine(TTSConfig(cache_dir=str(tmp_path), cache_max_files=3))
+        for name in ("first", "second", "third"):
+            engine._cache_audio(name, name.encode())
+        old = time.time() - 60
+        os.utime(tmp_path / "first.mp3", (old, old))
+        os.utime(tmp_path / "second.mp3", (old - 60, old - 60))
+        os.utime(tmp_path / "third.mp3", (old - 120, old - 120))
+
+        assert engine._get_cached_audio("second") == b"second"
+        engine._cache_audio("fourth", b"fourth")
+
+        # Trimmed to the low-water mark (2 of 3), not just back to the limit
+        assert engine._get_cached_audio("first") is None
+        assert engine._get_cached_audio("third") is None
+        assert engine._get_cached_audio("second") == b"second"
+        assert engine._get_cached_audio("fourth") == b"fourth"
+
+    def test_bounded_cache_overwrite_is_not_counted(self, tmp_path: Path) -> None:
+        """Rewriting an existing key should not count as a new cache file."""
+        engine = TTSEngine(TTSConfig(cache_dir=str(tmp_path), cache_max_files=2))
+        engine._cache_audio("first", b"1")
+        engine._cache_audio("first", b"1")
+        engine._cache_audio("second", b"2")
+
+        assert engine._cache_file_count == 2
+        assert engine._get_cached_audio("first") == b"1"
+
+
+# ============================================================================
+# TTSEngine Tests
+# ============================================================================
+
+
+def _over_events(event_types: tuple[EventType, ...]) -> list[CricketEvent]:
+    """Consecutive deliveries of one over in a second-innings chase."""
+    context = MatchContext(
+        match_id="test_match_001",
+        teams=("India", "Australia"),
+        venue="Wankhede",
+        date="2024-01-01",
+        format=MatchFormat.T20,
+        innings=2,
+        current_score=150,
+        current_wickets=3,
+        overs_completed=15.0,
+        target=190,
+    )
+    return [
+        CricketEvent(
+            event_id=f"evt_{i}",
+            event_type=event_type,
+            ball_number=f"15.{i + 1}",
+            batter="Virat Kohli",
+            bowler="Pat Cummins",
+            non_striker="Rohit Sharma",
+            runs_batter=0,
+            runs_extras=0,
+            runs_total=0,
+            is_boundary=False,
+            is_wicket=False,
+            match_context=context,
+        )
+        for i, event_type in enumerate(event_types)
+    ]
+
+
+class TestTTSEngine:
+    """Tests for TTSEngine orchestration (providers mocked)."""
+
+    def test_cache_hit_skips_provider_setup(self, tmp_path: Path) -> None:
+        """A cached clip should be served without constructing a TTS provider."""
+        event = _over_events((EventType.WICKET,))[0]
+        engine = TTSEngine(TTSConfig(cache_dir=str(tmp_path)))
+        persona = Persona(name="Sushil Doshi", style=CommentaryStyle.DRAMATIC, minimalism_score=0.5, languages=("hi",))
+        cached_key = engine._get_cache_key("Gaya!", "hi_male", EventType.WICKET, persona.name, "svara", "hi")
+        engine._cache_audio(cached_key, b"cached")
+
+        with patch.object(SvaraTTSProvider, "__init__", side_effect=AssertionError("provider constructed")):
+            segment = engine.synthesize_commentary(Commentary(text="Gaya!", event=event, persona=persona), persona)
+
+        assert segment.audio_bytes == b"cached"
+        assert segment.cache_key == cached_key
+
+    def test_batch_uses_provider_batch_endpoint(self, tmp_path: Path) -> None:
+        """Uncached commentaries should go to a batching provider in one call."""
+        events = _over_events((EventType.WICKET, EventType.BOUNDARY_SIX, EventType.DOT_BALL))
+        engine = TTSEngine(TTSConfig(cache_dir=str(tmp_path)))
+        persona = Persona(name="Sushil Doshi", style=CommentaryStyle.DRAMATIC, minimalism_score=0.5, languages=("hi",))
+        commentaries = [Commentary(text=f"clip {i}", event=e, persona=persona) for i, e in enumerate(events)]
+        cached_key = engine._get_cache_key("clip 1", "hi_male", EventType.BOUNDARY_SIX, persona.name, "svara", "hi")
+        engine._cache_audio(cached_key, b"cached")
+
+        def fake_batch(items: list[tuple[str, str, str]], ssml: bool, audio_format: AudioFormat) -> list[TTSResult]:
+            return [TTSResult(text.encode(), audio_format, sample_rate=24000) for text, _, _ in items]
+
+        with (
+            patch.object(SvaraTTSProvider, "supports_batch", True),
+            patch.object(SvaraTTSProvider, "synthesize_batch", side_effect=fake_batch) as mock_batch,
+        ):
+            segments = engine.synthesize_batch(commentaries, persona)
+
+        mock_batch.assert_called_once()
+        assert [s.text for s in segments] == ["clip 0", "clip 1", "clip 2"]
+        assert segments[1].audio_bytes == b"cached"
+        assert segments[0].audio_bytes.endswith(b"clip 0")
+        assert segments[0].audio_bytes.startswith(b"<")
+
+    def test_batch_endpoint_failure_uses_provider_chain(self, tmp_path: Path) -> None:
+        """A missing batch endpoint should fall back to per-commentary synthesis with fallbacks."""
+        config = TTSConfig(cache_dir=str(tmp_path), language_providers={"hi": ["svara", "elevenlabs"]})
+        engine = TTSEngine(config)
+        persona = Persona(name="Sushil Doshi", style=CommentaryStyle.DRAMATIC, minimalism_score=0.5, languages=("hi",))
+        events = _over_events((EventType.SINGLE, EventType.DOT_BALL))
+        commentaries = [Commentary(text=f"ball {i}", event=e, persona=persona) for i, e in enumerate(events)]
+
+        def elevenlabs_audio(text: str, **kwargs: object) -> TTSResult:
+            return TTSResult(text.encode(), AudioFormat.MP3, sample_rate=24000)
+
+        with (
+            patch.object(SvaraTTSProvider, "synthesize_batch", side_effect=TTSError("HTTP 404")),
+            patch.object(SvaraTTSProvider, "synthesize", side_effect=TTSError("down")),
+            patch.object(ElevenLabsTTSProvider, "supports_language", return_value=True),
+            patch.object(ElevenLabsTTSProvider, "synthesize", side_effect=elevenlabs_audio),
+        ):
+            segments = engine.synthesize_batch(commentaries, persona)
+
+        assert [s.audio_bytes for s in segments] == [b"ball 0", b"ball 1"]
+
+    def test_batch_overlaps_requests_with_workers(self, tmp_path: Path) -> None:
+        """With synthesis_workers, per-commentary requests should be in flight together."""
+        config = TTSConfig(cache_dir=str(tmp_path), language_providers={"en": ["qwen3"]}, synthesis_workers=3)
+        engine = TTSEngine(config)
+        events = _over_events((EventType.SINGLE, EventType.DOT_BALL, EventType.BOUNDARY_FOUR))
+        commentaries = [Commentary(text=f"ball {i}", event=e, persona=BENAUD) for i, e in enumerate(events)]
+        all_in_flight = threading.Barrier(3, timeout=5)
+
+        def fake_synthesize(text: str, **kwargs: object) -> TTSResult:
+            all_in_flight.wait()  # Raises BrokenBarrierError if calls run one at a time
+            return TTSResult(text.encode(), AudioFormat.MP3, sample_rate=24000)
+
+        with patch.object(Qwen3TTSProvider, "synthesize", side_effect=fake_synthesize):
+            segments = engine.synthesize_batch(commentaries, BENAUD, use_ssml=False)
+
+        assert [s.audio_bytes for s in segments] == [b"ball 0", b"ball 1", b"ball 2"]
+
+    def test_fallback_audio_is_not_cached_as_primary(self, tmp_path: Path) -> None:
+        """Audio from a fallback provider should not be served later as the primary's."""
+        config = TTSConfig(cache_dir=str(tmp_path), language_providers={"en": ["qwen3", "svara"]})
+        engine = TTSEngine(config)
+        commentary = Commentary(text="Gone.", event=_over_events((EventType.WICKET,))[0], persona=BENAUD)
+
+        def svara_audio(text: str, **kwargs: object) -> TTSResult:
+            return TTSResult(b"svara", AudioFormat.MP3, sample_rate=24000)
+
+        def qwen3_audio(text: str, **kwargs: object) -> TTSResult:
+            return TTSResult(b"qwen3", AudioFormat.MP3, sample_rate=24000)
+
+        with (
+            patch.object(Qwen3TTSProvider, "synthesize", side_effect=TTSError("down")),
+            patch.object(SvaraTTSProvider, "synthesize", side_effect=svara_audio),
+        ):
+            assert engine.synthesize_commentary(commentary, BENAUD).audio_bytes == b"svara"
+
+        with patch.object(Qwen3TTSProvider, "synthesize", side_effect=qwen3_audio):
+            assert engine.synthesize_commentary(commentary, BENAUD).audio_bytes == b"qwen3"
+
 
 # ============================================================================
 # Voice Mapping Tests
@@ -385,6 +645,24 @@ class TestVoiceMapping:
         voice = AzureTTSProvider.get_voice_for_persona("Harsha Bhogle", "en")
         assert voice == "en-IN-PrabhatNeural"
 
+    @pytest.mark.parametrize(
+        ("persona_name", "expected"),
+        [
+            ("Richie Benaud", "benaud"),
+            ("HARSHA", "bhogle"),
+            ("Sushil Doshi", "doshi"),
+            ("Unknown Persona", None),
+        ],
+    )
+    def test_persona_voice_key(self, persona_name: str, expected: str | None) -> None:
+        """Persona keywords resolve case-insensitively to a voice key."""
+        assert persona_voice_key(persona_name) == expected
+
+    def test_google_doshi_english_uses_indian_english(self) -> None:
+        """Google keeps Doshi on the Indian English voice for English output."""
+        voice = GoogleTTSProvider.get_voice_for_persona("Sushil Doshi", "en")
+        assert voice == "en-IN-Wavenet-C"
+
 
 # ============================================================================
 # Provider Format Mapping Tests
@@ -406,6 +684,14 @@ class TestProviderFormatMapping:
         assert "pcm" in AzureTTSProvider.FORMAT_MAP[AudioFormat.WAV].lower()
         assert "opus" in AzureTTSProvider.FORMAT_MAP[AudioFormat.OGG].lower()
 
+    @pytest.mark.parametrize(
+        "provider_cls",
+        [GoogleTTSProvider, AzureTTSProvider, ElevenLabsTTSProvider, Qwen3TTSProvider],
+    )
+    def test_format_map_covers_every_format(self, provider_cls: type) -> None:
+        """Providers index FORMAT_MAP directly, so every AudioFormat needs an entry."""
+        assert set(provider_cls.FORMAT_MAP) == set(AudioFormat)
+
 
 # ============================================================================
 # ProsodyController Rate/Pitch Combination Tests
@@ -461,35 +747,28 @@ class TestProsodyCombination:
 class TestSSMLBuilding:
     """Tests for SSML construction."""
 
-    def test_ssml_structure(self) -> None:
+    def test_ssml_structure(self, verbose_persona: Persona) -> None:
         """SSML should have proper structure."""
-        controller = ProsodyController()
-        ssml = controller._build_ssml(
-            "Test text",
-            ProsodySettings(rate="fast", pitch="+5%", pause_before_ms=200),
-        )
+        ssml = generate_ssml("Test text", verbose_persona, EventType.BOUNDARY_SIX)
 
         assert ssml.startswith("<speak>")
         assert ssml.endswith("</speak>")
         assert "Test text" in ssml
-        assert '<break time="200ms"/>' in ssml
-        assert '<prosody rate="fast"' in ssml
+        assert ssml.index('<break time="200ms"/>') < ssml.index("Test text")
+        assert '<prosody rate="151%"' in ssml
+        assert 'volume="loud"' in ssml
 
-    def test_ssml_no_prosody_when_default(self) -> None:
-        """SSML should omit prosody tags when all values are default."""
-        controller = ProsodyController()
-        ssml = controller._build_ssml("Test", ProsodySettings())
+    def test_ssml_omits_unset_settings(self, verbose_persona: Persona) -> None:
+        """SSML should leave out pauses, volume and emphasis the event does not set."""
+        ssml = generate_ssml("Test", verbose_persona, EventType.SINGLE)
 
-        # Should not have prosody tag when all values are "medium"
-        assert "<prosody" not in ssml
+        assert "<break" not in ssml
+        assert "volume=" not in ssml
+        assert "<emphasis" not in ssml
 
     def test_ssml_with_emphasis(self) -> None:
         """SSML should include emphasis when specified."""
-        controller = ProsodyController()
-        ssml = controller._build_ssml(
-            "Gone!",
-            ProsodySettings(emphasis="strong"),
-        )
+        ssml = generate_ssml("Gone!", BENAUD, EventType.WICKET)
 
         assert '<emphasis level="strong">' in ssml
         assert "</emphasis>" in ssml
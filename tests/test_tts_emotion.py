@@ -8,6 +8,7 @@ from suksham_vachak.tts.emotion import (
     EMOTION_FEAR,
     EMOTION_HAPPY,
     EMOTION_SURPRISE,
+    _is_tense_chase_cached,
     get_emotion_tag,
     inject_emotion,
     is_tense_chase,
@@ -114,6 +115,13 @@ class TestIsTenseChase:
         # Overs remaining <= 0
         assert is_tense_chase(target=180, current_score=170, current_wickets=3, overs_completed=20.0) is True
 
+    def test_repeat_state_reuses_cached_result(self) -> None:
+        # 15.3 computed as a sum still quantizes to the same over.ball state
+        is_tense_chase(target=201, current_score=150, current_wickets=3, overs_completed=15.3)
+        hits = _is_tense_chase_cached.cache_info().hits
+        assert is_tense_chase(target=201, current_score=150, current_wickets=3, overs_completed=15.0 + 0.3) is True
+        assert _is_tense_chase_cached.cache_info().hits == hits + 1
+
 
 class TestInjectEmotion:
     """Tests for emotion tag injection."""
@@ -2,13 +2,31 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import json
+from collections.abc import Callable
 
 import httpx
 import pytest
 
 from suksham_vachak.tts.base import AudioFormat, TTSError
-from suksham_vachak.tts.qwen3 import Qwen3TTSProvider
+from suksham_vachak.tts.qwen3 import QWEN3_SAMPLE_RATE, Qwen3TTSProvider
+
+
+def _provider(
+    handler: Callable[[httpx.Request], httpx.Response], seen: list[httpx.Request] | None = None
+) -> Qwen3TTSProvider:
+    """Build a provider whose HTTP calls are answered in-process by `handler`."""
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        if seen is not None:
+            seen.append(request)
+        return handler(request)
+
+    return Qwen3TTSProvider(base_url="http://test:7860", transport=httpx.MockTransport(respond))
+
+
+def _refuse(request: httpx.Request) -> httpx.Response:
+    raise httpx.ConnectError("refused", request=request)
 
 
 class TestQwen3TTSProvider:
@@ -37,106 +55,80 @@ class TestQwen3TTSProvider:
         assert provider.supports_language("ta") is False
 
     def test_is_available_when_server_responds(self) -> None:
-        provider = Qwen3TTSProvider(base_url="http://test:7860")
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-
-        with patch.object(httpx.Client, "get", return_value=mock_response):
-            assert provider.is_available() is True
+        provider = _provider(lambda request: httpx.Response(200))
+        assert provider.is_available() is True
 
     def test_is_not_available_when_server_down(self) -> None:
-        provider = Qwen3TTSProvider(base_url="http://test:7860")
-
-        with patch.object(httpx.Client, "get", side_effect=httpx.ConnectError("refused")):
-            assert provider.is_available() is False
+        provider = _provider(_refuse)
+        assert provider.is_available() is False
 
     def test_synthesize_returns_audio(self) -> None:
-        provider = Qwen3TTSProvider(base_url="http://test:7860")
         fake_mp3 = b"\xff\xfb\x90\x00" + b"\x00" * 200
+        seen: list[httpx.Request] = []
+        response = httpx.Response(200, content=fake_mp3, headers={"x-sample-rate": "24000"})
+        provider = _provider(lambda request: response, seen)
+
+        result = provider.synthesize(
+            text="Gone! What a delivery!",
+            voice_id="Ryan",
+            language="en-AU",
+            audio_format=AudioFormat.MP3,
+        )
+
+        assert result.format == AudioFormat.MP3
+        assert result.audio_bytes == fake_mp3
+        assert result.sample_rate == 24000
+        assert result.voice_used == "Ryan"
+        assert result.duration_seconds > 0
 
-        mock_response = MagicMock()
-        mock_response.content = fake_mp3
-        mock_response.headers = {"x-sample-rate": "24000"}
-        mock_response.raise_for_status = MagicMock()
-
-        with patch.object(httpx.Client, "post", return_value=mock_response) as mock_post:
-            result = provider.synthesize(
-                text="Gone! What a delivery!",
-                voice_id="Ryan",
-                language="en-AU",
-                audio_format=AudioFormat.MP3,
-            )
-
-            assert result.format == AudioFormat.MP3
-            assert result.audio_bytes == fake_mp3
-            assert result.sample_rate == 24000
-            assert result.voice_used == "Ryan"
-            assert result.duration_seconds > 0
-
-            # Verify the payload sent to server
-            call_args = mock_post.call_args
-            payload = call_args.kwargs.get("json") or call_args[1].get("json")
-            assert payload["input"] == "Gone! What a delivery!"
-            assert payload["voice"] == "Ryan"
-            assert payload["response_format"] == "mp3"
+        # Verify the payload sent to server
+        assert seen[0].url.path == "/v1/audio/speech"
+        payload = json.loads(seen[0].content)
+        assert payload["input"] == "Gone! What a delivery!"
+        assert payload["voice"] == "Ryan"
+        assert payload["response_format"] == "mp3"
 
     def test_synthesize_wav_format(self) -> None:
-        provider = Qwen3TTSProvider(base_url="http://test:7860")
         fake_wav = b"RIFF" + b"\x00" * 200
+        provider = _provider(lambda request: httpx.Response(200, content=fake_wav))
 
-        mock_response = MagicMock()
-        mock_response.content = fake_wav
-        mock_response.headers = {}
-        mock_response.raise_for_status = MagicMock()
-
-        with patch.object(httpx.Client, "post", return_value=mock_response):
-            result = provider.synthesize(
-                text="Four!",
-                voice_id="Aiden",
-                language="en",
-                audio_format=AudioFormat.WAV,
-            )
-            assert result.format == AudioFormat.WAV
+        result = provider.synthesize(
+            text="Four!",
+            voice_id="Aiden",
+            language="en",
+            audio_format=AudioFormat.WAV,
+        )
+        assert result.format == AudioFormat.WAV
+        assert result.sample_rate == QWEN3_SAMPLE_RATE  # No x-sample-rate header sent
 
     def test_synthesize_http_error_raises(self) -> None:
-        provider = Qwen3TTSProvider(base_url="http://test:7860")
-
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        mock_response.text = "Internal Server Error"
-        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "500", request=MagicMock(), response=mock_response
-        )
+        provider = _provider(lambda request: httpx.Response(500, text="Internal Server Error"))
 
-        with (
-            patch.object(httpx.Client, "post", return_value=mock_response),
-            pytest.raises(TTSError, match="Qwen3-TTS synthesis failed"),
-        ):
+        with pytest.raises(TTSError, match="Qwen3-TTS synthesis failed"):
             provider.synthesize(text="test", voice_id="Ryan", language="en")
 
     def test_synthesize_connection_error_raises(self) -> None:
-        provider = Qwen3TTSProvider(base_url="http://test:7860")
+        provider = _provider(_refuse)
 
-        with (
-            patch.object(httpx.Client, "post", side_effect=httpx.ConnectError("refused")),
-            pytest.raises(TTSError, match="Qwen3-TTS server unreachable"),
-        ):
+        with pytest.raises(TTSError, match="Qwen3-TTS server unreachable"):
             provider.synthesize(text="test", voice_id="Ryan", language="en")
 
     def test_synthesize_empty_response_raises(self) -> None:
-        provider = Qwen3TTSProvider(base_url="http://test:7860")
-
-        mock_response = MagicMock()
-        mock_response.content = b""
-        mock_response.headers = {}
-        mock_response.raise_for_status = MagicMock()
+        provider = _provider(lambda request: httpx.Response(200, content=b""))
 
-        with (
-            patch.object(httpx.Client, "post", return_value=mock_response),
-            pytest.raises(TTSError, match="empty audio"),
-        ):
+        with pytest.raises(TTSError, match="empty audio"):
             provider.synthesize(text="test", voice_id="Ryan", language="en")
 
+    def test_client_is_reused_until_closed(self) -> None:
+        provider = Qwen3TTSProvider(base_url="http://test:7860")
+        client = provider._client
+        assert provider._client is client
+
+        provider.close()
+        assert client.is_closed
+        assert provider._client is not client
+        provider.close()
+
 
 class TestQwen3VoiceMapping:
     """Tests for Qwen3 voice selection."""
@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import base64
+import io
+import json
+import wave
+from collections.abc import Callable, Iterator
 from unittest.mock import MagicMock, patch
 
 import httpx
@@ -11,11 +16,29 @@ from suksham_vachak.tts.base import AudioFormat, TTSError
 from suksham_vachak.tts.svara import (
     SVARA_SAMPLE_RATE,
     SvaraTTSProvider,
+    _encode_mp3_in_process,
     pcm_to_mp3,
     pcm_to_wav,
 )
 
 
+def _provider(
+    handler: Callable[[httpx.Request], httpx.Response], seen: list[httpx.Request] | None = None
+) -> SvaraTTSProvider:
+    """Build a provider whose HTTP calls are answered in-process by `handler`."""
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        if seen is not None:
+            seen.append(request)
+        return handler(request)
+
+    return SvaraTTSProvider(base_url="http://test:8080", transport=httpx.MockTransport(respond))
+
+
+def _refuse(request: httpx.Request) -> httpx.Response:
+    raise httpx.ConnectError("refused", request=request)
+
+
 def _make_pcm(num_samples: int = 2400, sample_rate: int = SVARA_SAMPLE_RATE) -> bytes:
     """Generate dummy 16-bit mono PCM data (silence)."""
     return b"\x00\x00" * num_samples
@@ -41,15 +64,32 @@ class TestPcmToWav:
         # Should still produce a valid WAV header
         assert wav[:4] == b"RIFF"
 
+    @pytest.mark.parametrize("sample_rate", [SVARA_SAMPLE_RATE, 16000])
+    def test_wav_round_trips_through_wave(self, sample_rate: int) -> None:
+        pcm = bytes(range(256)) * 10
+        with wave.open(io.BytesIO(pcm_to_wav(pcm, sample_rate))) as wf:
+            assert wf.getframerate() == sample_rate
+            assert wf.getnchannels() == 1
+            assert wf.getsampwidth() == 2
+            assert wf.readframes(wf.getnframes()) == pcm
+
 
 class TestPcmToMp3:
     """Tests for PCM → MP3 conversion."""
 
+    @pytest.fixture
+    def ffmpeg_only(self) -> Iterator[None]:
+        """Route pcm_to_mp3 to the ffmpeg CLI even when PyAV is installed."""
+        with patch("suksham_vachak.tts.svara._encode_mp3_in_process", return_value=None):
+            yield
+
+    @pytest.mark.usefixtures("ffmpeg_only")
     def test_returns_none_when_ffmpeg_missing(self) -> None:
         with patch("suksham_vachak.tts.svara.subprocess.run", side_effect=FileNotFoundError):
             result = pcm_to_mp3(_make_pcm())
             assert result is None
 
+    @pytest.mark.usefixtures("ffmpeg_only")
     def test_returns_mp3_bytes_on_success(self) -> None:
         fake_mp3 = b"\xff\xfb\x90\x00" + b"\x00" * 100  # Fake MP3 frame header
         mock_result = MagicMock()
@@ -60,6 +100,35 @@ class TestPcmToMp3:
             result = pcm_to_mp3(_make_pcm())
             assert result == fake_mp3
 
+    def test_in_process_encoder_skips_subprocess(self) -> None:
+        fake_mp3 = b"\xff\xfb\x90\x00"
+        with (
+            patch("suksham_vachak.tts.svara._encode_mp3_in_process", return_value=fake_mp3),
+            patch("suksham_vachak.tts.svara.subprocess.run") as mock_run,
+        ):
+            assert pcm_to_mp3(_make_pcm()) == fake_mp3
+            mock_run.assert_not_called()
+
+    def test_in_process_encoder_round_trips(self) -> None:
+        av = pytest.importorskip("av")
+        pcm = _make_pcm(SVARA_SAMPLE_RATE)  # One second
+
+        mp3 = _encode_mp3_in_process(pcm, SVARA_SAMPLE_RATE)
+
+        assert mp3 is not None
+        with av.open(io.BytesIO(mp3)) as container:
+            stream = container.streams.audio[0]
+            assert container.format.name == "mp3"
+            assert stream.rate == SVARA_SAMPLE_RATE
+            decoded = sum(frame.samples for frame in container.decode(stream))
+        assert decoded >= SVARA_SAMPLE_RATE
+
+    def test_partial_sample_falls_back_without_raising(self) -> None:
+        assert _encode_mp3_in_process(b"\x01", SVARA_SAMPLE_RATE) is None
+        with patch("suksham_vachak.tts.svara.subprocess.run", side_effect=FileNotFoundError):
+            assert pcm_to_mp3(b"\x01") is None
+
+    @pytest.mark.usefixtures("ffmpeg_only")
     def test_returns_none_on_ffmpeg_failure(self) -> None:
         mock_result = MagicMock()
         mock_result.returncode = 1
@@ -99,114 +168,144 @@ class TestSvaraTTSProvider:
         assert provider.supports_language("fr") is False
 
     def test_is_available_when_server_responds(self) -> None:
-        provider = SvaraTTSProvider(base_url="http://test:8080")
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-
-        with patch.object(httpx.Client, "get", return_value=mock_response):
-            assert provider.is_available() is True
+        provider = _provider(lambda request: httpx.Response(200))
+        assert provider.is_available() is True
 
     def test_is_not_available_when_server_down(self) -> None:
-        provider = SvaraTTSProvider(base_url="http://test:8080")
+        provider = _provider(_refuse)
+        assert provider.is_available() is False
+
+    def test_is_available_cached_within_ttl(self) -> None:
+        seen: list[httpx.Request] = []
+        provider = _provider(lambda request: httpx.Response(200), seen)
 
-        with patch.object(httpx.Client, "get", side_effect=httpx.ConnectError("refused")):
-            assert provider.is_available() is False
+        assert provider.is_available() is True
+        assert provider.is_available() is True
+        assert len(seen) == 1
+
+    def test_is_available_reprobes_after_ttl(self) -> None:
+        seen: list[httpx.Request] = []
+        provider = _provider(lambda request: httpx.Response(200), seen)
+
+        with patch("suksham_vachak.tts.svara.time.monotonic", side_effect=[100.0, 200.0]):
+            provider.is_available()
+            provider.is_available()
+        assert len(seen) == 2
 
     def test_synthesize_returns_wav_when_no_ffmpeg(self) -> None:
-        provider = SvaraTTSProvider(base_url="http://test:8080")
         pcm_data = _make_pcm(2400)
+        provider = _provider(lambda request: httpx.Response(200, content=pcm_data, headers={"x-sample-rate": "24000"}))
 
-        mock_response = MagicMock()
-        mock_response.content = pcm_data
-        mock_response.headers = {"x-sample-rate": "24000"}
-        mock_response.raise_for_status = MagicMock()
-
-        with (
-            patch.object(httpx.Client, "post", return_value=mock_response),
-            patch("suksham_vachak.tts.svara.pcm_to_mp3", return_value=None),
-        ):
+        with patch("suksham_vachak.tts.svara.pcm_to_mp3", return_value=None):
             result = provider.synthesize(
                 text="शानदार!", voice_id="hi_male", language="hi-IN", audio_format=AudioFormat.MP3
             )
-            # Falls back to WAV when ffmpeg unavailable
-            assert result.format == AudioFormat.WAV
-            assert result.audio_bytes[:4] == b"RIFF"
-            assert result.sample_rate == 24000
-            assert result.duration_seconds > 0
+        # Falls back to WAV when ffmpeg unavailable
+        assert result.format == AudioFormat.WAV
+        assert result.audio_bytes[:4] == b"RIFF"
+        assert result.sample_rate == 24000
+        assert result.duration_seconds > 0
 
     def test_synthesize_returns_mp3_when_ffmpeg_available(self) -> None:
-        provider = SvaraTTSProvider(base_url="http://test:8080")
         pcm_data = _make_pcm(2400)
         fake_mp3 = b"\xff\xfb" + b"\x00" * 100
+        provider = _provider(lambda request: httpx.Response(200, content=pcm_data, headers={"x-sample-rate": "24000"}))
 
-        mock_response = MagicMock()
-        mock_response.content = pcm_data
-        mock_response.headers = {"x-sample-rate": "24000"}
-        mock_response.raise_for_status = MagicMock()
-
-        with (
-            patch.object(httpx.Client, "post", return_value=mock_response),
-            patch("suksham_vachak.tts.svara.pcm_to_mp3", return_value=fake_mp3),
-        ):
+        with patch("suksham_vachak.tts.svara.pcm_to_mp3", return_value=fake_mp3):
             result = provider.synthesize(
                 text="शानदार!", voice_id="hi_male", language="hi-IN", audio_format=AudioFormat.MP3
             )
-            assert result.format == AudioFormat.MP3
-            assert result.audio_bytes == fake_mp3
+        assert result.format == AudioFormat.MP3
+        assert result.audio_bytes == fake_mp3
 
-    def test_synthesize_wav_format(self) -> None:
-        provider = SvaraTTSProvider(base_url="http://test:8080")
-        pcm_data = _make_pcm(2400)
+    def test_synthesize_native_mp3_skips_transcoding(self) -> None:
+        fake_mp3 = b"\xff\xfb" + b"\x00" * 100
+        seen: list[httpx.Request] = []
+        response = httpx.Response(200, content=fake_mp3, headers={"content-type": "audio/mpeg"})
+        provider = _provider(lambda request: response, seen)
 
-        mock_response = MagicMock()
-        mock_response.content = pcm_data
-        mock_response.headers = {}
-        mock_response.raise_for_status = MagicMock()
+        with patch("suksham_vachak.tts.svara.pcm_to_mp3") as mock_mp3:
+            result = provider.synthesize(text="Four runs!", voice_id="en_male", language="en")
 
-        with patch.object(httpx.Client, "post", return_value=mock_response):
-            result = provider.synthesize(text="Test", voice_id="en_male", language="en", audio_format=AudioFormat.WAV)
-            assert result.format == AudioFormat.WAV
+        mock_mp3.assert_not_called()
+        assert json.loads(seen[0].content)["response_format"] == "mp3"
+        assert result.format == AudioFormat.MP3
+        assert result.audio_bytes == fake_mp3
+        assert result.duration_seconds > 0
 
-    def test_synthesize_http_error_raises(self) -> None:
-        provider = SvaraTTSProvider(base_url="http://test:8080")
+    def test_synthesize_wav_format(self) -> None:
+        provider = _provider(lambda request: httpx.Response(200, content=_make_pcm(2400)))
 
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        mock_response.text = "Internal Server Error"
-        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "500", request=MagicMock(), response=mock_response
-        )
+        result = provider.synthesize(text="Test", voice_id="en_male", language="en", audio_format=AudioFormat.WAV)
+        assert result.format == AudioFormat.WAV
 
-        with (
-            patch.object(httpx.Client, "post", return_value=mock_response),
-            pytest.raises(TTSError, match="Svara synthesis failed"),
-        ):
+    def test_synthesize_http_error_raises(self) -> None:
+        provider = _provider(lambda request: httpx.Response(500, text="Internal Server Error"))
+
+        with pytest.raises(TTSError, match="Svara synthesis failed"):
             provider.synthesize(text="test", voice_id="hi_male", language="hi")
 
     def test_synthesize_connection_error_raises(self) -> None:
-        provider = SvaraTTSProvider(base_url="http://test:8080")
+        provider = _provider(_refuse)
 
-        with (
-            patch.object(httpx.Client, "post", side_effect=httpx.ConnectError("refused")),
-            pytest.raises(TTSError, match="Svara server unreachable"),
-        ):
+        with pytest.raises(TTSError, match="Svara server unreachable"):
             provider.synthesize(text="test", voice_id="hi_male", language="hi")
 
     def test_synthesize_empty_response_raises(self) -> None:
-        provider = SvaraTTSProvider(base_url="http://test:8080")
+        provider = _provider(lambda request: httpx.Response(200, content=b""))
 
-        mock_response = MagicMock()
-        mock_response.content = b""
-        mock_response.headers = {}
-        mock_response.raise_for_status = MagicMock()
-
-        with (
-            patch.object(httpx.Client, "post", return_value=mock_response),
-            pytest.raises(TTSError, match="empty audio"),
-        ):
+        with pytest.raises(TTSError, match="empty audio"):
             provider.synthesize(text="test", voice_id="hi_male", language="hi")
 
 
+class TestSvaraBatchSynthesis:
+    """Tests for SvaraTTSProvider.synthesize_batch."""
+
+    def test_batch_single_request(self) -> None:
+        clips = [_make_pcm(2400), _make_pcm(4800)]
+        body = [base64.b64encode(c).decode() for c in clips]
+        seen: list[httpx.Request] = []
+        provider = _provider(lambda request: httpx.Response(200, json=body, headers={"x-sample-rate": "24000"}), seen)
+
+        results = provider.synthesize_batch(
+            [("Four!", "en_male", "en"), ("शानदार!", "hi_male", "hi-IN")],
+            audio_format=AudioFormat.WAV,
+        )
+
+        assert [r.url.path for r in seen] == ["/synthesize_batch"]
+        assert json.loads(seen[0].content)["items"][1]["language"] == "hi"
+        assert [r.voice_used for r in results] == ["en_male", "hi_male"]
+        assert results[1].duration_seconds == pytest.approx(2 * results[0].duration_seconds)
+
+    def test_batch_falls_back_on_404(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/synthesize_batch":
+                return httpx.Response(404)
+            return httpx.Response(200, content=_make_pcm(2400))
+
+        seen: list[httpx.Request] = []
+        provider = _provider(handler, seen)
+        items = [("One", "en_male", "en"), ("Two", "en_male", "en")]
+        assert provider.supports_batch is True
+
+        results = provider.synthesize_batch(items, audio_format=AudioFormat.WAV)
+
+        assert len(results) == 2
+        assert provider.supports_batch is False
+        assert [r.url.path for r in seen] == ["/synthesize_batch", "/synthesize", "/synthesize"]
+
+        # The missing endpoint is remembered
+        provider.synthesize_batch(items, audio_format=AudioFormat.WAV)
+        assert "/synthesize_batch" not in [r.url.path for r in seen[3:]]
+
+    def test_batch_mismatched_clip_count_raises(self) -> None:
+        body = [base64.b64encode(_make_pcm()).decode()]
+        provider = _provider(lambda request: httpx.Response(200, json=body))
+
+        with pytest.raises(TTSError, match="1 clips for 2"):
+            provider.synthesize_batch([("a", "en_male", "en"), ("b", "en_male", "en")])
+
+
 class TestSvaraVoiceMapping:
     """Tests for Svara voice selection."""
 
@@ -233,3 +332,11 @@ class TestSvaraVoiceMapping:
         voices = provider.get_available_voices()
         # 19 languages x 2 genders
         assert len(voices) == 38
+
+    def test_get_available_voices_reuses_entries(self) -> None:
+        provider = SvaraTTSProvider()
+        first = provider.get_available_voices(language="ta-IN")
+        second = provider.get_available_voices(language="ta")
+        assert first == second
+        assert all(a is b for a, b in zip(first, second, strict=True))
+        assert first is not second